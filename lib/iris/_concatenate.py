@@ -23,6 +23,7 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
+import bisect
 from collections import defaultdict, namedtuple
 from copy import deepcopy
 
@@ -256,6 +257,9 @@ def concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
 
     """
     proto_cubes_by_name = defaultdict(list)
+    # The proto-cubes are also bucketed by the key of their cube signature,
+    # as a cube can only be registered with a proto-cube of the same key.
+    proto_cubes_by_key = defaultdict(list)
     # Initialise the nominated axis (dimension) of concatenation
     # which requires to be negotiated.
     axis = None
@@ -263,20 +267,29 @@ def concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
     # Register each cube with its appropriate proto-cube.
     for cube in cubes:
         name = cube.standard_name or cube.long_name
-        proto_cubes = proto_cubes_by_name[name]
+        cube_signature = _CubeSignature(cube)
+        key = (name, cube_signature.key())
+        proto_cubes = proto_cubes_by_key[key]
+        if not proto_cubes and error_on_mismatch:
+            # Attempt to register the cube with the proto-cubes of the
+            # same name, which will fail informatively.
+            proto_cubes = proto_cubes_by_name[name]
         registered = False
 
         # Register cube with an existing proto-cube.
         for proto_cube in proto_cubes:
             registered = proto_cube.register(cube, axis, error_on_mismatch,
-                                             check_aux_coords)
+                                             check_aux_coords,
+                                             cube_signature=cube_signature)
             if registered:
                 axis = proto_cube.axis
                 break
 
         # Create a new proto-cube for an unregistered cube.
         if not registered:
-            proto_cubes.append(_ProtoCube(cube))
+            proto_cube = _ProtoCube(cube)
+            proto_cubes_by_name[name].append(proto_cube)
+            proto_cubes_by_key[key].append(proto_cube)
 
     # Construct a concatenated cube from each of the proto-cubes.
     concatenated_cubes = iris.cube.CubeList()
@@ -290,10 +303,14 @@ def concatenate(cubes, error_on_mismatch=False, check_aux_coords=True):
             # Construct the concatenated cube.
             concatenated_cubes.append(proto_cube.concatenate())
 
-    # Perform concatenation until we've reached an equilibrium.
+    # Perform concatenation until we've reached an equilibrium.  Each pass
+    # concatenates along a single axis, so cubes tiled along several axes
+    # need further passes.
     count = len(concatenated_cubes)
     if count != 1 and count != len(cubes):
-        concatenated_cubes = concatenate(concatenated_cubes)
+        concatenated_cubes = concatenate(concatenated_cubes,
+                                         error_on_mismatch,
+                                         check_aux_coords)
 
     return concatenated_cubes
 
@@ -362,6 +379,21 @@ class _CubeSignature(object):
             else:
                 self.scalar_coords.append(coord)
 
+    def key(self):
+        """
+        Return a hashable summary of this _CubeSignature, which is equal for
+        any two _CubeSignatures which match.
+
+        """
+        def coords_key(metadata):
+            return tuple((item.name(), item.dims, item.points_dtype,
+                          item.bounds_dtype) for item in metadata)
+
+        return (self.defn.name(), self.ndim, self.data_type,
+                coords_key(self.dim_metadata),
+                coords_key(self.aux_metadata),
+                tuple(coord.name() for coord in self.scalar_coords))
+
     def _coordinate_differences(self, other, attr):
         """
         Determine the names of the coordinates that differ between `self` and
@@ -626,6 +658,9 @@ class _ProtoCube(object):
 
         # The list of source-cubes relevant to this proto-cube.
         self._skeletons = []
+        # The sorted extents of the source-cubes, by dimension coordinate
+        # index, for each dimension that has been sequenced.
+        self._sorted_extents = {}
         self._add_skeleton(self._coord_signature, cube.lazy_data())
 
         # The nominated axis of concatenation.
@@ -683,7 +718,7 @@ class _ProtoCube(object):
         return cube
 
     def register(self, cube, axis=None, error_on_mismatch=False,
-                 check_aux_coords=False):
+                 check_aux_coords=False, cube_signature=None):
         """
         Determine whether the given source-cube is suitable for concatenation
         with this :class:`_ProtoCube`.
@@ -703,6 +738,10 @@ class _ProtoCube(object):
         * error_on_mismatch:
             If True, raise an informative error if registration fails.
 
+        * cube_signature:
+            The :class:`_CubeSignature` of the source-cube, if it is
+            already known.
+
         Returns:
             Boolean.
 
@@ -714,7 +753,8 @@ class _ProtoCube(object):
             raise ValueError(msg)
 
         # Check for compatible cube signatures.
-        cube_signature = _CubeSignature(cube)
+        if cube_signature is None:
+            cube_signature = _CubeSignature(cube)
         match = self._cube_signature.match(cube_signature, error_on_mismatch)
 
         # Check for compatible coordinate signatures.
@@ -781,6 +821,8 @@ class _ProtoCube(object):
         """
         skeleton = _SkeletonCube(coord_signature, data)
         self._skeletons.append(skeleton)
+        for dim_ind, dim_extents in six.iteritems(self._sorted_extents):
+            bisect.insort(dim_extents, coord_signature.dim_extents[dim_ind])
 
     def _build_aux_coordinates(self):
         """
@@ -918,51 +960,40 @@ class _ProtoCube(object):
             Boolean.
 
         """
-        result = True
-
-        # Add the new extent to the current extents collection.
+        # The extents of the registered source-cubes are known not to
+        # overlap, so only the neighbours of the new extent in sorted
+        # order need to be checked.  The neighbours are the same whether
+        # the dimension order is increasing or decreasing.
         dim_ind = self._coord_signature.dim_mapping.index(axis)
-        dim_extents = [skeleton.signature.dim_extents[dim_ind]
-                       for skeleton in self._skeletons]
-        dim_extents.append(extent)
-
-        # Sort into the appropriate dimension order.
-        order = self._coord_signature.dim_order[dim_ind]
-        dim_extents.sort(reverse=(order == _DECREASING))
-
-        # Ensure that the extents don't overlap.
-        if len(dim_extents) > 1:
-            for i, extent in enumerate(dim_extents[1:]):
-                # Check the points - must be strictly monotonic.
-                if order == _DECREASING:
-                    big = dim_extents[i].points.min
-                    small = extent.points.max
-                else:
-                    small = dim_extents[i].points.max
-                    big = extent.points.min
-
-                if small >= big:
-                    result = False
-                    break
-
-                # Check the bounds - must be strictly monotonic.
-                if extent.bounds is not None:
-                    if order == _DECREASING:
-                        big_0 = dim_extents[i].bounds[0].min
-                        big_1 = dim_extents[i].bounds[1].min
-                        small_0 = extent.bounds[0].max
-                        small_1 = extent.bounds[1].max
-                    else:
-                        small_0 = dim_extents[i].bounds[0].max
-                        small_1 = dim_extents[i].bounds[1].max
-                        big_0 = extent.bounds[0].min
-                        big_1 = extent.bounds[1].min
-
-                    lower_bound_fail = small_0 >= big_0
-                    upper_bound_fail = small_1 >= big_1
-
-                    if lower_bound_fail or upper_bound_fail:
-                        result = False
-                        break
+        dim_extents = self._sorted_extents.get(dim_ind)
+        if dim_extents is None:
+            dim_extents = sorted(skeleton.signature.dim_extents[dim_ind]
+                                 for skeleton in self._skeletons)
+            self._sorted_extents[dim_ind] = dim_extents
+
+        index = bisect.bisect_right(dim_extents, extent)
+        result = True
+        if index > 0:
+            result = not _overlap(dim_extents[index - 1], extent)
+        if result and index < len(dim_extents):
+            result = not _overlap(extent, dim_extents[index])
 
         return result
+
+
+def _overlap(lower, upper):
+    """
+    Determine whether two :class:`_CoordExtent` instances overlap, given
+    that `lower` sorts before `upper`.
+
+    """
+    # Check the points - must be strictly monotonic.
+    result = lower.points.max >= upper.points.min
+
+    # Check the bounds - must be strictly monotonic.
+    if not result and upper.bounds is not None:
+        lower_bound_fail = lower.bounds[0].max >= upper.bounds[0].min
+        upper_bound_fail = lower.bounds[1].max >= upper.bounds[1].min
+        result = lower_bound_fail or upper_bound_fail
+
+    return result
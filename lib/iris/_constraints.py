@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2010 - 2017, Met Office
+# (C) British Crown Copyright 2010 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -30,6 +30,8 @@ import numpy as np
 
 import iris.coords
 import iris.exceptions
+import iris.time
+import iris.util
 
 
 class Constraint(object):
@@ -149,19 +151,9 @@ class Constraint(object):
 
         """
         resultant_CIM = self._CIM_extract(cube)
-        slice_tuple = resultant_CIM.as_slice()
-        result = None
-        if slice_tuple is not None:
-            # Slicing the cube is an expensive operation.
-            if all([item == slice(None) for item in slice_tuple]):
-                # Don't perform a full slice, just return the cube.
-                result = cube
-            else:
-                # Performing the partial slice.
-                result = cube[slice_tuple]
-        return result
+        return _slice_cube(cube, resultant_CIM.as_slice())
 
-    def _CIM_extract(self, cube):
+    def _CIM_extract(self, cube, cache=None):
         # Returns _ColumnIndexManager
 
         # Cater for scalar cubes by setting the dimensionality to 1
@@ -172,7 +164,8 @@ class Constraint(object):
             resultant_CIM.all_false()
         else:
             for coord_constraint in self._coord_constraints:
-                resultant_CIM = resultant_CIM & coord_constraint.extract(cube)
+                resultant_CIM = (resultant_CIM &
+                                 coord_constraint.extract(cube, cache))
 
         return resultant_CIM
 
@@ -209,9 +202,9 @@ class ConstraintCombination(Constraint):
         return 'ConstraintCombination(%r, %r, %r)' % (self.lhs, self.rhs,
                                                       self.operator)
 
-    def _CIM_extract(self, cube):
-        return self.operator(self.lhs._CIM_extract(cube),
-                             self.rhs._CIM_extract(cube))
+    def _CIM_extract(self, cube, cache=None):
+        return self.operator(self.lhs._CIM_extract(cube, cache),
+                             self.rhs._CIM_extract(cube, cache))
 
 
 class _CoordConstraint(object):
@@ -236,26 +229,42 @@ class _CoordConstraint(object):
         return '_CoordConstraint(%r, %r)' % (self.coord_name,
                                              self._coord_thing)
 
-    def extract(self, cube):
+    def extract(self, cube, cache=None):
         """
         Returns the the column based indices of the given cube which
         match the constraint.
 
+        If given, the :class:`_ExtractionCache` of the cube is used to share
+        the result, and the coordinate lookups, with other constraints.
+
         """
+        if cache is None:
+            cache = _ExtractionCache(cube)
+        key = (self.coord_name, self._coord_thing)
+        try:
+            hash(key)
+        except TypeError:
+            key = (self.coord_name, None, id(self._coord_thing))
+        cube_cim = cache.results.get(key)
+        if cube_cim is None:
+            cube_cim = self._extract(cube, cache)
+            cache.results[key] = cube_cim
+        return cube_cim
+
+    def _extract(self, cube, cache):
         # Cater for scalar cubes by setting the dimensionality to 1
         # when cube.ndim is 0.
         cube_cim = _ColumnIndexManager(cube.ndim or 1)
-        try:
-            coord = cube.coord(self.coord_name)
-        except iris.exceptions.CoordinateNotFoundError:
+        coord, dims = cache.coord_and_dims(self.coord_name)
+        if coord is None:
             cube_cim.all_false()
             return cube_cim
-        dims = cube.coord_dims(coord)
         if len(dims) > 1:
             msg = 'Cannot apply constraints to multidimensional coordinates'
             raise iris.exceptions.CoordinateMultiDimError(msg)
 
         try_quick = False
+        desired_values = None
         if callable(self._coord_thing):
             call_func = self._coord_thing
         elif (isinstance(self._coord_thing, collections.Iterable) and
@@ -287,13 +296,203 @@ class _CoordConstraint(object):
             if coord.cell(i) == self._coord_thing:
                 r[i] = True
         else:
-            r = np.array([call_func(cell) for cell in coord.cells()])
+            r = self._vectorised_extract(coord, cache.cells(coord),
+                                         desired_values)
+            if r is None:
+                r = np.array([call_func(cell) for cell in coord.cells()])
         if dims:
             cube_cim[dims[0]] = r
         elif not all(r):
             cube_cim.all_false()
         return cube_cim
 
+    def _vectorised_extract(self, coord, cells=None, desired_values=None):
+        """
+        Evaluate the constraint against all the cells of the given 1d
+        coordinate at once, using array operations.
+
+        Only values, lists of values and :func:`iris.util.between` ranges
+        of numbers, strings or :class:`iris.time.PartialDateTime` instances
+        are evaluated in this way.  Returns a boolean array of matches, or
+        None if the constraint must be evaluated one cell at a time.
+
+        If given, `desired_values` is the list of the values of an iterable
+        constraint, which may only be iterated once.
+
+        """
+        thing = self._coord_thing
+        if cells is None:
+            cells = _VectorisedCells(coord)
+        try:
+            if isinstance(thing, iris.util._Between):
+                if thing.lh_inclusive:
+                    lower = cells >= thing.lh
+                else:
+                    lower = cells > thing.lh
+                if thing.rh_inclusive:
+                    upper = cells <= thing.rh
+                else:
+                    upper = cells < thing.rh
+                result = lower & upper
+            elif callable(thing):
+                # Arbitrary functions are only ever called with real cells.
+                result = None
+            elif (isinstance(thing, collections.Iterable) and
+                    not isinstance(thing, (six.string_types,
+                                           iris.coords.Cell))):
+                if desired_values is None:
+                    desired_values = list(thing)
+                result = np.zeros(coord.shape, dtype=bool)
+                for value in desired_values:
+                    result |= cells == value
+            else:
+                result = cells == thing
+        except TypeError:
+            # The values cannot be compared with array operations.
+            result = None
+        return result
+
+
+class _VectorisedCells(object):
+    """
+    Stands in for all of the :class:`iris.coords.Cell` instances of a 1d
+    coordinate at once.
+
+    Comparisons with numbers, strings and
+    :class:`iris.time.PartialDateTime` instances follow the rules for a
+    single cell, but return a boolean array with one value per cell.
+    Anything which cannot be evaluated this way raises a TypeError.
+
+    """
+    # Make this class's comparison operators override those of numpy.
+    __array_priority__ = 100
+
+    def __init__(self, coord):
+        self._coord = coord
+        self._is_time = (iris.FUTURE.cell_datetime_objects and
+                         coord.units.is_time_reference())
+        self._dates = None
+        self._calendar_fields = None
+
+    def _calendar_field(self, name):
+        if self._calendar_fields is None:
+            self._calendar_fields = iris.time._calendar_fields(
+                self._coord.points, self._coord.units) or {}
+        if name not in self._calendar_fields:
+            # Fall back to extracting the field from the date-times.
+            if self._dates is None:
+                self._dates, _ = self._coord._cell_values()
+            self._calendar_fields[name] = np.array(
+                [getattr(date, name) for date in self._dates])
+        return self._calendar_fields[name]
+
+    def _compare_partial_datetime(self, pdt, operator_method):
+        # Reproduce the field-by-field comparison of PartialDateTime.
+        before = np.zeros(self._coord.shape, dtype=bool)
+        equal = np.ones(self._coord.shape, dtype=bool)
+        for name in iris.time.PartialDateTime.__slots__[:-1]:
+            value = getattr(pdt, name)
+            if value is not None:
+                field = self._calendar_field(name)
+                before |= equal & (field < value)
+                equal &= field == value
+        results = {operator.eq: equal,
+                   operator.lt: before,
+                   operator.le: before | equal,
+                   operator.gt: ~(before | equal),
+                   operator.ge: ~before}
+        return results[operator_method]
+
+    def _compare(self, other, operator_method):
+        coord = self._coord
+        if isinstance(other, iris.time.PartialDateTime):
+            if (not self._is_time or coord.has_bounds() or
+                    other.microsecond is not None):
+                raise TypeError('Cannot vectorise comparison with '
+                                '{!r}.'.format(other))
+            result = self._compare_partial_datetime(other, operator_method)
+        elif (isinstance(other, (int, float, np.number)) and
+                not self._is_time and coord.dtype.kind in 'biuf'):
+            if coord.has_bounds():
+                lower = coord.bounds.min(axis=-1)
+                upper = coord.bounds.max(axis=-1)
+                if operator_method is operator.eq:
+                    result = (lower <= other) & (other <= upper)
+                elif operator_method in (operator.gt, operator.le):
+                    result = operator_method(lower, other)
+                else:
+                    result = operator_method(upper, other)
+            else:
+                result = operator_method(coord.points, other)
+        elif (isinstance(other, six.string_types) and
+                operator_method is operator.eq and
+                not coord.has_bounds() and coord.dtype.kind in 'SU'):
+            result = coord.points == other
+        else:
+            raise TypeError('Cannot vectorise comparison with '
+                            '{!r}.'.format(other))
+        return result
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return ~self._compare(other, operator.eq)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    # Comparisons are not hashable, as with the arrays they return.
+    __hash__ = None
+
+
+class _ExtractionCache(object):
+    """
+    Holds the coordinate lookups, the :class:`_VectorisedCells` and the
+    coordinate constraint results for a single cube, so that they are
+    evaluated once when extracting many constraints from the cube.
+
+    The results are :class:`_ColumnIndexManager` instances, which must not
+    be modified.
+
+    """
+    def __init__(self, cube):
+        self.cube = cube
+        self.results = {}
+        self._coords = {}
+        self._cells = {}
+
+    def coord_and_dims(self, name):
+        """
+        Return the coordinate of the cube with the given name and its data
+        dimensions, or (None, None) if there is no such single coordinate.
+
+        """
+        if name not in self._coords:
+            try:
+                coord = self.cube.coord(name)
+            except iris.exceptions.CoordinateNotFoundError:
+                self._coords[name] = (None, None)
+            else:
+                self._coords[name] = (coord, self.cube.coord_dims(coord))
+        return self._coords[name]
+
+    def cells(self, coord):
+        """Return the :class:`_VectorisedCells` of a coordinate of the cube."""
+        cells = self._cells.get(id(coord))
+        if cells is None:
+            cells = self._cells[id(coord)] = _VectorisedCells(coord)
+        return cells
+
 
 class _ColumnIndexManager(object):
     """
@@ -405,6 +604,55 @@ class _ColumnIndexManager(object):
             return tuple(result)
 
 
+def _slice_cube(cube, slice_tuple):
+    # Return the subset of the cube given by the result of
+    # _ColumnIndexManager.as_slice.
+    result = None
+    if slice_tuple is not None:
+        # Slicing the cube is an expensive operation.
+        if all([item == slice(None) for item in slice_tuple]):
+            # Don't perform a full slice, just return the cube.
+            result = cube
+        else:
+            # Performing the partial slice.
+            result = cube[slice_tuple]
+    return result
+
+
+def extract_all(constraints, cube):
+    """
+    Return the subset of the given cube which matches each of the given
+    constraints, or None for each constraint which the cube does not match.
+
+    This is equivalent to calling :meth:`Constraint.extract` for each
+    constraint, but coordinate constraints which test the same coordinate
+    share its lookup and decoded cells, equal coordinate constraints are
+    evaluated once, and the cube is sliced once for each distinct subset.
+    Constraints which select the same part of the cube each get a separate
+    copy of that subset.
+
+    """
+    cache = _ExtractionCache(cube)
+    sub_cubes = {}
+    result = []
+    for constraint in constraints:
+        slice_tuple = constraint._CIM_extract(cube, cache).as_slice()
+        if slice_tuple is None:
+            key = None
+        else:
+            key = tuple(('slice', item.start, item.stop, item.step)
+                        if isinstance(item, slice) else item
+                        for item in slice_tuple)
+        if key in sub_cubes:
+            sub_cube = sub_cubes[key]
+            if sub_cube is not None and sub_cube is not cube:
+                sub_cube = sub_cube.copy()
+        else:
+            sub_cube = sub_cubes[key] = _slice_cube(cube, slice_tuple)
+        result.append(sub_cube)
+    return result
+
+
 def list_of_constraints(constraints):
     """
     Turns the given constraints into a list of valid constraints
@@ -371,3 +371,225 @@ class DataManager(object):
             result = as_lazy_data(self._real_array)
 
         return result
+
+
+class CategoricalDataManager(DataManager):
+    """
+    Provides the :class:`~iris._data_manager.DataManager` API for real data
+    whose values are all drawn from a small table of distinct categories,
+    such as an array of string labels.
+
+    The data is held compactly, as an array of integer codes into the
+    table of categories, and is only assembled when it is requested.
+
+    """
+
+    def __init__(self, categories, codes):
+        """
+        Create a data manager for the data ``categories[codes]``.
+
+        Args:
+
+        * categories:
+            A 1-dimensional array of distinct category values.
+        * codes:
+            An integer array of indices into `categories`, with the shape
+            of the data to be managed.
+
+        """
+        categories = np.asarray(categories)
+        if categories.flags.writeable:
+            # Take our own read-only copy of the categories, so that they
+            # can be shared between copies of the data manager.
+            categories = categories.copy()
+        codes = np.asarray(codes)
+        if categories.ndim != 1:
+            emsg = 'Require 1-dimensional categories, got {} dimensions.'
+            raise ValueError(emsg.format(categories.ndim))
+        if np.unique(categories).size != categories.size:
+            raise ValueError('The categories must be distinct.')
+        if codes.dtype.kind not in 'iu':
+            emsg = 'Require integer codes, got {!r}.'
+            raise TypeError(emsg.format(codes.dtype))
+        if codes.size and (codes.min() < 0 or
+                           codes.max() >= categories.size):
+            raise ValueError('The codes must index the categories.')
+
+        # Hold the codes with the smallest integer type which can index
+        # the categories.
+        code_dtype = np.min_scalar_type(max(categories.size - 1, 0))
+        if codes.dtype == code_dtype:
+            codes = codes.view()
+        else:
+            codes = codes.astype(code_dtype)
+        categories.flags.writeable = False
+        codes.flags.writeable = False
+
+        self._lazy_array = None
+        self._real_array = None
+        self._categories = categories
+        self._codes = codes
+
+    def __eq__(self, other):
+        """
+        Perform :class:`~iris._data_manager.CategoricalDataManager` instance
+        equality, by comparing the codes of the two instances rather than
+        the assembled data.
+
+        Args:
+
+        * other:
+            The :class:`~iris._data_manager.DataManager` instance to
+            compare with.
+
+        Returns:
+            Boolean.
+
+        """
+        if not isinstance(other, CategoricalDataManager):
+            return super(CategoricalDataManager, self).__eq__(other)
+
+        result = False
+        if self.dtype == other.dtype and self.shape == other.shape:
+            if (self._categories is other._categories or
+                    array_equal(self._categories, other._categories)):
+                result = array_equal(self._codes, other._codes)
+            else:
+                # Translate our codes into codes of the other categories.
+                codes = category_indices(self._categories,
+                                         other._categories)
+                result = bool(np.all(codes[self._codes] == other._codes))
+        return result
+
+    def _assert_axioms(self):
+        """
+        Definition of the manager state, that should never be violated.
+
+        """
+        assert self._codes is not None, 'Unexpected data state, no codes.'
+
+    def _deepcopy(self, memo, data=None):
+        """
+        Perform a deepcopy of the
+        :class:`~iris._data_manager.CategoricalDataManager` instance.
+
+        Args:
+
+        * memo:
+            :class:`copy` memo dictionary.
+
+        Kwargs:
+
+        * data:
+            Replacement data to substitute the currently managed
+            data with, in which case the result is a
+            :class:`~iris._data_manager.DataManager` instance.
+
+        Returns:
+            :class:`~iris._data_manager.DataManager` instance.
+
+        """
+        if data is None:
+            # The categories are read-only, so can be shared.
+            result = CategoricalDataManager(self._categories,
+                                            self._codes.copy())
+        else:
+            result = DataManager(self.data)._deepcopy(memo, data=data)
+        return result
+
+    @property
+    def categories(self):
+        """The read-only 1-dimensional array of distinct categories."""
+        return self._categories
+
+    @property
+    def codes(self):
+        """The read-only integer array of indices into the categories."""
+        return self._codes
+
+    @property
+    def data(self):
+        """
+        Returns the real data, assembled from the categories and codes.
+
+        The result is read-only, as changes to it would not affect the
+        managed data.
+
+        Returns:
+            :class:`~numpy.ndarray`.
+
+        """
+        result = self._categories[self._codes]
+        result.flags.writeable = False
+        return result
+
+    @data.setter
+    def data(self, data):
+        raise TypeError('The data of a {} cannot be replaced.'.format(
+            type(self).__name__))
+
+    @property
+    def dtype(self):
+        """The dtype of the categories."""
+        return self._categories.dtype
+
+    @property
+    def ndim(self):
+        """
+        The number of dimensions covered by the data being managed.
+
+        """
+        return self._codes.ndim
+
+    @property
+    def shape(self):
+        """
+        The shape of the data being managed.
+
+        """
+        return self._codes.shape
+
+    def core_data(self):
+        """
+        Return the real :class:`~numpy.ndarray` assembled from the
+        categories and codes.
+
+        """
+        return self.data
+
+    def has_lazy_data(self):
+        """
+        Determine whether lazy data is being managed, which is never the
+        case.
+
+        Returns:
+            Boolean.
+
+        """
+        return False
+
+    def lazy_data(self):
+        """
+        Return the lazy representation of the managed data.
+
+        Returns:
+            :class:`~dask.array.core.Array`
+
+        """
+        return as_lazy_data(self.data)
+
+
+def category_indices(values, categories):
+    """
+    Return the index in `categories` of each element of the 1-dimensional
+    array `values`, or -1 where it is not one of the categories.
+
+    """
+    result = np.full(values.shape, -1, dtype=np.intp)
+    if categories.size:
+        sorter = np.argsort(categories, kind='mergesort')
+        positions = np.searchsorted(categories, values, sorter=sorter)
+        positions = sorter[np.minimum(positions, categories.size - 1)]
+        found = categories[positions] == values
+        result[found] = positions[found]
+    return result
@@ -23,10 +23,12 @@ To avoid replicating implementation-dependent test and conversion code.
 from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 
-from functools import wraps
+from functools import partial, wraps
+import string
 
 import dask
 import dask.array as da
+from dask.array.core import broadcast_shapes, unify_chunks
 import dask.context
 from dask.local import get_sync as dget_sync
 import numpy as np
@@ -237,6 +239,41 @@ def co_realise_cubes(*cubes):
         cube.data = result
 
 
+def map_complete_blocks(lazy_array, func, dims, out_sizes, dtype):
+    """
+    Apply a function to the blocks of a lazy array which are complete in
+    the given dimensions, so that the function sees the whole extent of
+    those dimensions at once.
+
+    Args:
+
+    * lazy_array:
+        The lazy array object to operate on.
+    * func:
+        The function to apply to each block, which returns an array of the
+        same dimensions.
+    * dims:
+        The dimensions which are not to be chunked.
+    * out_sizes:
+        The lengths of the dimensions `dims` in the result.
+    * dtype:
+        The dtype of the result.
+
+    Returns:
+        The lazy result array.
+
+    """
+    chunks = list(lazy_array.chunks)
+    for dim in dims:
+        chunks[dim] = lazy_array.shape[dim]
+    lazy_array = lazy_array.rechunk(tuple(chunks))
+
+    out_chunks = list(lazy_array.chunks)
+    for dim, size in zip(dims, out_sizes):
+        out_chunks[dim] = (size,)
+    return lazy_array.map_blocks(func, chunks=tuple(out_chunks), dtype=dtype)
+
+
 def lazy_elementwise(lazy_array, elementwise_op):
     """
     Apply a (numpy-style) elementwise array operation to a lazy array.
@@ -268,3 +305,119 @@ def lazy_elementwise(lazy_array, elementwise_op):
     dtype = elementwise_op(np.zeros(1, lazy_array.dtype)).dtype
 
     return da.map_blocks(elementwise_op, lazy_array, dtype=dtype)
+
+
+def _block_moments(terms, axes, *arrays):
+    """
+    Return the sums of :func:`lazy_moments` over the given axes of one block,
+    stacked along a new first dimension, with the axes retained as length
+    one dimensions.
+
+    The arrays are the values, mask and reference values of each of the
+    data arrays in turn, followed by the weights, if any.
+
+    """
+    n_data = len(arrays) // 3
+    weights = arrays[-1] if len(arrays) > 3 * n_data else None
+    valid = []
+    centred = []
+    for index in range(n_data):
+        values, mask, reference = arrays[3 * index:3 * index + 3]
+        values = np.subtract(values, reference, dtype=np.float64)
+        values[mask] = 0
+        valid.append(~mask)
+        centred.append(values)
+
+    # Sum the products of the arrays over the axes, without forming the
+    # products.
+    dims = string.ascii_letters[:centred[0].ndim]
+    kept_dims = ''.join(dim for index, dim in enumerate(dims)
+                        if index not in axes)
+    kept_shape = tuple(1 if index in axes else size
+                       for index, size in enumerate(centred[0].shape))
+
+    def total(*factors):
+        subscripts = '{}->{}'.format(','.join([dims] * len(factors)),
+                                     kept_dims)
+        result = np.einsum(subscripts, *factors, dtype=np.float64)
+        return result.reshape(kept_shape)
+
+    # The points included in each sum, with their weights.
+    inclusions = {}
+    sums = []
+    for valid_indices, value_indices, weighted in terms:
+        key = (tuple(valid_indices), weighted and weights is not None)
+        if key not in inclusions:
+            included = np.logical_and.reduce([valid[index]
+                                              for index in valid_indices])
+            if key[1]:
+                included = included * weights
+            inclusions[key] = included
+        sums.append(total(inclusions[key],
+                          *[centred[index] for index in value_indices]))
+    return np.stack(sums)
+
+
+def lazy_moments(arrays, axes, terms, weights=None):
+    """
+    Calculate sums of the products of lazy masked arrays over the given
+    axes, in a single pass over the data, one block at a time.
+
+    The values of each array are taken relative to a reference value, the
+    first point along the axes, which limits the loss of precision in the
+    sums.
+
+    Args:
+
+    * arrays:
+        A list of lazy arrays, which are broadcast to a common shape.
+    * axes:
+        A sorted tuple of the dimensions to sum over.
+    * terms:
+        A list of the sums to calculate, each a tuple of `(valid, values,
+        weighted)`. Each sum is over the points where all the arrays indexed
+        by `valid` are unmasked, of the product of the arrays indexed by
+        `values`, relative to their reference values, multiplied by the
+        weights if `weighted` is True.
+        For example, `((0,), (0, 0), False)` is the unweighted sum of the
+        squares of the first array, and `((0,), (), False)` is the count of
+        its unmasked points.
+
+    Kwargs:
+
+    * weights:
+        A lazy array of weights, broadcastable to the arrays.
+
+    Returns:
+        The lazy sums, stacked along a new first dimension, and a list of
+        the lazy reference values of each array, with the shape of the sums
+        without that dimension.
+
+    """
+    shape = broadcast_shapes(*[array.shape for array in arrays])
+    first = tuple(slice(0, 1) if dim in axes else slice(None)
+                  for dim in range(len(shape)))
+    inputs = []
+    references = []
+    for array in arrays:
+        # Separate the mask before broadcasting, which does not preserve it.
+        values = da.broadcast_to(da.ma.getdata(array), shape)
+        mask = da.broadcast_to(da.ma.getmaskarray(array), shape)
+        reference = da.where(mask[first], 0, values[first])
+        inputs.extend([values, mask, da.broadcast_to(reference, shape)])
+        references.append(reference)
+    if weights is not None:
+        inputs.append(da.broadcast_to(weights, shape))
+
+    index = tuple(range(len(shape)))
+    _, inputs = unify_chunks(*[item for array in inputs
+                               for item in (array, index)])
+    chunks = ((len(terms),),) + tuple(
+        (1,) * len(dim_chunks) if dim in axes else dim_chunks
+        for dim, dim_chunks in enumerate(inputs[0].chunks))
+    moments = da.map_blocks(partial(_block_moments, terms, axes), *inputs,
+                            new_axis=0, chunks=chunks, dtype=np.float64)
+    moments = moments.sum(axis=tuple(dim + 1 for dim in axes))
+    references = [reference.reshape(moments.shape[1:])
+                  for reference in references]
+    return moments, references
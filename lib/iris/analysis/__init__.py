@@ -51,7 +51,8 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
 import collections
-from functools import wraps
+import copy
+from functools import partial, wraps
 
 import dask.array as da
 import numpy as np
@@ -220,6 +221,22 @@ def coord_comparison(*cubes):
 
     """
     all_coords = [cube.coords() for cube in cubes]
+
+    # The definition of each coordinate, and its data dimensions on its cube,
+    # by coordinate id(), so that each is only determined once.
+    defns = {}
+    data_dims = {}
+    # The coordinates of each cube by name, as a candidate for equivalence
+    # must share the name of the coordinate.
+    coords_by_name = []
+    for cube, coords in zip(cubes, all_coords):
+        cube_coords_by_name = {}
+        for coord in coords:
+            defns[id(coord)] = coord._as_defn()
+            data_dims[id(coord)] = cube.coord_dims(coord)
+            cube_coords_by_name.setdefault(coord.name(), []).append(coord)
+        coords_by_name.append(cube_coords_by_name)
+
     grouped_coords = []
 
     # set of coordinates id()s of coordinates which have been processed
@@ -238,8 +255,10 @@ def coord_comparison(*cubes):
             # setup a list to hold the coordinates which will be turned into a
             # coordinate group and added to the grouped_coords list
             this_coords_coord_group = []
+            defn = defns[id(coord)]
 
-            for other_cube_i, other_cube in enumerate(cubes):
+            for other_cube, other_coords_by_name in zip(cubes,
+                                                        coords_by_name):
                 # setup a variable to hold the coordinate which will be added
                 # to the coordinate group for this cube
                 coord_to_add_to_group = None
@@ -249,22 +268,18 @@ def coord_comparison(*cubes):
                 if other_cube is cube:
                     coord_to_add_to_group = coord
                 else:
-                    # iterate through all coordinates in this cube
-                    for other_coord in all_coords[other_cube_i]:
-                        # for optimisation, check that the name is equivalent
-                        # *before* checking all of the metadata is equivalent
-                        eq = (other_coord is coord or
-                              other_coord.name() == coord.name() and
-                              other_coord._as_defn() == coord._as_defn())
-                        if eq:
+                    # find the first coordinate of this cube with equivalent
+                    # metadata
+                    for other_coord in other_coords_by_name.get(coord.name(),
+                                                                []):
+                        if (other_coord is coord or
+                                defns[id(other_coord)] == defn):
                             coord_to_add_to_group = other_coord
                             break
 
                 # add the coordinate to the group
-                if coord_to_add_to_group is None:
-                    this_coords_coord_group.append(None)
-                else:
-                    this_coords_coord_group.append(coord_to_add_to_group)
+                this_coords_coord_group.append(coord_to_add_to_group)
+                if coord_to_add_to_group is not None:
                     # add the object id of the coordinate which is being added
                     # to the group to the processed coordinate list
                     processed_coords.add(id(coord_to_add_to_group))
@@ -280,56 +295,52 @@ def coord_comparison(*cubes):
     scalar_coords = set()
     not_equal = set()
 
+    # classify each coordinate group with a single pass over its coordinates
     for coord_group in grouped_coords:
-        first_cube, first_coord = coord_group._first_coord_w_cube()
-
-        # Get all coordinate groups which aren't complete (i.e. there is a
-        # None in the group)
-        def coord_is_None_fn(cube, coord):
-            return coord is None
-
-        if coord_group.matches_any(coord_is_None_fn):
+        _, first_coord = coord_group._first_coord_w_cube()
+        first_dims = data_dims[id(first_coord)]
+        first_shape = first_coord.shape
+
+        is_ungroupable = False
+        is_not_equal = False
+        is_different_shape = False
+        is_different_data_dimension = False
+        is_no_data_dimension = True
+        is_scalar = True
+        for coord in coord_group:
+            if coord is None:
+                # None -> group not complete, not all equal, has different
+                # shapes and describes a different dimension, but does not
+                # prevent the group being scalar or without data dimensions.
+                is_ungroupable = True
+                is_not_equal = True
+                is_different_shape = True
+                is_different_data_dimension = True
+                continue
+            dims = data_dims[id(coord)]
+            shape = coord.shape
+            if not is_not_equal and coord is not first_coord:
+                is_not_equal = coord != first_coord
+            if shape != first_shape:
+                is_different_shape = True
+            if dims != first_dims:
+                is_different_data_dimension = True
+            if dims != ():
+                is_no_data_dimension = False
+            if shape != (1, ):
+                is_scalar = False
+
+        if is_ungroupable:
             ungroupable.add(coord_group)
-
-        # Get all coordinate groups which don't all equal one another
-        # (None -> group not all equal)
-        def not_equal_fn(cube, coord):
-            return coord != first_coord
-
-        if coord_group.matches_any(not_equal_fn):
+        if is_not_equal:
             not_equal.add(coord_group)
-
-        # Get all coordinate groups which don't all share the same shape
-        # (None -> group has different shapes)
-        def diff_shape_fn(cube, coord):
-            return coord.shape != first_coord.shape
-
-        if coord_group.matches_any(diff_shape_fn):
+        if is_different_shape:
             different_shaped_coords.add(coord_group)
-
-        # Get all coordinate groups which don't all share the same data
-        # dimension on their respective cubes
-        # (None -> group describes a different dimension)
-        def diff_data_dim_fn(cube, coord):
-            return cube.coord_dims(coord) != first_cube.coord_dims(first_coord)
-
-        if coord_group.matches_any(diff_data_dim_fn):
+        if is_different_data_dimension:
             different_data_dimension.add(coord_group)
-
-        # get all coordinate groups which don't describe a dimension
-        # (None -> doesn't describe a dimension)
-        def no_data_dim_fn(cube, coord):
-            return cube.coord_dims(coord) == ()
-
-        if coord_group.matches_all(no_data_dim_fn):
+        if is_no_data_dimension:
             no_data_dimension.add(coord_group)
-
-        # get all coordinate groups which don't describe a dimension
-        # (None -> not a scalar coordinate)
-        def no_data_dim_fn(cube, coord):
-            return coord.shape == (1, )
-
-        if coord_group.matches_all(no_data_dim_fn):
+        if is_scalar:
             scalar_coords.add(coord_group)
 
     result = {}
@@ -511,10 +522,15 @@ class _Aggregator(object):
         if (mdtol is not None and ma.isMaskedArray(data)):
             fraction_not_missing = data.count(axis=axis) / data.shape[axis]
             mask_update = 1 - mdtol > fraction_not_missing
+            # Allow for any trailing additive dimensions of the result.
+            mask_update = mask_update.reshape(
+                np.shape(mask_update) +
+                (1,) * (np.ndim(result) - np.ndim(mask_update)))
             if ma.isMaskedArray(result):
-                result.mask = result.mask | mask_update
+                result.mask = ma.getmaskarray(result) | mask_update
             else:
-                result = ma.array(result, mask=mask_update)
+                result = ma.array(result, mask=np.broadcast_to(
+                    mask_update, np.shape(result)))
 
         return result
 
@@ -678,8 +694,54 @@ class PercentileAggregator(_Aggregator):
             if arg not in kwargs:
                 raise ValueError(msg.format(self.name(), arg))
 
+        # The streaming approximation only applies to lazy data, so real
+        # data is always aggregated exactly.
+        for keyword in ('approx', 'compression'):
+            kwargs.pop(keyword, None)
+
         return _Aggregator.aggregate(self, data, axis, **kwargs)
 
+    def lazy_aggregate(self, data, axis, **kwargs):
+        """
+        Perform the percentile aggregation over the given data with a lazy
+        operation, analogous to the 'aggregate' result.
+
+        Args:
+
+        * data (array):
+            A lazy array (:class:`dask.array.Array`).
+
+        * axis (int or list of int):
+            The dimensions to aggregate over.
+
+        Kwargs:
+
+        * approx (bool):
+            If True, estimate the percentiles in a single streaming pass of
+            the data, rather than rechunking it so that the whole of each
+            collapse dimension fits in memory at once.  Defaults to False.
+
+        * compression (int):
+            The maximum number of centroids used to summarise the data at
+            each point of an approximate result.  Larger values are more
+            accurate, especially towards the median.  Defaults to 100.
+
+        * kwargs:
+            All keyword arguments apart from those specified above, are
+            passed through to the data aggregation function.
+
+        Returns:
+            A lazy array representing the aggregation operation
+            (:class:`dask.array.Array`).
+
+        """
+        msg = '{} aggregator requires the mandatory keyword argument {!r}.'
+        for arg in self._args:
+            if arg not in kwargs:
+                raise ValueError(msg.format(self.name(), arg))
+
+        return _Aggregator.lazy_aggregate(self, data, axis, **kwargs)
+
     def post_process(self, collapsed_cube, data_result, coords, **kwargs):
         """
         Process the result from :func:`iris.analysis.Aggregator.aggregate`.
@@ -1074,6 +1136,7 @@ def _percentile(data, axis, percent, fast_percentile_method=False,
     if shape:
         data = data.reshape([np.prod(shape), data.shape[-1]])
     # Perform the percentile calculation.
+    quantiles = np.array(percent) / 100.
     if fast_percentile_method:
         msg = 'Cannot use fast np.percentile method with masked array.'
         if ma.isMaskedArray(data):
@@ -1081,7 +1144,6 @@ def _percentile(data, axis, percent, fast_percentile_method=False,
         result = np.percentile(data, percent, axis=-1)
         result = result.T
     else:
-        quantiles = np.array(percent) / 100.
         result = scipy.stats.mstats.mquantiles(data, quantiles, axis=-1,
                                                **kwargs)
     if not ma.isMaskedArray(data) and not ma.is_masked(result):
@@ -1128,8 +1190,8 @@ def _weighted_quantile_1D(data, weights, quantiles, **kwargs):
         of weights is zero or masked)
     """
     # Return np.nan if no useable points found
-    if np.isclose(weights.sum(), 0.) or ma.is_masked(weights.sum()):
-        return np.resize(np.array(np.nan), len(quantiles))
+    if ma.is_masked(weights.sum()) or np.isclose(weights.sum(), 0.):
+        return np.resize(np.array(np.nan), np.size(quantiles))
     # Sort the data
     ind_sorted = ma.argsort(data)
     sorted_data = data[ind_sorted]
@@ -1225,6 +1287,327 @@ def _weighted_percentile(data, axis, weights, percent, returned=False,
         return result
 
 
+def _lazy_collapse_last(array, axis, complete=False):
+    """
+    Reorder a lazy array so that the dimensions in 'axis' are combined into
+    a single trailing dimension.
+
+    If 'complete' is True, the array is first rechunked so that the collapse
+    dimensions each fit in a single chunk, with the remaining dimensions
+    chunked automatically to keep the chunks to a manageable size.
+
+    """
+    if not isinstance(axis, collections.Iterable):
+        axis = [axis]
+    axis = sorted(set(dim % array.ndim for dim in axis))
+    keep = [dim for dim in range(array.ndim) if dim not in axis]
+    array = array.transpose(keep + axis)
+    if complete:
+        chunks = dict((dim, 'auto') for dim in range(len(keep)))
+        chunks.update((dim, -1) for dim in range(len(keep), array.ndim))
+        array = array.rechunk(chunks)
+    if len(axis) > 1:
+        size = int(np.prod(array.shape[len(keep):]))
+        array = array.reshape(array.shape[:len(keep)] + (size,))
+    return array
+
+
+def _percentile_shape(percent):
+    # The shape of the additive dimension of a percentile result.
+    shape = np.array(percent).shape
+    return shape if shape > (1,) else ()
+
+
+def _lazy_collapse_blocks(data, func, dtype, shape, *args):
+    # Apply a function to each block of lazy data with a single complete
+    # trailing dimension, which it replaces with new dimensions of 'shape'.
+    chunks = data.chunks[:-1] + tuple((size,) for size in shape)
+    new_axis = list(range(data.ndim - 1, data.ndim - 1 + len(shape)))
+    return da.map_blocks(func, data, *args, chunks=chunks,
+                         drop_axis=data.ndim - 1, new_axis=new_axis or None,
+                         dtype=dtype)
+
+
+def _lazy_mdtol(result, data, axis, mdtol):
+    """
+    Mask a lazy collapsed result wherever the fraction of missing points in
+    the lazy source data exceeds the 'mdtol' tolerance, consistent with
+    :meth:`iris.analysis._Aggregator.aggregate`.
+
+    Any additive dimensions of the result, beyond those of the collapsed
+    data, are expected to be trailing.
+
+    """
+    if mdtol is None:
+        return result
+    if not isinstance(axis, collections.Iterable):
+        axis = [axis]
+    size = int(np.prod([data.shape[dim] for dim in axis]))
+    fraction_not_missing = da.sum(~da.ma.getmaskarray(data), axis=axis) / size
+    mask_update = 1 - mdtol > fraction_not_missing
+    mask_update = mask_update.reshape(
+        mask_update.shape + (1,) * (result.ndim - mask_update.ndim))
+    return da.ma.masked_array(da.ma.getdata(result),
+                              da.ma.getmaskarray(result) | mask_update)
+
+
+def _take_along_last_axis(array, indices):
+    """
+    Select the values of an array at the given indices along its last axis,
+    as :func:`numpy.take_along_axis`, which needs numpy 1.15 or later.
+
+    """
+    ndim = indices.ndim
+    leading = tuple(np.arange(size).reshape((size,) + (1,) * (ndim - dim - 1))
+                    for dim, size in enumerate(indices.shape[:-1]))
+    return array[leading + (indices,)]
+
+
+def _compress_centroids(values, weights, compression):
+    """
+    Summarise weighted values along the last axis with at most
+    'compression' centroids, in the style of a merging t-digest.
+
+    The centroids are formed from consecutive sorted values, and are
+    smaller towards the tails of the distribution, where the quantiles
+    change most rapidly.  Points of zero weight are ignored.
+
+    Returns an array of the centroid means stacked with the centroid
+    weights, as a new leading dimension of length 2.  Unused centroids have
+    a weight of zero.
+
+    """
+    values = np.where(weights > 0, values, np.nan)
+    order = np.argsort(values, axis=-1)
+    values = _take_along_last_axis(values, order)
+    weights = _take_along_last_axis(weights, order)
+    total = weights.sum(axis=-1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        quantiles = (np.cumsum(weights, axis=-1) - 0.5 * weights) / total
+    quantiles = np.clip(np.nan_to_num(quantiles), 0, 1)
+    # Assign the points to centroids using the t-digest "k1" scale function.
+    bins = np.floor(compression * (np.arcsin(2 * quantiles - 1) / np.pi +
+                                   0.5)).astype(int)
+    bins = np.minimum(bins, compression - 1)
+    # Sum all the rows at once, by offsetting the centroid indices of each.
+    shape = values.shape[:-1] + (compression,)
+    offsets = np.arange(0, int(np.prod(shape)), compression)
+    indices = (bins + offsets.reshape(shape[:-1] + (1,))).ravel()
+    weighted_values = np.where(weights > 0, values * weights, 0)
+    weight_sums = np.bincount(indices, weights.ravel(),
+                              minlength=offsets.size * compression)
+    value_sums = np.bincount(indices, weighted_values.ravel(),
+                             minlength=offsets.size * compression)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = value_sums / weight_sums
+    return np.stack([means.reshape(shape), weight_sums.reshape(shape)])
+
+
+def _sketch_chunk(array, axis, keepdims, compression):
+    # The chunk and combine function for the dask reduction of a sketch.
+    return _compress_centroids(array[0], array[1], compression)
+
+
+def _sketch_quantiles(sketch, quantiles, alphap, betap):
+    """
+    Interpolate quantiles from an array of stacked centroid means and
+    weights, as produced by :func:`_compress_centroids`, using the
+    plotting positions of :func:`scipy.stats.mstats.mquantiles`.
+
+    The additive quantile dimension of the result is always the last, and
+    rows without any weight are masked.
+
+    """
+    means, weights = sketch
+    means = np.where(weights > 0, means, np.nan)
+    order = np.argsort(means, axis=-1)
+    means = _take_along_last_axis(means, order)
+    weights = _take_along_last_axis(weights, order)
+    valid = weights > 0
+    total = weights.sum(axis=-1, keepdims=True)
+    # The position of each centroid is that of its mean rank.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        positions = ((np.cumsum(weights, axis=-1) - 0.5 * weights + 0.5 -
+                      alphap) / (total + 1 - alphap - betap))
+    positions = np.where(valid, np.nan_to_num(positions), np.inf)
+    last = np.maximum(valid.sum(axis=-1, keepdims=True) - 1, 0)
+    result = []
+    for quantile in np.atleast_1d(quantiles):
+        upper = np.minimum((positions < quantile).sum(axis=-1, keepdims=True),
+                           last)
+        lower = np.maximum(upper - 1, 0)
+        lower_position = _take_along_last_axis(positions, lower)
+        upper_position = _take_along_last_axis(positions, upper)
+        lower_mean = _take_along_last_axis(means, lower)
+        upper_mean = _take_along_last_axis(means, upper)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.where(upper_position > lower_position,
+                                (quantile - lower_position) /
+                                (upper_position - lower_position), 0)
+        fraction = np.clip(fraction, 0, 1)
+        result.append(lower_mean + fraction * (upper_mean - lower_mean))
+    result = np.concatenate(result, axis=-1)
+    return ma.masked_array(result, mask=np.broadcast_to(
+        ~valid.any(axis=-1, keepdims=True), result.shape))
+
+
+def _lazy_sketch_percentile(data, axis, percent, weights=None,
+                            compression=100, alphap=0.5, betap=0.5):
+    """
+    Approximate the percentiles of lazy data over the given axes, in a
+    single streaming pass.
+
+    Each chunk is summarised by a fixed number of weighted centroids, which
+    are merged pairwise in a tree reduction, so only one chunk of the data
+    needs to be in memory at once, however large the collapse dimensions.
+
+    If a new additive dimension is formed, then it will always be the last
+    dimension of the result.
+
+    """
+    if compression < 2:
+        raise ValueError('The percentile compression must be at least 2, '
+                         'got {!r}.'.format(compression))
+    data = _lazy_collapse_last(data, axis)
+    mask = da.ma.getmaskarray(data)
+    if weights is None:
+        weights = da.ones(data.shape, chunks=data.chunks)
+    else:
+        weights = _lazy_collapse_last(weights, axis).rechunk(data.chunks)
+    weights = da.where(mask, 0, weights).astype(np.float64)
+    values = da.ma.getdata(data).astype(np.float64)
+    stacked = da.stack([values, weights]).rechunk({0: 2})
+    chunk = partial(_sketch_chunk, compression=compression)
+    sketch = da.reduction(stacked, chunk, chunk, combine=chunk, axis=-1,
+                          keepdims=True, dtype=np.float64, concatenate=True,
+                          output_size=compression)
+    quantiles = np.array(percent) / 100.
+    chunks = sketch.chunks[1:-1] + ((quantiles.size,),)
+    result = sketch.map_blocks(_sketch_quantiles, quantiles=quantiles,
+                               alphap=alphap, betap=betap, drop_axis=0,
+                               chunks=chunks, dtype=np.float64)
+    if not _percentile_shape(percent):
+        result = result[..., 0]
+    return result
+
+
+def _lazy_percentile(data, axis, percent, approx=False, compression=100,
+                     mdtol=None, **kwargs):
+    """
+    The lazy equivalent of :func:`_percentile`, which accepts multiple axes.
+
+    The result is exact, with the data rechunked so that the collapse
+    dimensions each fit in a single chunk.  Alternatively, if 'approx' is
+    True, the percentiles are estimated in a single streaming pass of the
+    data, summarised by at most 'compression' centroids at each point.
+
+    """
+    data = iris._lazy_data.as_lazy_data(data)
+    if approx:
+        if kwargs.get('fast_percentile_method', False):
+            msg = 'Cannot use the fast np.percentile method with approx.'
+            raise ValueError(msg)
+        result = _lazy_sketch_percentile(data, axis, percent,
+                                         compression=compression,
+                                         alphap=kwargs.get('alphap', 0.4),
+                                         betap=kwargs.get('betap', 0.4))
+    else:
+        def percentile_block(block):
+            result = _percentile(block, -1, percent, **kwargs)
+            return np.asanyarray(result).reshape(
+                block.shape[:-1] + _percentile_shape(percent))
+
+        collapsed = _lazy_collapse_last(data, axis, complete=True)
+        result = _lazy_collapse_blocks(collapsed, percentile_block,
+                                       np.float64, _percentile_shape(percent))
+    return _lazy_mdtol(result, data, axis, mdtol)
+
+
+def _lazy_weighted_percentile(data, axis, weights, percent, returned=False,
+                              approx=False, compression=100, mdtol=None,
+                              **kwargs):
+    """
+    The lazy equivalent of :func:`_weighted_percentile`, which accepts
+    multiple axes.
+
+    The result is exact, with the data rechunked so that the collapse
+    dimensions each fit in a single chunk.  Alternatively, if 'approx' is
+    True, the percentiles are estimated in a single streaming pass of the
+    data, summarised by at most 'compression' centroids at each point.
+
+    """
+    data = iris._lazy_data.as_lazy_data(data)
+    if data.shape != np.shape(weights):
+        raise ValueError('_weighted_percentile: weights wrong shape.')
+    weights = iris._lazy_data.as_lazy_data(weights)
+    if approx:
+        if kwargs.get('kind', 'linear') != 'linear':
+            msg = 'Only linear interpolation is supported with approx.'
+            raise ValueError(msg)
+        result = _lazy_sketch_percentile(data, axis, percent, weights,
+                                         compression=compression)
+    else:
+        def percentile_block(block, weights_block):
+            result = _weighted_percentile(block, -1, weights_block, percent,
+                                          **kwargs)
+            return np.asanyarray(result).reshape(
+                block.shape[:-1] + _percentile_shape(percent))
+
+        collapsed = _lazy_collapse_last(data, axis, complete=True)
+        collapsed_weights = _lazy_collapse_last(weights, axis)
+        result = _lazy_collapse_blocks(
+            collapsed, percentile_block, np.float64,
+            _percentile_shape(percent),
+            collapsed_weights.rechunk(collapsed.chunks))
+    result = _lazy_mdtol(result, data, axis, mdtol)
+    if returned:
+        weights = da.ma.masked_array(weights, da.ma.getmaskarray(data))
+        result = (result, da.sum(weights, axis=axis))
+    return result
+
+
+@_build_dask_mdtol_function
+def _lazy_median(array, axis=None):
+    """
+    The lazy equivalent of :func:`numpy.ma.median`, with the data rechunked
+    so that the collapse dimensions each fit in a single chunk.
+
+    """
+    def median_block(block):
+        return np.asanyarray(ma.median(block, axis=-1))
+
+    array = iris._lazy_data.as_lazy_data(array)
+    dtype = np.median(np.ones(1, dtype=array.dtype)).dtype
+    collapsed = _lazy_collapse_last(array, axis, complete=True)
+    return _lazy_collapse_blocks(collapsed, median_block, dtype, ())
+
+
+def _masked_result_dtype(func, dtype, **kwargs):
+    """
+    Return the dtype of the result of a real statistic 'func' of masked data
+    of the given dtype, which its lazy equivalent should match.
+
+    """
+    sample = ma.masked_array(np.ones(2, dtype=dtype))
+    return np.asanyarray(func(sample, axis=0, **kwargs)).dtype
+
+
+@_build_dask_mdtol_function
+def _lazy_gmean(array, axis=None):
+    # The geometric mean is the exponential of the mean of the logarithms.
+    array = iris._lazy_data.as_lazy_data(array)
+    dtype = _masked_result_dtype(scipy.stats.mstats.gmean, array.dtype)
+    return da.exp(da.mean(da.log(array.astype(dtype)), axis=axis))
+
+
+@_build_dask_mdtol_function
+def _lazy_hmean(array, axis=None):
+    # The harmonic mean is the reciprocal of the mean of the reciprocals.
+    array = iris._lazy_data.as_lazy_data(array)
+    dtype = _masked_result_dtype(scipy.stats.mstats.hmean, array.dtype)
+    return 1. / da.mean(1. / array.astype(dtype), axis=axis)
+
+
 @_build_dask_mdtol_function
 def _lazy_count(array, **kwargs):
     array = iris._lazy_data.as_lazy_data(array)
@@ -1259,6 +1642,15 @@ def _proportion(array, function, axis, **kwargs):
     return result
 
 
+@_build_dask_mdtol_function
+def _lazy_proportion(array, function, axis, **kwargs):
+    array = iris._lazy_data.as_lazy_data(array)
+    total_non_masked = da.sum(~da.ma.getmaskarray(array), axis=axis, **kwargs)
+    total_non_masked = da.ma.masked_equal(total_non_masked, 0)
+    numerator = da.sum(function(array), axis=axis, **kwargs)
+    return numerator / total_non_masked
+
+
 def _rms(array, axis, **kwargs):
     rval = np.sqrt(ma.average(np.square(array), axis=axis, **kwargs))
     if not ma.isMaskedArray(array):
@@ -1266,6 +1658,25 @@ def _rms(array, axis, **kwargs):
     return rval
 
 
+@_build_dask_mdtol_function
+def _lazy_rms(array, axis, weights=None):
+    array = iris._lazy_data.as_lazy_data(array)
+    if weights is None:
+        dtype = _masked_result_dtype(_rms, array.dtype)
+        mean = da.mean(da.square(array.astype(dtype)), axis=axis)
+    else:
+        weights = iris._lazy_data.as_lazy_data(weights)
+        dtype = _masked_result_dtype(_rms, array.dtype,
+                                     weights=np.ones(2, dtype=weights.dtype))
+        squares = da.square(array.astype(dtype))
+        # Exclude the weights of any masked points, as ma.average does.
+        weights = da.ma.masked_array(weights.rechunk(array.chunks),
+                                     da.ma.getmaskarray(array))
+        mean = (da.sum(squares * weights, axis=axis) /
+                da.sum(weights, axis=axis))
+    return da.sqrt(mean).astype(dtype)
+
+
 @_build_dask_mdtol_function
 def _lazy_sum(array, **kwargs):
     array = iris._lazy_data.as_lazy_data(array)
@@ -1288,6 +1699,13 @@ def _lazy_sum(array, **kwargs):
     return rvalue
 
 
+def _masked_where_any(array, mask):
+    # Mask a block only where necessary, leaving it unmasked otherwise.
+    if np.any(mask):
+        array = ma.masked_array(array, mask=mask)
+    return array
+
+
 def _peak(array, **kwargs):
     def column_segments(column):
         nan_indices = np.where(np.isnan(column))[0]
@@ -1389,6 +1807,32 @@ def _peak(array, **kwargs):
     return data
 
 
+def _lazy_peak(array, axis=-1, mdtol=None):
+    """
+    The lazy equivalent of :func:`_peak`, which collapses each of the given
+    axes in turn, from the last, with the data rechunked so that each
+    collapse dimension fits in a single chunk.
+
+    As for :func:`_peak`, the missing data tolerance applies to each collapse
+    in turn, and collapsing one-dimensional data gives a result of shape
+    (1,).
+
+    """
+    def peak_block(block):
+        return np.asanyarray(_peak(block)).reshape(block.shape[:-1])
+
+    array = iris._lazy_data.as_lazy_data(array)
+    if not isinstance(axis, collections.Iterable):
+        axis = [axis]
+    for dim in sorted(set(dim % array.ndim for dim in axis), reverse=True):
+        collapsed = _lazy_collapse_last(array, dim, complete=True)
+        result = _lazy_collapse_blocks(collapsed, peak_block, np.float32, ())
+        array = _lazy_mdtol(result, array, dim, mdtol)
+    if array.ndim == 0:
+        array = array.reshape((1,))
+    return array
+
+
 #
 # Common partial Aggregation class constructors.
 #
@@ -1421,7 +1865,8 @@ This aggregator handles masked data.
 """
 
 
-GMEAN = Aggregator('geometric_mean', scipy.stats.mstats.gmean)
+GMEAN = Aggregator('geometric_mean', scipy.stats.mstats.gmean,
+                   lazy_func=_lazy_gmean)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates the
 geometric mean over a :class:`~iris.cube.Cube`, as computed by
@@ -1433,12 +1878,18 @@ To compute zonal geometric means over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.GMEAN)
 
+.. note::
+
+    Lazy operation is supported, as the exponential of the mean of the
+    logarithms of the data.
+
 This aggregator handles masked data.
 
 """
 
 
-HMEAN = Aggregator('harmonic_mean', scipy.stats.mstats.hmean)
+HMEAN = Aggregator('harmonic_mean', scipy.stats.mstats.hmean,
+                   lazy_func=_lazy_hmean)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates the
 harmonic mean over a :class:`~iris.cube.Cube`, as computed by
@@ -1455,6 +1906,11 @@ To compute zonal harmonic mean over the *longitude* axis of a cube::
     The harmonic mean is only valid if all data values are greater
     than zero.
 
+.. note::
+
+    Lazy operation is supported, as the reciprocal of the mean of the
+    reciprocals of the data.
+
 This aggregator handles masked data.
 
 """
@@ -1508,7 +1964,7 @@ This aggregator handles masked data.
 """
 
 
-MEDIAN = Aggregator('median', ma.median)
+MEDIAN = Aggregator('median', ma.median, lazy_func=_lazy_median)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the median over a :class:`~iris.cube.Cube`, as computed by
@@ -1520,6 +1976,11 @@ To compute zonal medians over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.MEDIAN)
 
+.. note::
+
+    Lazy operation is supported, with the data rechunked so that the
+    collapse dimensions each fit in a single chunk.
+
 This aggregator handles masked data.
 
 """
@@ -1561,7 +2022,7 @@ This aggregator handles masked data.
 """
 
 
-PEAK = Aggregator('peak', _peak)
+PEAK = Aggregator('peak', _peak, lazy_func=_lazy_peak)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the peak value derived from a spline interpolation over a
@@ -1582,12 +2043,18 @@ To compute the peak over the *time* axis of a cube::
 
     result = cube.collapsed('time', iris.analysis.PEAK)
 
+.. note::
+
+    Lazy operation is supported, with the data rechunked so that each
+    collapse dimension fits in a single chunk.
+
 This aggregator handles masked data.
 
 """
 
 
-PERCENTILE = PercentileAggregator(alphap=1, betap=1)
+PERCENTILE = PercentileAggregator(alphap=1, betap=1,
+                                  lazy_func=_lazy_percentile)
 """
 An :class:`~iris.analysis.PercentileAggregator` instance that calculates the
 percentile over a :class:`~iris.cube.Cube`, as computed by
@@ -1606,6 +2073,14 @@ Additional kwargs associated with the use of this aggregator:
 * betap (float):
     Plotting positions parameter, see :func:`scipy.stats.mstats.mquantiles`.
     Defaults to 1.
+* approx (bool):
+    For lazy data, estimate the percentiles in a single streaming pass,
+    summarising the data at each point with a t-digest style sketch,
+    instead of rechunking so that each collapse dimension fits in a
+    single chunk.  Defaults to False.
+* compression (int):
+    The maximum number of centroids in each sketch of an approximate
+    calculation.  Defaults to 100.
 
 **For example**:
 
@@ -1613,14 +2088,24 @@ To compute the 10th and 90th percentile over *time*::
 
     result = cube.collapsed('time', iris.analysis.PERCENTILE, percent=[10, 90])
 
+To estimate the median over a very large lazy *realization* dimension::
+
+    result = cube.collapsed('realization', iris.analysis.PERCENTILE,
+                            percent=50, approx=True)
+
 This aggregator handles masked data.
 
+.. note::
+
+    Lazy operation is supported, by :meth:`~iris.cube.Cube.collapsed` only.
+
 """
 
 
 PROPORTION = Aggregator('proportion',
                         _proportion,
-                        units_func=lambda units: 1)
+                        units_func=lambda units: 1,
+                        lazy_func=_lazy_proportion)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates the
 proportion, as a fraction, of :class:`~iris.cube.Cube` data occurrences
@@ -1649,12 +2134,17 @@ Similarly, the proportion of *time* precipitation exceeded 10
 
 .. seealso:: The :func:`~iris.analysis.COUNT` aggregator.
 
+.. note::
+
+    Lazy operation is supported, via :func:`dask.array.sum`.
+
 This aggregator handles masked data.
 
 """
 
 
-RMS = WeightedAggregator('root mean square', _rms)
+RMS = WeightedAggregator('root mean square', _rms,
+                         lazy_func=_lazy_rms)
 """
 An :class:`~iris.analysis.Aggregator` instance that calculates
 the root mean square over a :class:`~iris.cube.Cube`, as computed by
@@ -1673,6 +2163,11 @@ To compute the zonal root mean square over the *longitude* axis of a cube::
 
     result = cube.collapsed('longitude', iris.analysis.RMS)
 
+.. note::
+
+    Lazy operation is supported, as the square root of the mean of the
+    squares of the data.
+
 This aggregator handles masked data.
 
 """
@@ -1779,7 +2274,8 @@ This aggregator handles masked data.
 """
 
 
-WPERCENTILE = WeightedPercentileAggregator()
+WPERCENTILE = WeightedPercentileAggregator(
+    lazy_func=_lazy_weighted_percentile)
 """
 An :class:`~iris.analysis.WeightedPercentileAggregator` instance that
 calculates the weighted percentile over a :class:`~iris.cube.Cube`.
@@ -1806,9 +2302,156 @@ Additional kwargs associated with the use of this aggregator:
     :func:`scipy.interpolate.interp1d` Defaults to "linear", which is
     equivalent to alphap=0.5, betap=0.5 in `iris.analysis.PERCENTILE`
 
+* approx (bool):
+    For lazy data, estimate the percentiles in a single streaming pass, as
+    for `iris.analysis.PERCENTILE`.  Only "linear" interpolation is
+    supported.  Defaults to False.
+
+* compression (int):
+    The maximum number of centroids in each sketch of an approximate
+    calculation.  Defaults to 100.
+
+.. note::
+
+    Lazy operation is supported, by :meth:`~iris.cube.Cube.collapsed` only.
+
 """
 
 
+#: The built-in aggregators, none of which modify the data they aggregate.
+_BUILTIN_AGGREGATORS = frozenset([COUNT, GMEAN, HMEAN, MAX, MEAN, MEDIAN, MIN,
+                                  PEAK, PERCENTILE, PROPORTION, RMS, STD_DEV,
+                                  SUM, VARIANCE, WPERCENTILE])
+
+
+def _moment_mean(count, total, squares, reference):
+    return reference + total / count
+
+
+def _moment_sum(count, total, squares, reference):
+    return count * reference + total
+
+
+def _moment_variance(count, total, squares, reference, ddof=0):
+    # Clip any negative variance, which can only come from rounding errors.
+    return da.maximum(squares - total * total / count, 0) / (count - ddof)
+
+
+def _moment_std(count, total, squares, reference, ddof=0):
+    return da.sqrt(_moment_variance(count, total, squares, reference,
+                                    ddof=ddof))
+
+
+def _moment_rms(count, total, squares, reference):
+    return da.sqrt((squares + reference * (2 * total + count * reference)) /
+                   count)
+
+
+#: The terms of :func:`iris._lazy_data.lazy_moments` giving the count, sum
+#: and sum of squares of the unmasked values of an array, relative to its
+#: reference value.
+_MOMENT_TERMS = [((0,), (), False), ((0,), (0,), False),
+                 ((0,), (0, 0), False)]
+
+
+#: The calculation of each moment-based statistic from the count, sum and
+#: sum of squares of the unmasked values relative to a reference value, with
+#: the function giving the dtype of the statistic.
+_MOMENT_STATISTICS = {MEAN: (_moment_mean, np.mean),
+                      SUM: (_moment_sum, np.sum),
+                      VARIANCE: (_moment_variance, np.var),
+                      STD_DEV: (_moment_std, np.std),
+                      RMS: (_moment_rms, lambda values: _rms(
+                          ma.masked_array(values), axis=0))}
+
+
+def _share_moments(aggregators):
+    """
+    Return the given aggregators, with copies of any moment-based
+    statistics that share a single lazy calculation of their moments for
+    any one array and axes.
+
+    Statistics requested with keywords other than "mdtol" and "ddof", such
+    as weights, use their own lazy operation instead.
+
+    """
+    shared_moments = {}
+
+    def moments(data, axis):
+        if not isinstance(axis, collections.Iterable):
+            axis = [axis]
+        axes = tuple(sorted(set(dim % data.ndim for dim in axis)))
+        key = (data.name, axes)
+        if key not in shared_moments:
+            stacked, (reference,) = iris._lazy_data.lazy_moments(
+                [data], axes, _MOMENT_TERMS)
+            shared_moments[key] = stacked, reference
+        return shared_moments[key], axes
+
+    def shared_lazy_func(aggregator):
+        statistic, dtype_func = _MOMENT_STATISTICS[aggregator]
+
+        def lazy_func(data, axis, mdtol=None, **kwargs):
+            if set(kwargs) - set(['ddof']):
+                return aggregator.lazy_func(data, axis=axis, mdtol=mdtol,
+                                            **kwargs)
+            data = iris._lazy_data.as_lazy_data(data)
+            (stacked, reference), axes = moments(data, axis)
+            count, total, squares = stacked
+            ddof = kwargs.get('ddof', 0)
+            empty = count <= ddof
+            # Avoid dividing by zero at the points that will be masked.
+            safe_count = da.where(empty, ddof + 1, count)
+            dtype = dtype_func(np.zeros(1, dtype=data.dtype)).dtype
+            result = statistic(safe_count, total, squares, reference,
+                               **kwargs).astype(dtype)
+            if mdtol is None or mdtol >= 1.0:
+                result = da.map_blocks(_masked_where_any, result, empty,
+                                       dtype=dtype)
+            else:
+                size = np.prod([data.shape[dim] for dim in axes])
+                masked_point_fractions = (size - count) / size
+                result = da.ma.masked_array(
+                    result, empty | (masked_point_fractions > mdtol))
+            return result
+
+        return lazy_func
+
+    result = []
+    for aggregator in aggregators:
+        if aggregator in _MOMENT_STATISTICS:
+            shared = copy.copy(aggregator)
+            shared.lazy_func = shared_lazy_func(aggregator)
+            aggregator = shared
+        result.append(aggregator)
+    return result
+
+
+def _group_codes(points):
+    """
+    Return an array of integer codes for a 1-dimensional array of values,
+    which are equal wherever the values are equal.
+
+    NaN values are never equal, so each has a code of its own.
+
+    """
+    points = np.asarray(points)
+    if points.dtype.kind == 'O':
+        codes_by_value = {}
+        codes = np.array([codes_by_value.setdefault(value,
+                                                    len(codes_by_value))
+                          for value in points], dtype=np.intp)
+    else:
+        _, codes = np.unique(points, return_inverse=True)
+        codes = codes.ravel()
+        if points.dtype.kind in 'fc':
+            nans = np.isnan(points)
+            if np.any(nans):
+                codes = codes.astype(np.intp)
+                codes[nans] = codes.max() + 1 + np.arange(np.sum(nans))
+    return codes
+
+
 class _Groupby(object):
     """
     Convenience class to determine group slices over one or more group-by
@@ -1901,162 +2544,117 @@ class _Groupby(object):
         """
         if self._groupby_coords:
             if not self._slices_by_key:
-                items = []
-                groups = []
-
+                # Label each point with the number of its group, numbering
+                # the groups in order of their first points.  Categorical
+                # points are grouped by their codes.
+                codes = None
                 for coord in self._groupby_coords:
-                    groups.append(iris.coords._GroupIterator(coord.points))
-                    items.append(next(groups[-1]))
-
-                # Construct the group slice for each group over the group-by
-                # coordinates. Keep constructing until all group-by coordinate
-                # groups are exhausted.
-                while any([item is not None for item in items]):
-                    # Determine the extent (start, stop) of the group given
-                    # each current group-by coordinate group.
-                    start = max([item.groupby_slice.start for item in items
-                                 if item is not None])
-                    stop = min([item.groupby_slice.stop for item in items
-                                if item is not None])
-                    # Construct composite group key for the group using the
-                    # start value from each group-by coordinate.
-                    key = tuple([coord.points[start] for coord
-                                 in self._groupby_coords])
-                    # Associate group slice with group key within the ordered
-                    # dictionary.
-                    self._slices_by_key.setdefault(key, []).append(slice(start,
-                                                                         stop))
-                    # Prepare for the next group slice construction over the
-                    # group-by coordinates.
-                    for item_index, item in enumerate(items):
-                        if item is None:
-                            continue
-                        # Get coordinate current group slice.
-                        groupby_slice = item.groupby_slice
-                        # Determine whether coordinate has spanned all its
-                        # groups i.e. its full length
-                        # or whether we need to get the coordinates next group.
-                        if groupby_slice.stop == self._stop:
-                            # This coordinate has exhausted all its groups,
-                            # so remove it.
-                            items[item_index] = None
-                        elif groupby_slice.stop == stop:
-                            # The current group of this coordinate is
-                            # exhausted, so get the next one.
-                            items[item_index] = next(groups[item_index])
-
-                # Merge multiple slices together into one tuple.
-                self._slice_merge()
-                # Calculate the new group-by coordinates.
-                self._compute_groupby_coords()
-                # Calculate the new shared coordinates.
-                self._compute_shared_coords()
+                    categorical = coord._categorical_points()
+                    if categorical is None:
+                        other = _group_codes(coord.points)
+                    else:
+                        other = _group_codes(categorical[1])
+                    if codes is None:
+                        codes = other
+                    elif codes.size:
+                        codes = _group_codes(codes * (other.max() + 1) +
+                                             other)
+                # Zero-length group-by coordinates have no groups.
+                if codes.size:
+                    self._build_groups(codes)
             # Generate the group-by slices/groups.
             for groupby_slice in six.itervalues(self._slices_by_key):
                 yield groupby_slice
 
         return
 
-    def _slice_merge(self):
-        """
-        Merge multiple slices into one tuple and collapse items from
-        containing list.
-
-        """
-        # Iterate over the ordered dictionary in order to reduce
-        # multiple slices into a single tuple and collapse
-        # all items from containing list.
-        for key, groupby_slices in six.iteritems(self._slices_by_key):
-            if len(groupby_slices) > 1:
-                # Compress multiple slices into tuple representation.
-                groupby_indicies = []
-
-                for groupby_slice in groupby_slices:
-                    groupby_indicies.extend(range(groupby_slice.start,
-                                                  groupby_slice.stop))
-
-                self._slices_by_key[key] = tuple(groupby_indicies)
-            else:
-                # Remove single inner slice from list.
-                self._slices_by_key[key] = groupby_slices[0]
-
-    def _compute_groupby_coords(self):
-        """Create new group-by coordinates given the group slices."""
-
-        groupby_slice = []
-
-        # Iterate over the ordered dictionary in order to construct
-        # a group-by slice that samples the first element from each group.
-        for key_slice in six.itervalues(self._slices_by_key):
-            if isinstance(key_slice, tuple):
-                groupby_slice.append(key_slice[0])
+    def _build_groups(self, codes):
+        """
+        Find the group slices, and create the new group-by and shared
+        coordinates, given the group code of each point.
+
+        """
+        _, first, labels = np.unique(codes, return_index=True,
+                                     return_inverse=True)
+        order = np.argsort(first)
+        ranks = np.empty_like(order)
+        ranks[order] = np.arange(order.size)
+        labels = ranks[labels.ravel()]
+        first = first[order]
+
+        # Find the indices of the points in each group.
+        counts = np.bincount(labels)
+        indices = np.split(np.argsort(labels, kind='mergesort'),
+                           np.cumsum(counts)[:-1])
+        last = np.array([group[-1] for group in indices])
+
+        points = [coord.points for coord in self._groupby_coords]
+        for start, stop, group in zip(first, last, indices):
+            # Construct composite group key for the group using the
+            # start value from each group-by coordinate.
+            key = tuple([coord_points[start] for coord_points in points])
+            if stop - start + 1 == len(group):
+                # The group is a contiguous slice.
+                groupby_slice = slice(start, stop + 1)
             else:
-                groupby_slice.append(key_slice.start)
-
-        groupby_slice = np.array(groupby_slice)
+                groupby_slice = tuple(group.tolist())
+            self._slices_by_key[key] = groupby_slice
 
-        # Create new group-by coordinates from the group-by slice.
-        self.coords = [coord[groupby_slice] for coord in self._groupby_coords]
+        # Calculate the new group-by coordinates.
+        self._compute_groupby_coords(first)
+        # Calculate the new shared coordinates.
+        self._compute_shared_coords(first, last, indices)
 
-    def _compute_shared_coords(self):
-        """Create the new shared coordinates given the group slices."""
+    def _compute_groupby_coords(self, first):
+        """
+        Create new group-by coordinates given the index of the first
+        element of each group.
 
-        groupby_bounds = []
+        """
+        # Create new group-by coordinates from the group-by slice that
+        # samples the first element from each group.
+        self.coords = [coord[first] for coord in self._groupby_coords]
 
-        # Iterate over the ordered dictionary in order to construct
-        # a list of tuple group boundary indexes.
-        for key_slice in six.itervalues(self._slices_by_key):
-            if isinstance(key_slice, tuple):
-                groupby_bounds.append((key_slice[0], key_slice[-1]))
-            else:
-                groupby_bounds.append((key_slice.start, key_slice.stop-1))
+    def _compute_shared_coords(self, first, last, indices):
+        """
+        Create the new shared coordinates given the indices of the first
+        and last elements of each group, and the indices of all the
+        elements of each group.
 
+        """
         # Create new shared bounded coordinates.
         for coord in self._shared_coords:
             if coord.points.dtype.kind in 'SU':
                 if coord.bounds is None:
-                    new_points = []
+                    points = coord.points
+                    new_points = ['|'.join(points[group])
+                                  for group in indices]
                     new_bounds = None
-                    for key_slice in six.itervalues(self._slices_by_key):
-                        if isinstance(key_slice, slice):
-                            indices = key_slice.indices(coord.points.shape[0])
-                            key_slice = range(*indices)
-                        new_pt = '|'.join([coord.points[i]
-                                           for i in key_slice])
-                        new_points.append(new_pt)
                 else:
                     msg = ('collapsing the bounded string coordinate {0!r}'
                            ' is not supported'.format(coord.name()))
                     raise ValueError(msg)
             else:
-                new_bounds = []
-
-                # Construct list of coordinate group boundary pairs.
-                for start, stop in groupby_bounds:
-                    if coord.has_bounds():
-                        # Collapse group bounds into bounds.
-                        if (getattr(coord, 'circular', False) and
-                                (stop + 1) == len(coord.points)):
-                            new_bounds.append([coord.bounds[start, 0],
-                                              coord.bounds[0, 0] +
-                                              coord.units.modulus])
-                        else:
-                            new_bounds.append([coord.bounds[start, 0],
-                                              coord.bounds[stop, 1]])
-                    else:
-                        # Collapse group points into bounds.
-                        if (getattr(coord, 'circular', False) and
-                                (stop + 1) == len(coord.points)):
-                            new_bounds.append([coord.points[start],
-                                              coord.points[0] +
-                                              coord.units.modulus])
-                        else:
-                            new_bounds.append([coord.points[start],
-                                              coord.points[stop]])
+                # Collapse group bounds, or group points, into bounds.
+                if coord.has_bounds():
+                    values = coord.bounds
+                else:
+                    values = coord.points[:, np.newaxis]
+                lower = values[first, 0]
+                upper = values[last, -1]
+                if getattr(coord, 'circular', False):
+                    wraps = last + 1 == len(coord.points)
+                    if np.any(wraps):
+                        wrap = values[0, 0] + coord.units.modulus
+                        upper = upper.astype(np.result_type(
+                            upper.dtype, np.asarray(wrap).dtype))
+                        upper[wraps] = wrap
+                        lower = lower.astype(upper.dtype)
+                new_bounds = np.column_stack([lower, upper])
 
                 # Now create the new bounded group shared coordinate.
                 try:
-                    new_points = np.array(new_bounds).mean(-1)
+                    new_points = new_bounds.mean(-1)
                 except TypeError:
                     msg = 'The {0!r} coordinate on the collapsing dimension' \
                           ' cannot be collapsed.'.format(coord.name())
@@ -2451,17 +3049,31 @@ class UnstructuredNearest(object):
     # Note: the argument requirements are simply those of the underlying
     # regridder class,
     # :class:`iris.analysis.trajectory.UnstructuredNearestNeigbourRegridder`.
-    def __init__(self):
+    def __init__(self, cache_dir=None):
         """
         Nearest-neighbour interpolation and regridding scheme suitable for
         interpolating or regridding from un-gridded data such as trajectories
         or other data where the X and Y coordinates share the same dimensions.
 
+        Kwargs:
+
+        * cache_dir:
+            An existing directory in which to save the nearest-neighbour
+            search results.  Regridders created with the same
+            'cache_dir', between the same grids, then re-use these instead
+            of repeating the search.  Defaults to None, meaning that nothing
+            is saved.
+
         """
-        pass
+        self.cache_dir = cache_dir
 
     def __repr__(self):
-        return 'UnstructuredNearest()'
+        if self.cache_dir is None:
+            result = 'UnstructuredNearest()'
+        else:
+            result = 'UnstructuredNearest(cache_dir={!r})'.format(
+                self.cache_dir)
+        return result
 
     # TODO: add interpolator usage
     # def interpolator(self, cube):
@@ -2504,4 +3116,5 @@ class UnstructuredNearest(object):
         """
         from iris.analysis.trajectory import \
             UnstructuredNearestNeigbourRegridder
-        return UnstructuredNearestNeigbourRegridder(src_cube, target_grid)
+        return UnstructuredNearestNeigbourRegridder(src_cube, target_grid,
+                                                    cache_dir=self.cache_dir)
@@ -580,6 +580,53 @@ class RectilinearInterpolator(object):
 
         return result
 
+    def _trajectory_points(self, sample_points, data):
+        """
+        Interpolate the given data values at a sequence of sample positions,
+        each of which specifies a value for *every* interpolation coordinate.
+
+        Unlike :meth:`_points`, the sample points are not combined as an
+        orthogonal cross-product, so the i'th sample position is
+        (sample_values_for_coord_0[i], sample_values_for_coord_1[i], ...).
+
+        Args:
+
+        * sample_points:
+            A list of N iterables, all of the same length M, where N is the
+            number of coordinates passed to the constructor.
+        * data:
+            The data to interpolate. Its leading dimensions must map
+            one-to-one onto the dimensions of the cube that was used to
+            construct this interpolator. Any further trailing dimensions are
+            carried through the interpolation unchanged.
+
+        Returns:
+            An :class:`~numpy.ndarray` or :class:`~numpy.ma.MaskedArray`
+            of shape (M, ...), where the trailing dimensions are the
+            non-interpolated dimensions of the data, in their original order.
+
+        """
+        dims = list(range(data.ndim))
+        data = self._account_for_inverted(data)
+
+        # Combine the sample values into an array of shape (M, N).
+        interp_points = []
+        for index, points in enumerate(sample_points):
+            dtype = self._interpolated_dtype(self._src_points[index].dtype)
+            interp_points.append(np.array(points, dtype=dtype, ndmin=1))
+        interp_points = np.column_stack(interp_points)
+
+        # Adjust for circularity.
+        interp_points, data = self._account_for_circular(interp_points, data)
+
+        # Shuffle the interpolated dimensions to the front.
+        interp_order = self._interp_dims + [dim for dim in dims
+                                            if dim not in self._interp_dims]
+        if interp_order != dims:
+            data = np.transpose(data, interp_order)
+
+        return self._interpolate(data, interp_points)
+
     def __call__(self, sample_points, collapse_scalar=True):
         """
         Construct a cube from the specified orthogonal interpolation points.
@@ -26,6 +26,7 @@ import warnings
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import map_complete_blocks
 from iris.analysis._interpolation import (EXTRAPOLATION_MODES,
                                           extend_circular_coord_and_data,
                                           get_xy_dim_coords, snapshot_grid)
@@ -34,6 +35,16 @@ import iris.cube
 from iris.util import _meshgrid
 
 
+def _regridded_dtype(dtype, method):
+    # Return the dtype of data regridded by RectilinearRegridder._regrid.
+    if method == 'linear':
+        # If we're given integer values, convert them to the smallest
+        # possible float dtype that can accurately preserve the values.
+        if dtype.kind == 'i':
+            dtype = np.promote_types(dtype, np.float16)
+    return dtype
+
+
 class RectilinearRegridder(object):
     """
     This class provides support for performing nearest-neighbour or
@@ -217,13 +228,7 @@ class RectilinearRegridder(object):
         shape[y_dim] = sample_grid_x.shape[0]
         shape[x_dim] = sample_grid_x.shape[1]
 
-        dtype = src_data.dtype
-        if method == 'linear':
-            # If we're given integer values, convert them to the smallest
-            # possible float dtype that can accurately preserve the values.
-            if dtype.kind == 'i':
-                dtype = np.promote_types(dtype, np.float16)
-
+        dtype = _regridded_dtype(src_data.dtype, method)
         if ma.isMaskedArray(src_data):
             data = ma.empty(shape, dtype=dtype)
             data.mask = np.zeros(data.shape, dtype=np.bool)
@@ -530,10 +535,23 @@ class RectilinearRegridder(object):
         # Compute the interpolated data values.
         x_dim = src.coord_dims(src_x_coord)[0]
         y_dim = src.coord_dims(src_y_coord)[0]
-        data = self._regrid(src.data, x_dim, y_dim,
-                            src_x_coord, src_y_coord,
-                            sample_grid_x, sample_grid_y,
-                            self._method, self._extrapolation_mode)
+        regrid = functools.partial(self._regrid,
+                                   x_dim=x_dim, y_dim=y_dim,
+                                   src_x_coord=src_x_coord,
+                                   src_y_coord=src_y_coord,
+                                   sample_grid_x=sample_grid_x,
+                                   sample_grid_y=sample_grid_y,
+                                   method=self._method,
+                                   extrapolation_mode=self._extrapolation_mode)
+        if src.has_lazy_data():
+            # Regrid lazily, one block of complete horizontal slices at a
+            # time.
+            data = map_complete_blocks(src.lazy_data(), regrid,
+                                       (y_dim, x_dim), sample_grid_x.shape,
+                                       _regridded_dtype(src.dtype,
+                                                        self._method))
+        else:
+            data = regrid(src.data)
 
         # Wrap up the data as a Cube.
         regrid_callback = functools.partial(self._regrid,
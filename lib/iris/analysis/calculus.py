@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2010 - 2017, Met Office
+# (C) British Crown Copyright 2010 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -28,6 +28,7 @@ import six
 import re
 
 import cf_units
+import dask.array as da
 import numpy as np
 
 from iris._deprecation import warn_deprecated
@@ -151,6 +152,8 @@ cube_delta(temperature_cube, 'pressure')
 
     .. note:: Missing data support not yet implemented.
 
+    .. note:: If the cube has lazy data, the result also has lazy data.
+
     """
     # handle the case where a user passes a coordinate name
     if isinstance(coord, six.string_types):
@@ -169,7 +172,7 @@ cube_delta(temperature_cube, 'pressure')
 
     # Calculate the actual delta, taking into account whether the given
     # coordinate is circular.
-    delta_cube_data = delta(cube.data, delta_dim,
+    delta_cube_data = delta(cube.core_data(), delta_dim,
                             circular=getattr(coord, 'circular', False))
 
     # If the coord/dim is circular there is no change in cube shape
@@ -247,6 +250,8 @@ def differentiate(cube, coord_to_differentiate):
 
     .. note:: Spherical differentiation does not occur in this routine.
 
+    .. note:: If the cube has lazy data, the result also has lazy data.
+
     """
     # Get the delta cube in the required differential direction.
     # This operation results in a copy of the original cube.
@@ -284,7 +289,7 @@ def _curl_subtract(a, b):
     if a is None and b is None:
         return None
     elif a is None:
-        c = b.copy(data=0 - b.data)
+        c = b.copy(data=0 - b.core_data())
         return c
     elif b is None:
         return a.copy()
@@ -372,7 +377,11 @@ def _curl_change_z(src_cube, z_coord, prototype_diff):
     ind = [slice(None, None)] * src_cube.ndim
     z_dim = src_cube.coord_dims(z_coord)[0]
     ind[z_dim] = slice(-1, None)
-    new_data = np.append(src_cube.data, src_cube.data[tuple(ind)], z_dim)
+    data = src_cube.core_data()
+    if src_cube.has_lazy_data():
+        new_data = da.concatenate([data, data[tuple(ind)]], axis=z_dim)
+    else:
+        new_data = np.append(data, data[tuple(ind)], z_dim)
 
     # The existing z_coord doesn't fit the new data so make a
     # new cube using the prototype z_coord.
@@ -474,6 +483,8 @@ def curl(i_cube, j_cube, k_cube=None):
     All cubes passed in must have the same data units, and those units
     must be spatially-derived (e.g. 'm/s' or 'km/h').
 
+    If the cubes have lazy data, the resulting cubes also have lazy data.
+
     The calculation of curl is dependent on the type of
     :func:`~iris.coord_systems.CoordSystem` in the cube.
     If the :func:`~iris.coord_systems.CoordSystem` is either
@@ -574,7 +585,7 @@ def curl(i_cube, j_cube, k_cube=None):
 
         # TODO Implement resampling in the vertical (which regridding
         # does not support).
-        if dj_dz is not None and dj_dz.data.shape != prototype_diff.data.shape:
+        if dj_dz is not None and dj_dz.shape != prototype_diff.shape:
             dj_dz = _curl_change_z(dj_dz, z_coord, prototype_diff)
 
         i_cmpt = _curl_subtract(dk_dy, dj_dz)
@@ -586,7 +597,7 @@ def curl(i_cube, j_cube, k_cube=None):
 
         # TODO Implement resampling in the vertical (which regridding
         # does not support).
-        if di_dz is not None and di_dz.data.shape != prototype_diff.data.shape:
+        if di_dz is not None and di_dz.shape != prototype_diff.shape:
             di_dz = _curl_change_z(di_dz, z_coord, prototype_diff)
 
         dk_dx = _curl_differentiate(k_cube, x_coord)
@@ -27,12 +27,14 @@ import copy
 import warnings
 
 import cf_units
+import dask.array as da
 import numpy as np
 import numpy.ma as ma
 
 import cartopy.img_transform
 import cartopy.crs as ccrs
 import iris.analysis
+import iris._lazy_data
 import iris.coords
 import iris.coord_systems
 import iris.exceptions
@@ -668,25 +670,6 @@ def project(cube, target_proj, nx=None, ny=None):
                          'to have 1 or 2 dimensions, got {} and '
                          '{}.'.format(lat_coord.ndim, lon_coord.ndim))
 
-    # Create array to store regridded data
-    new_shape = list(cube.shape)
-    new_shape[xdim] = nx
-    new_shape[ydim] = ny
-    new_data = ma.zeros(new_shape, cube.data.dtype)
-
-    # Create iterators to step through cube data in lat long slices
-    new_shape[xdim] = 1
-    new_shape[ydim] = 1
-    index_it = np.ndindex(*new_shape)
-    if lat_coord.ndim == 1 and lon_coord.ndim == 1:
-        slice_it = cube.slices([lat_coord, lon_coord])
-    elif lat_coord.ndim == 2 and lon_coord.ndim == 2:
-        slice_it = cube.slices(lat_coord)
-    else:
-        raise ValueError('Expected the latitude and longitude coordinates '
-                         'to have 1 or 2 dimensions, got {} and '
-                         '{}.'.format(lat_coord.ndim, lon_coord.ndim))
-
 #    # Mask out points outside of extent in source_cs - disabled until
 #    # a way to specify global/limited extent is agreed upon and code
 #    # is generalised to handle -180 to +180, 0 to 360 and >360 longitudes.
@@ -706,29 +689,48 @@ def project(cube, target_proj, nx=None, ny=None):
 #                           (source_desired_x > source_x.max()) |
 #                           (source_desired_y < source_y.min()) |
 #                           (source_desired_y > source_y.max()))
-#    # Make array a mask by default (rather than a single bool) to allow mask
-#    # to be assigned to slices.
-#    new_data.mask = np.zeros(new_shape)
-
-    # Step through cube data, regrid onto desired projection and insert results
-    # in new_data array
-    for index, ll_slice in zip(index_it, slice_it):
-        # Regrid source data onto target grid
-        index = list(index)
-        index[xdim] = slice(None, None)
-        index[ydim] = slice(None, None)
-        new_data[index] = cartopy.img_transform.regrid(ll_slice.data,
-                                                       source_x, source_y,
-                                                       source_cs,
-                                                       target_proj,
-                                                       target_x, target_y)
+
+    # Calculate the mapping from the target grid to the source grid once
+    # only, by regridding an array of the (flat) source point indices.
+    source_indices = np.arange(source_x.size).reshape(source_x.shape)
+    target_indices = cartopy.img_transform.regrid(source_indices,
+                                                  source_x, source_y,
+                                                  source_cs,
+                                                  target_proj,
+                                                  target_x, target_y)
+    target_mask = ma.getmaskarray(target_indices).flatten()
+    target_indices = ma.getdata(target_indices).flatten()
 
 #    # Mask out points beyond extent
-#    new_data[index].mask[outof_extent_points] = True
+#    target_mask |= outof_extent_points.flatten()
+
+    # Move the source latitude and longitude dimensions to the end, in (Y, X)
+    # order to match the source points, and flatten them.
+    other_dims = [dim for dim in range(cube.ndim) if dim not in (ydim, xdim)]
+    dims_order = other_dims + [ydim, xdim]
+    data = cube.core_data().transpose(dims_order)
+    if iris._lazy_data.is_lazy_data(data):
+        # Each block must span the whole of the source grid.
+        data = data.rechunk({cube.ndim - 2: -1, cube.ndim - 1: -1})
+    data = data.reshape(data.shape[:-2] + (-1,))
+
+    # Select the source point for every target point, lazily if the source
+    # data is lazy.
+    if iris._lazy_data.is_lazy_data(data):
+        chunks = data.chunks[:-1] + ((ny,), (nx,))
+        new_data = data.map_blocks(_project_points, target_indices,
+                                   target_mask, (ny, nx),
+                                   chunks=chunks, dtype=data.dtype,
+                                   new_axis=data.ndim)
+    else:
+        new_data = _project_points(data, target_indices, target_mask,
+                                   (ny, nx))
+        # Remove mask if it is unnecessary
+        if ma.isMaskedArray(new_data) and not np.any(new_data.mask):
+            new_data = new_data.data
 
-    # Remove mask if it is unnecessary
-    if not np.any(new_data.mask):
-        new_data = new_data.data
+    # Restore the original dimension order.
+    new_data = new_data.transpose(tuple(np.argsort(dims_order)))
 
     # Create new cube
     new_cube = iris.cube.Cube(new_data)
@@ -786,6 +788,20 @@ def project(cube, target_proj, nx=None, ny=None):
     return new_cube, extent
 
 
+def _project_points(data, indices, mask, grid_shape):
+    """
+    Select the source point for each target point from the last dimension of
+    the data, masking any target points which have no valid source point,
+    and reshape the result to the target grid.
+
+    """
+    result = data.take(indices, axis=-1)
+    if np.any(mask):
+        result = ma.masked_array(result)
+        result[..., mask] = ma.masked
+    return result.reshape(data.shape[:-1] + grid_shape)
+
+
 def _transform_xy(crs_from, x, y, crs_to):
     """
     Shorthand function to transform 2d points between coordinate
@@ -924,6 +940,56 @@ def _transform_distance_vectors(u_dist, v_dist, ds, dx2, dy2):
     return u2_dist, v2_dist
 
 
+def _distance_vector_rotation_matrix(ds, dx2, dy2):
+    """
+    Combine the distance and partial differentials into the coefficients
+    of the linear map applied by :func:`_transform_distance_vectors`.
+
+    Args:
+
+    * ds (`DistanceDifferential`):
+        Distance differentials for the source and the target crs at specified
+        locations.
+    * dx2, dy2 (`PartialDifferential`):
+        Partial differentials from the source to the target crs.
+
+    Returns:
+        (uu, uv, vu, vv): Tuple of arrays such that the target vector
+        components are ``uu * u + uv * v`` and ``vu * u + vv * v``.
+
+    """
+    uu = dx2.dx1 / ds.dx1 * ds.dx2
+    uv = dx2.dy1 / ds.dy1 * ds.dx2
+    vu = dy2.dx1 / ds.dx1 * ds.dy2
+    vv = dy2.dy1 / ds.dy1 * ds.dy2
+    return uu, uv, vu, vv
+
+
+def _apply_distance_vector_rotation(u, v, rotation, mask=None):
+    """
+    Apply the coefficients from :func:`_distance_vector_rotation_matrix`
+    to real or lazy vector components, whose trailing dimensions match
+    the horizontal grid of the coefficients.
+
+    The result is masked wherever the optional 2d `mask` is True, and keeps
+    the dtypes of `u` and `v` respectively.
+
+    """
+    uu, uv, vu, vv = rotation
+    ut = (uu * u + uv * v).astype(u.dtype, copy=False)
+    vt = (vu * u + vv * v).astype(v.dtype, copy=False)
+    if mask is not None:
+        if iris._lazy_data.is_lazy_data(ut):
+            full_mask = da.broadcast_to(mask, ut.shape, chunks=ut.chunks)
+            ut = da.ma.masked_where(full_mask, ut)
+            vt = da.ma.masked_where(full_mask, vt)
+        else:
+            full_mask = np.broadcast_to(mask, ut.shape)
+            ut = ma.masked_where(full_mask, ut)
+            vt = ma.masked_where(full_mask, vt)
+    return ut, vt
+
+
 def _transform_distance_vectors_tolerance_mask(src_crs, x, y, tgt_crs,
                                                ds, dx2, dy2):
     """
@@ -1117,33 +1183,25 @@ def rotate_winds(u_cube, v_cube, target_cs):
     mask = _transform_distance_vectors_tolerance_mask(src_crs, x, y,
                                                       target_crs,
                                                       ds, dx2, dy2)
-    apply_mask = mask.any()
-    if apply_mask:
-        # Make masked arrays to accept masking.
-        ut_cube.data = ma.asanyarray(ut_cube.data)
-        vt_cube.data = ma.asanyarray(vt_cube.data)
-
-    # Project vectors with u, v components one horiz slice at a time and
-    # insert into the resulting cubes.
-    shape = list(u_cube.shape)
-    for dim in dims:
-        shape[dim] = 1
-    ndindex = np.ndindex(*shape)
-    for index in ndindex:
-        index = list(index)
-        for dim in dims:
-            index[dim] = slice(None, None)
-        index = tuple(index)
-        u = u_cube.data[index]
-        v = v_cube.data[index]
-        ut, vt = _transform_distance_vectors(u, v, ds, dx2, dy2)
-        if apply_mask:
-            ut = ma.asanyarray(ut)
-            ut[mask] = ma.masked
-            vt = ma.asanyarray(vt)
-            vt[mask] = ma.masked
-        ut_cube.data[index] = ut
-        vt_cube.data[index] = vt
+    if not mask.any():
+        mask = None
+
+    # Combine the differentials into a single per-gridpoint matrix which
+    # maps the source vector components onto the target components.
+    rotation = _distance_vector_rotation_matrix(ds, dx2, dy2)
+
+    # Move the horizontal dimensions to the end, in the same order as the
+    # 2d x and y arrays, so that the matrix broadcasts over all of the
+    # remaining dimensions in a single operation.
+    horiz_dims = sorted(dims)
+    dims_order = [dim for dim in range(u_cube.ndim)
+                  if dim not in horiz_dims] + horiz_dims
+    inverse_order = tuple(np.argsort(dims_order))
+    u = u_cube.core_data().transpose(dims_order)
+    v = v_cube.core_data().transpose(dims_order)
+    ut, vt = _apply_distance_vector_rotation(u, v, rotation, mask)
+    ut_cube.data = ut.transpose(inverse_order)
+    vt_cube.data = vt.transpose(inverse_order)
 
     # Calculate new coords of locations in target coordinate system.
     xyz_tran = target_crs.transform_points(src_crs, x, y)
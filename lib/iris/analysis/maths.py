@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2010 - 2017, Met Office
+# (C) British Crown Copyright 2010 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -22,16 +22,22 @@ Basic mathematical and statistical operations.
 from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 
+from contextlib import contextmanager
+import copy
+import hashlib
 import warnings
 import math
 import operator
 import inspect
+import threading
+import weakref
 
 import cf_units
 import numpy as np
 from numpy import ma
 
 import iris.analysis
+from iris._lazy_data import as_lazy_data
 import iris.coords
 import iris.cube
 import iris.exceptions
@@ -43,6 +49,61 @@ from dask.array.core import broadcast_shapes
 
 _output_dtype_cache = {}
 
+# The results of the coordinate compatibility checks of binary operations
+# between cubes, keyed on a summary of the coordinates of the two cubes.
+_coord_compatibility_cache = iris.util._LRUCache(256)
+
+# The digests of the values of the read-only points and bounds arrays of
+# coordinates, keyed on the identity of each array, with a weak reference to
+# the array.
+_array_digest_cache = iris.util._LRUCache(1024)
+
+
+class _LazyArithmetic(threading.local):
+    """Thread-specific state of :func:`lazy_arithmetic`."""
+    def __init__(self):
+        self.enabled = False
+
+
+_lazy_arithmetic = _LazyArithmetic()
+
+
+@contextmanager
+def lazy_arithmetic():
+    """
+    Return a context manager within which cube arithmetic is deferred.
+
+    Within the `with` statement the result of every (not in-place)
+    arithmetic operation on a cube has lazy data, even when the operands
+    have real data. A chain of operations therefore builds a single
+    elementwise graph, which is evaluated chunk by chunk, with the
+    operations fused together, only when the data of the final result is
+    requested. No intermediate full-size arrays are allocated.
+
+    For example::
+
+        with iris.analysis.maths.lazy_arithmetic():
+            result = (a * b + c) / d
+        data = result.data
+
+    .. note::
+
+        The lazy results share the real data of their operands, rather than
+        copying it, as does :meth:`iris.cube.Cube.lazy_data`.  Until the
+        data of a result is realised, any change to the data of an operand
+        therefore also changes the result.
+
+    If Iris code is executed with multiple threads, note that this setting
+    is thread-specific.
+
+    """
+    previous = _lazy_arithmetic.enabled
+    _lazy_arithmetic.enabled = True
+    try:
+        yield
+    finally:
+        _lazy_arithmetic.enabled = previous
+
 
 def _output_dtype(op, first_dtype, second_dtype=None, in_place=False):
     """
@@ -224,6 +285,113 @@ def _assert_matching_units(cube, other, operation_name):
         raise iris.exceptions.NotYetImplementedError(msg)
 
 
+def _array_digest(array):
+    """
+    Return a digest of the values of a real array.
+
+    The digest of a read-only array, such as the points and bounds of a
+    :class:`iris.coords.DimCoord`, is cached on the identity of the array,
+    so is only calculated once for each array.  The values of any other
+    array may be changed in place, so are digested on every call.
+
+    """
+    read_only = iris.coords._is_read_only(array)
+    cached = None
+    if read_only:
+        cached = _array_digest_cache.get(id(array))
+    if cached is not None and cached[0]() is array:
+        digest = cached[1]
+    else:
+        digest = hashlib.sha1(np.ascontiguousarray(ma.getdata(array)))
+        if ma.isMaskedArray(array):
+            digest.update(ma.getmaskarray(array))
+        digest = digest.digest()
+        if read_only:
+            _array_digest_cache[id(array)] = (weakref.ref(array), digest)
+    return digest
+
+
+def _coords_signature(cube, coords):
+    """
+    Return a hashable summary of the given coordinates of a cube, which
+    together with their definitions determines the result of comparing them
+    with the coordinates of another cube.
+
+    Each coordinate is summarised by its type, data dimensions, and the
+    dtype, shape and a digest of the values of its points and bounds, or of
+    the codes and categories of categorical points.  Returns None if any
+    coordinate has lazy or object values, which are not summarised.
+
+    """
+    result = []
+    for coord in coords:
+        if coord.has_lazy_points() or coord.has_lazy_bounds():
+            return None
+        summary = [type(coord), getattr(coord, 'circular', None),
+                   cube.coord_dims(coord)]
+        categorical = coord._categorical_points()
+        if categorical is None:
+            arrays = coord._core_arrays()
+        else:
+            arrays = categorical + (coord._core_arrays()[1],)
+        for values in arrays:
+            if values is None:
+                summary.append(None)
+                continue
+            if values.dtype.hasobject:
+                return None
+            summary.append((values.dtype.str, values.shape,
+                            _array_digest(values)))
+        result.append(tuple(summary))
+    return tuple(result)
+
+
+def _ignorable_coords(cube, other):
+    """
+    Check that the coordinates of two cubes allow a binary operation between
+    them, and return the coordinates of `cube` which are to be removed from
+    the result, as determined by :func:`iris.analysis.coord_comparison`.
+
+    The outcome is cached on the definitions, data dimensions and values of
+    the coordinates of both cubes, so repeated operations between cubes with
+    the same coordinates need not compare them again.
+
+    """
+    coords = cube.coords()
+    other_coords = other.coords()
+    defns = [coord._as_defn() for coord in coords + other_coords]
+    key = (_coords_signature(cube, coords),
+           _coords_signature(other, other_coords))
+    cached = None
+    if None not in key:
+        cached = _coord_compatibility_cache.get(key)
+    if cached is not None and cached[0] == defns:
+        _, bad_names, ignore_indices = cached
+    else:
+        # get a coordinate comparison of this cube and the cube to do the
+        # operation with
+        coord_comp = iris.analysis.coord_comparison(cube, other)
+        bad_coord_grps = (coord_comp['ungroupable_and_dimensioned'] +
+                          coord_comp['resamplable'])
+        bad_names = {coord_grp.name() for coord_grp in bad_coord_grps}
+        ignore_defns = [coord_grp[0]._as_defn() for coord_grp
+                        in coord_comp['ignorable']
+                        if coord_grp[0] is not None]
+        ignore_indices = [index for index, coord in enumerate(coords)
+                          if defns[index] in ignore_defns]
+        if None not in key:
+            # Copy the definitions, which refer to the attributes of the
+            # coordinates.
+            _coord_compatibility_cache[key] = (copy.deepcopy(defns),
+                                               bad_names, ignore_indices)
+
+    if bad_names:
+        raise ValueError('This operation cannot be performed as there are '
+                         'differing coordinates (%s) remaining '
+                         'which cannot be ignored.' % ', '.join(bad_names))
+    return [coords[index] for index in ignore_indices]
+
+
 def add(cube, other, dim=None, in_place=False):
     """
     Calculate the sum of two cubes, or the sum of a cube and a
@@ -335,31 +503,17 @@ def _add_subtract_common(operation_function, operation_name, cube, other,
     _assert_matching_units(cube, other, operation_name)
 
     if isinstance(other, iris.cube.Cube):
-        # get a coordinate comparison of this cube and the cube to do the
-        # operation with
-        coord_comp = iris.analysis.coord_comparison(cube, other)
-
-        bad_coord_grps = (coord_comp['ungroupable_and_dimensioned'] +
-                          coord_comp['resamplable'])
-        if bad_coord_grps:
-            raise ValueError('This operation cannot be performed as there are '
-                             'differing coordinates (%s) remaining '
-                             'which cannot be ignored.'
-                             % ', '.join({coord_grp.name() for coord_grp
-                                          in bad_coord_grps}))
+        ignore = _ignorable_coords(cube, other)
     else:
-        coord_comp = None
+        ignore = []
 
     new_cube = _binary_op_common(operation_function, operation_name, cube,
                                  other, cube.units, new_dtype=new_dtype,
                                  dim=dim, in_place=in_place)
 
-    if coord_comp:
-        # If a coordinate is to be ignored - remove it
-        ignore = filter(None, [coord_grp[0] for coord_grp
-                               in coord_comp['ignorable']])
-        for coord in ignore:
-            new_cube.remove_coord(coord)
+    # If a coordinate is to be ignored - remove it
+    for coord in ignore:
+        new_cube.remove_coord(coord)
 
     return new_cube
 
@@ -398,30 +552,17 @@ def multiply(cube, other, dim=None, in_place=False):
         op = operator.mul
 
     if isinstance(other, iris.cube.Cube):
-        # get a coordinate comparison of this cube and the cube to do the
-        # operation with
-        coord_comp = iris.analysis.coord_comparison(cube, other)
-        bad_coord_grps = (coord_comp['ungroupable_and_dimensioned'] +
-                          coord_comp['resamplable'])
-        if bad_coord_grps:
-            raise ValueError('This operation cannot be performed as there are '
-                             'differing coordinates (%s) remaining '
-                             'which cannot be ignored.'
-                             % ', '.join({coord_grp.name() for coord_grp
-                                          in bad_coord_grps}))
+        ignore = _ignorable_coords(cube, other)
     else:
-        coord_comp = None
+        ignore = []
 
     new_cube = _binary_op_common(op, 'multiply', cube, other, new_unit,
                                  new_dtype=new_dtype, dim=dim,
                                  in_place=in_place)
 
-    if coord_comp:
-        # If a coordinate is to be ignored - remove it
-        ignore = filter(None, [coord_grp[0] for coord_grp
-                        in coord_comp['ignorable']])
-        for coord in ignore:
-            new_cube.remove_coord(coord)
+    # If a coordinate is to be ignored - remove it
+    for coord in ignore:
+        new_cube.remove_coord(coord)
 
     return new_cube
 
@@ -480,30 +621,17 @@ def divide(cube, other, dim=None, in_place=False):
         op = operator.truediv
 
     if isinstance(other, iris.cube.Cube):
-        # get a coordinate comparison of this cube and the cube to do the
-        # operation with
-        coord_comp = iris.analysis.coord_comparison(cube, other)
-        bad_coord_grps = (coord_comp['ungroupable_and_dimensioned'] +
-                          coord_comp['resamplable'])
-        if bad_coord_grps:
-            raise ValueError('This operation cannot be performed as there are '
-                             'differing coordinates (%s) remaining '
-                             'which cannot be ignored.'
-                             % ', '.join({coord_grp.name() for coord_grp
-                                          in bad_coord_grps}))
+        ignore = _ignorable_coords(cube, other)
     else:
-        coord_comp = None
+        ignore = []
 
     new_cube = _binary_op_common(op, 'divide', cube, other, new_unit,
                                  new_dtype=new_dtype, dim=dim,
                                  in_place=in_place)
 
-    if coord_comp:
-        # If a coordinate is to be ignored - remove it
-        ignore = filter(None, [coord_grp[0] for coord_grp
-                        in coord_comp['ignorable']])
-        for coord in ignore:
-            new_cube.remove_coord(coord)
+    # If a coordinate is to be ignored - remove it
+    for coord in ignore:
+        new_cube.remove_coord(coord)
 
     return new_cube
 
@@ -840,7 +968,10 @@ def _math_op_common(cube, operation_function, new_unit, new_dtype=None,
                 # Non ufunc function
                 operation_function(cube.data)
     else:
-        new_cube = cube.copy(data=operation_function(cube.core_data()))
+        data = cube.core_data()
+        if _lazy_arithmetic.enabled:
+            data = as_lazy_data(data)
+        new_cube = cube.copy(data=operation_function(data))
 
     # If the result of the operation is scalar and masked, we need to fix up
     # the dtype
@@ -21,22 +21,74 @@ Statistical operations between cubes.
 
 from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
+import six
 
+from dask.array.core import broadcast_shapes
 import numpy as np
 import numpy.ma as ma
+
 import iris
-from iris.util import broadcast_to_shape
+from iris._lazy_data import as_lazy_data, lazy_moments
+import iris.analysis
+import iris.analysis.maths
+import iris.exceptions
+from iris.util import as_compatible_shape, broadcast_to_shape
+
 
+# The weighted sums from which the correlation is calculated, for each of
+# the two arrays (1, 2) over its own unmasked points, and for both arrays
+# (12) over the points unmasked in both.
+_MOMENTS = ('count_1', 'weight_1', 'sum_1', 'sum_11',
+            'count_2', 'weight_2', 'sum_2', 'sum_22',
+            'count_12', 'weight_12', 'sum_1_12', 'sum_2_12', 'sum_12')
 
-def _ones_like(cube):
+
+def _moment_terms(common_mask):
     """
-    Return a copy of cube with the same mask, but all data values set to 1.
+    Return the terms of :func:`iris._lazy_data.lazy_moments` which calculate
+    the sums of :data:`_MOMENTS`.
+
     """
-    ones_cube = cube.copy()
-    ones_cube.data = np.ones_like(cube.data)
-    ones_cube.rename('unknown')
-    ones_cube.units = 1
-    return ones_cube
+    both = (0, 1)
+    if common_mask:
+        valid_1 = valid_2 = both
+    else:
+        valid_1, valid_2 = (0,), (1,)
+    return [(valid_1, (), False), (valid_1, (), True),
+            (valid_1, (0,), True), (valid_1, (0, 0), True),
+            (valid_2, (), False), (valid_2, (), True),
+            (valid_2, (1,), True), (valid_2, (1, 1), True),
+            (both, (), False), (both, (), True),
+            (both, (0,), True), (both, (1,), True), (both, (0, 1), True)]
+
+
+def _pearsonr_from_moments(moments, size, mdtol, result_dtype):
+    """
+    Return the correlation calculated from the sums of :data:`_MOMENTS`,
+    stacked along the first dimension, over `size` points at each result
+    point.
+
+    """
+    moments = dict(zip(_MOMENTS, moments))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_1 = moments['sum_1'] / moments['weight_1']
+        mean_2 = moments['sum_2'] / moments['weight_2']
+        covar = (moments['sum_12'] - mean_2 * moments['sum_1_12'] -
+                 mean_1 * moments['sum_2_12'] +
+                 mean_1 * mean_2 * moments['weight_12'])
+        # The variances cannot be negative, except by rounding.
+        var_1 = np.maximum(moments['sum_11'] - mean_1 * moments['sum_1'], 0)
+        var_2 = np.maximum(moments['sum_22'] - mean_2 * moments['sum_2'], 0)
+        denom = np.sqrt(var_1 * var_2)
+        result = np.asarray(covar / denom, dtype=result_dtype)
+
+    mask = ((moments['count_12'] == 0) | (moments['count_1'] == 0) |
+            (moments['count_2'] == 0) | (denom == 0))
+    if mdtol is not None:
+        mask |= 1 - mdtol > moments['count_12'] / size
+    if result.ndim or mask:
+        result = ma.masked_array(result, mask=mask)
+    return result
 
 
 def pearsonr(cube_a, cube_b, corr_coords=None, weights=None, mdtol=1.,
@@ -85,6 +137,13 @@ def pearsonr(cube_a, cube_b, corr_coords=None, weights=None, mdtol=1.,
     Reference:
         http://www.statsoft.com/textbook/glosp.html#Pearson%20Correlation
 
+    .. note::
+
+        The correlation is calculated in a single pass over the data of the
+        cubes, from weighted sums of the values, their squares and their
+        products, accumulated chunk by chunk. The resulting cube has lazy
+        data, which is only computed when requested.
+
     """
 
     # Assign larger cube to cube_1
@@ -101,34 +160,14 @@ def pearsonr(cube_a, cube_b, corr_coords=None, weights=None, mdtol=1.,
     # If no coords passed then set to all common dimcoords of cubes.
     if corr_coords is None:
         corr_coords = common_dim_coords
+    elif isinstance(corr_coords, six.string_types):
+        corr_coords = [corr_coords]
 
     smaller_shape = cube_2.shape
 
-    # Match up data masks if required.
-    if common_mask:
-        # Create a cube of 1's with a common mask.
-        if ma.is_masked(cube_2.data):
-            mask_cube = _ones_like(cube_2)
-        else:
-            mask_cube = 1.
-        if ma.is_masked(cube_1.data):
-            # Take a slice to avoid unnecessary broadcasting of cube_2.
-            slice_coords = [dim_coords_1[i] for i in range(cube_1.ndim) if
-                            dim_coords_1[i] not in common_dim_coords and
-                            np.array_equal(cube_1.data.mask.any(axis=i),
-                                           cube_1.data.mask.all(axis=i))]
-            cube_1_slice = next(cube_1.slices_over(slice_coords))
-            mask_cube = _ones_like(cube_1_slice) * mask_cube
-        # Apply common mask to data.
-        if isinstance(mask_cube, iris.cube.Cube):
-            cube_1 = cube_1 * mask_cube
-            cube_2 = mask_cube * cube_2
-            dim_coords_2 = [coord.name() for coord in cube_2.dim_coords]
-
-    # Broadcast weights to shape of cubes if necessary.
+    # Broadcast weights to shape of cube_1 if necessary.
     if weights is None or cube_1.shape == smaller_shape:
         weights_1 = weights
-        weights_2 = weights
     else:
         if weights.shape != smaller_shape:
             raise ValueError("weights array should have dimensions {}".
@@ -137,30 +176,48 @@ def pearsonr(cube_a, cube_b, corr_coords=None, weights=None, mdtol=1.,
         dims_1_common = [i for i in range(cube_1.ndim) if
                          dim_coords_1[i] in common_dim_coords]
         weights_1 = broadcast_to_shape(weights, cube_1.shape, dims_1_common)
-        if cube_2.shape != smaller_shape:
-            dims_2_common = [i for i in range(cube_2.ndim) if
-                             dim_coords_2[i] in common_dim_coords]
-            weights_2 = broadcast_to_shape(weights, cube_2.shape,
-                                           dims_2_common)
-        else:
-            weights_2 = weights
+
+    # Derive the metadata of the result from the product of the cubes,
+    # collapsed over the correlation coordinates, without computing it.
+    with iris.analysis.maths.lazy_arithmetic():
+        corr_cube = (cube_1 * cube_2).collapsed(corr_coords,
+                                                iris.analysis.SUM)
+    axes = set()
+    for coord in corr_coords:
+        axes.update(cube_1.coord_dims(coord))
+        if not cube_2.coord_dims(coord):
+            raise iris.exceptions.CoordinateCollapseError(
+                'Cannot collapse a dimension which does not describe any '
+                'data.')
+    axes = tuple(sorted(axes))
+
+    # Align the data of both cubes, and the weights, with the dimensions of
+    # cube_1.
+    data_1 = as_lazy_data(cube_1.core_data())
+    cube_2 = cube_2.copy(data=as_lazy_data(cube_2.core_data()))
+    try:
+        broadcast_shapes(cube_1.shape, cube_2.shape)
+    except ValueError:
+        cube_2 = as_compatible_shape(cube_2, cube_1)
+    data_2 = cube_2.core_data()
+    shape = broadcast_shapes(data_1.shape, data_2.shape)
+    if weights_1 is not None:
+        weights_1 = as_lazy_data(np.asanyarray(weights_1))
 
     # Calculate correlations.
-    s1 = cube_1 - cube_1.collapsed(corr_coords, iris.analysis.MEAN,
-                                   weights=weights_1)
-    s2 = cube_2 - cube_2.collapsed(corr_coords, iris.analysis.MEAN,
-                                   weights=weights_2)
-
-    covar = (s1*s2).collapsed(corr_coords, iris.analysis.SUM,
-                              weights=weights_1, mdtol=mdtol)
-    var_1 = (s1**2).collapsed(corr_coords, iris.analysis.SUM,
-                              weights=weights_1)
-    var_2 = (s2**2).collapsed(corr_coords, iris.analysis.SUM,
-                              weights=weights_2)
-
-    denom = iris.analysis.maths.apply_ufunc(np.sqrt, var_1*var_2,
-                                            new_unit=covar.units)
-    corr_cube = covar / denom
+    moments, _ = lazy_moments([data_1, data_2], axes,
+                              _moment_terms(common_mask), weights=weights_1)
+    size = int(np.prod([shape[dim] for dim in axes]))
+    dtype = np.result_type(cube_1.dtype, cube_2.dtype,
+                           *([] if weights is None else [weights]))
+    if dtype.kind != 'f':
+        dtype = np.dtype(np.float64)
+    data = moments.map_blocks(_pearsonr_from_moments, size, mdtol, dtype,
+                              drop_axis=0, dtype=dtype)
+
+    corr_cube = corr_cube.copy(data=data)
+    iris.analysis.clear_phenomenon_identity(corr_cube)
+    corr_cube.units = 1
     corr_cube.rename("Pearson's r")
 
     return corr_cube
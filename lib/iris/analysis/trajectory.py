@@ -24,8 +24,11 @@ from __future__ import (absolute_import, division, print_function)
 from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
+import hashlib
 import math
+import os
 
+import dask.array as da
 import numpy as np
 from scipy.spatial import cKDTree
 
@@ -33,8 +36,11 @@ import iris.analysis
 import iris.coord_systems
 import iris.coords
 
+from iris._lazy_data import is_lazy_data
 from iris.analysis import Linear
-from iris.analysis._interpolation import snapshot_grid
+from iris.analysis._interpolation import (_canonical_sample_points,
+                                          snapshot_grid)
+import iris.util
 from iris.util import _meshgrid
 
 
@@ -260,9 +266,29 @@ def interpolate(cube, sample_points, method=None):
     new_data_shape = [size for dim, size in remaining]
     new_data_shape.append(trajectory_size)
 
-    # Start with empty data and then fill in the "column" of values for each
-    # trajectory point.
-    new_cube = iris.cube.Cube(np.empty(new_data_shape))
+    # Are the given coords all 1-dimensional? (can we do linear interp?)
+    for coord, values in sample_points:
+        if coord.ndim > 1:
+            if method == "linear":
+                msg = "Cannot currently perform linear interpolation for " \
+                      "multi-dimensional coordinates."
+                raise iris.exceptions.CoordinateMultiDimError(msg)
+            method = "nearest"
+            break
+
+    if method in ["linear", None]:
+        # Interpolate all the trajectory points at once, with a single
+        # interpolator.
+        interpolator, sample_values = _trajectory_interpolator(
+            cube, sample_points, squish_my_dims)
+        new_data = _linear_trajectory_data(cube, interpolator, sample_values,
+                                           squish_my_dims)
+    else:
+        # Start with empty data and then fill in the "column" of values for
+        # each trajectory point.
+        new_data = np.empty(new_data_shape)
+
+    new_cube = iris.cube.Cube(new_data)
     new_cube.metadata = cube.metadata
 
     # Derive the mapping from the non-trajectory source dimensions to their
@@ -309,36 +335,15 @@ def interpolate(cube, sample_points, method=None):
     for factory in cube.aux_factories:
         new_cube.add_aux_factory(factory.updated(coord_mapping))
 
-    # Are the given coords all 1-dimensional? (can we do linear interp?)
-    for coord, values in sample_points:
-        if coord.ndim > 1:
-            if method == "linear":
-                msg = "Cannot currently perform linear interpolation for " \
-                      "multi-dimensional coordinates."
-                raise iris.exceptions.CoordinateMultiDimError(msg)
-            method = "nearest"
-            break
-
     if method in ["linear", None]:
-        for i in range(trajectory_size):
-            point = [(coord, values[i]) for coord, values in sample_points]
-            column = cube.interpolate(point, Linear())
-            new_cube.data[..., i] = column.data
-            # Fill in the empty squashed (non derived) coords.
-            for column_coord in column.dim_coords + column.aux_coords:
-                src_dims = cube.coord_dims(column_coord)
-                if not squish_my_dims.isdisjoint(src_dims):
-                    if len(column_coord.points) != 1:
-                        msg = "Expected to find exactly one point. Found {}."
-                        raise Exception(msg.format(column_coord.points))
-                    new_cube.coord(column_coord.name()).points[i] = \
-                        column_coord.points[0]
+        # Fill in the empty squashed (non derived) coords.
+        _fill_linear_trajectory_coords(cube, coord_mapping, interpolator,
+                                       sample_points, sample_values,
+                                       squish_my_dims)
 
     elif method == "nearest":
-        # Use a cache with _nearest_neighbour_indices_ndcoords()
-        cache = {}
         column_indexes = _nearest_neighbour_indices_ndcoords(
-            cube, sample_points, cache=cache)
+            cube, sample_points)
 
         # Construct "fancy" indexes, so we can create the result data array in
         # a single numpy indexing operation.
@@ -447,6 +452,100 @@ def interpolate(cube, sample_points, method=None):
     return new_cube
 
 
+def _trajectory_interpolator(cube, sample_points, sample_dims):
+    """
+    Construct a single linear interpolator over just the sampled dimensions
+    of the cube.
+
+    Returns:
+        The interpolator, and the sample point values for each of the sample
+        coordinates, converted to their canonical (numeric) form.
+
+    """
+    # Make a cube which spans only the sampled dimensions.
+    # The interpolator never uses its data payload, so replace that with a
+    # cheap placeholder rather than realising any lazy source data.
+    grid_index = tuple(slice(None) if dim in sample_dims else 0
+                       for dim in range(cube.ndim))
+    grid_cube = cube[grid_index]
+    grid_cube = grid_cube.copy(data=np.zeros(grid_cube.shape, dtype=bool))
+
+    coords = [coord for coord, _ in sample_points]
+    interpolator = Linear().interpolator(grid_cube, coords)
+    sample_values = _canonical_sample_points(
+        interpolator.coords, [values for _, values in sample_points])
+    return interpolator, sample_values
+
+
+def _linear_trajectory_data(cube, interpolator, sample_values, sample_dims):
+    """
+    Linearly interpolate the cube data at all of the trajectory points.
+
+    The result has the non-sampled dimensions of the cube, in their original
+    order, followed by a trajectory dimension.
+    It is lazy if the cube has lazy data.
+
+    """
+    sample_dims = sorted(sample_dims)
+    remaining_dims = [dim for dim in range(cube.ndim)
+                      if dim not in sample_dims]
+    n_sample_dims = len(sample_dims)
+    n_points = len(sample_values[0])
+    # NOTE: the result is always floating point, as it has been historically.
+    dtype = np.result_type(np.float64, cube.dtype)
+
+    def interpolate_block(block):
+        result = interpolator._trajectory_points(sample_values, block)
+        # Move the trajectory dimension to the end.
+        return np.moveaxis(result, 0, -1).astype(dtype)
+
+    # Move the sampled dimensions to the front, to suit the interpolator.
+    data = cube.core_data().transpose(sample_dims + remaining_dims)
+    if is_lazy_data(data):
+        # Each block must span the whole of the sampled dimensions.
+        data = data.rechunk({dim: -1 for dim in range(n_sample_dims)})
+        chunks = data.chunks[n_sample_dims:] + ((n_points,),)
+        result = da.map_blocks(interpolate_block, data,
+                               chunks=chunks, dtype=dtype,
+                               drop_axis=list(range(n_sample_dims)),
+                               new_axis=len(remaining_dims))
+    else:
+        result = interpolate_block(data)
+    return result
+
+
+def _fill_linear_trajectory_coords(cube, coord_mapping, interpolator,
+                                   sample_points, sample_values, sample_dims):
+    """
+    Fill in the points of the new coordinates which map to the trajectory
+    dimension, for a linear trajectory interpolation.
+
+    """
+    sample_dims = sorted(sample_dims)
+    grid_shape = tuple(cube.shape[dim] for dim in sample_dims)
+    sample_coords = [coord for coord, _ in sample_points]
+    for coord in cube.dim_coords + cube.aux_coords:
+        src_dims = cube.coord_dims(coord)
+        if not src_dims or not set(src_dims).issubset(sample_dims):
+            if set(src_dims).intersection(sample_dims):
+                msg = ('Coord {!r} spans dimensions which are not sampled, '
+                       'so cannot be interpolated along the trajectory.')
+                raise ValueError(msg.format(coord.name()))
+            continue
+
+        if coord in sample_coords:
+            points = sample_values[sample_coords.index(coord)]
+        else:
+            # Interpolate the coordinate points, as for the data.
+            grid_dims = [sample_dims.index(dim) for dim in src_dims]
+            grid_points = iris.util.broadcast_to_shape(coord.points,
+                                                       grid_shape, grid_dims)
+            points = interpolator._trajectory_points(sample_values,
+                                                     grid_points)
+        new_coord = coord_mapping[id(coord)]
+        new_coord.points = np.asarray(points).astype(new_coord.dtype)
+
+
 def _ll_to_cart(lon, lat):
     # Based on cartopy.img_transform.ll_to_cart().
     x = np.sin(np.deg2rad(90 - lat)) * np.cos(np.deg2rad(lon))
@@ -488,25 +587,68 @@ def _cartesian_sample_points(sample_points, sample_point_coord_names):
     if i_lat is None or i_lon is None:
         return sample_points.transpose()
 
-    num_points = len(sample_points[0])
-    cartesian_points = [None] * num_points
+    # Get the point coordinates without the latlon, and add cartesian xyz
+    # coordinates from latlon.
+    x, y, z = _ll_to_cart(sample_points[i_lon], sample_points[i_lat])
+    cartesian_points = [sample_points[c] for c in i_non_latlon] + [x, y, z]
+    return np.column_stack(cartesian_points)
 
-    # Get the point coordinates without the latlon
-    for p in range(num_points):
-        cartesian_points[p] = [sample_points[c][p] for c in i_non_latlon]
 
-    # Add cartesian xyz coordinates from latlon
-    x, y, z = _ll_to_cart(sample_points[i_lon], sample_points[i_lat])
-    for p in range(num_points):
-        cartesian_point = cartesian_points[p]
-        cartesian_point.append(x[p])
-        cartesian_point.append(y[p])
-        cartesian_point.append(z[p])
+def _array_digest(hasher, array):
+    # Feed the content and structure of an array into a hash object.
+    array = np.ascontiguousarray(array)
+    hasher.update(str((array.dtype.str, array.shape)).encode('utf-8'))
+    hasher.update(array.tobytes())
 
-    return cartesian_points
 
+def _sample_space_key(sample_space_coords_and_dims, sample_space_shape):
+    """
+    Return a key identifying a nearest-neighbour sample space.
+
+    The key depends only on the sampling coordinates and their dimensions,
+    so it is the same for any cubes defined on the same grid.
 
-def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
+    """
+    hasher = hashlib.sha1()
+    hasher.update(str(sample_space_shape).encode('utf-8'))
+    for coord, dims in sample_space_coords_and_dims:
+        hasher.update(str((coord.name(), dims)).encode('utf-8'))
+        _array_digest(hasher, coord.points)
+    return hasher.hexdigest()
+
+
+# The KD-trees of the points of nearest-neighbour sample spaces, keyed on
+# :func:`_sample_space_key`, and the nearest-neighbour search results, keyed
+# on the sample space and the sample points.  These are shared by all the
+# cubes on the same grid.
+_kdtree_cache = iris.util._LRUCache(8)
+_nn_indices_cache = iris.util._LRUCache(64)
+
+
+def _load_cached(cache_dir, filename):
+    # Return the array stored in a cache file, or None if there isn't one.
+    # Pickled content is refused, so that a cache file cannot run code.
+    result = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, filename)
+        if os.path.exists(path):
+            result = np.load(path, allow_pickle=False)
+    return result
+
+
+def _save_cached(cache_dir, filename, array):
+    # Store an array in a cache file, if caching to disk is enabled.
+    # The file is written under a temporary name and then renamed, so that
+    # concurrent readers never see a partial file.
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, filename)
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temp_path, 'wb') as cache_file:
+            np.save(cache_file, array, allow_pickle=False)
+        os.rename(temp_path, path)
+
+
+def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache_dir=None):
     """
     Returns the indices to select the data value(s) closest to the given
     coordinate point values.
@@ -518,7 +660,10 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
     and can currently only do nearest neighbour interpolation.
 
     Because this function can be slow for multidimensional coordinates,
-    a 'cache' dictionary can be provided by the calling code.
+    the search trees and the search results of recent calls are kept in
+    memory, keyed on the sampling coordinates and sample points, so they
+    are re-used by later calls for any cube on the same grid.  A
+    'cache_dir' can also be given, to save the search results in files.
 
     .. Note::
 
@@ -596,52 +741,66 @@ def _nearest_neighbour_indices_ndcoords(cube, sample_points, cache=None):
         [(coord, sample_space_cube.coord_dims(coord))
          for coord in sample_space_coords]
 
-    if cache is not None and cube in cache:
-        kdtree = cache[cube]
-    else:
-        # Create a "sample space position" for each
-        # `datum.sample_space_data_positions[coord_index][datum_index]`.
-        sample_space_data_positions = \
-            np.empty((len(sample_space_coords_and_dims),
-                      sample_space_cube.data.size),
-                     dtype=float)
-        for d, ndi in enumerate(np.ndindex(sample_space_cube.data.shape)):
+    sample_space_shape = sample_space_cube.shape
+    grid_key = _sample_space_key(sample_space_coords_and_dims,
+                                 sample_space_shape)
+    hasher = hashlib.sha1(grid_key.encode('utf-8'))
+    _array_digest(hasher, coord_values)
+    points_key = hasher.hexdigest()
+    indices_filename = 'nn_indices_{}.npy'.format(points_key)
+
+    datum_index_lists = _nn_indices_cache.get(points_key)
+    if datum_index_lists is None:
+        datum_index_lists = _load_cached(cache_dir, indices_filename)
+    if datum_index_lists is None:
+        kdtree = _kdtree_cache.get(grid_key)
+        if kdtree is None:
+            # Create a "sample space position" for each
+            # `datum.sample_space_data_positions[coord_index][datum_index]`.
+            sample_space_data_positions = \
+                np.empty((len(sample_space_coords_and_dims),
+                          np.prod(sample_space_shape, dtype=int)),
+                         dtype=float)
             for c, (coord, coord_dims) in \
                     enumerate(sample_space_coords_and_dims):
-                # Index of this datum along this coordinate (could be nD).
+                # Position of each datum along this coordinate (could be nD).
+                positions = coord.points
                 if coord_dims:
-                    keys = tuple(ndi[ind] for ind in coord_dims)
-                else:
-                    keys = slice(None, None)
-                # Position of this datum along this coordinate.
-                sample_space_data_positions[c][d] = coord.points[keys]
-
-        # Convert to cartesian coordinates. Flatten for kdtree compatibility.
-        cartesian_space_data_coords = \
-            _cartesian_sample_points(sample_space_data_positions,
-                                     sample_point_coord_names)
-
-        # Create a kdtree for the nearest-distance lookup to these 3d points.
-        kdtree = cKDTree(cartesian_space_data_coords)
-        # This can find the nearest datum point to any given target point,
-        # which is the goal of this function.
-
-    # Update cache.
-    if cache is not None:
-        cache[cube] = kdtree
-
-    # Convert the sample points to cartesian (3d) coords.
-    # If there is no latlon within the coordinate there will be no change.
-    # Otherwise, geographic latlon is replaced with cartesian xyz.
-    cartesian_sample_points = _cartesian_sample_points(
-        coord_values, sample_point_coord_names)
-
-    # Use kdtree to get the nearest sourcepoint index for each target point.
-    _, datum_index_lists = kdtree.query(cartesian_sample_points)
+                    positions = iris.util.broadcast_to_shape(
+                        positions, sample_space_shape, coord_dims).ravel()
+                sample_space_data_positions[c] = positions
+
+            # Convert to cartesian coordinates. Flatten for kdtree
+            # compatibility.
+            cartesian_space_data_coords = \
+                _cartesian_sample_points(sample_space_data_positions,
+                                         sample_point_coord_names)
+
+            # Create a kdtree for the nearest-distance lookup to these 3d
+            # points.
+            kdtree = cKDTree(cartesian_space_data_coords)
+            # This can find the nearest datum point to any given target
+            # point, which is the goal of this function.
+            _kdtree_cache[grid_key] = kdtree
+
+        # Convert the sample points to cartesian (3d) coords.
+        # If there is no latlon within the coordinate there will be no
+        # change.
+        # Otherwise, geographic latlon is replaced with cartesian xyz.
+        cartesian_sample_points = _cartesian_sample_points(
+            coord_values, sample_point_coord_names)
+
+        # Use kdtree to get the nearest sourcepoint index for each target
+        # point.
+        _, datum_index_lists = kdtree.query(cartesian_sample_points)
+        _save_cached(cache_dir, indices_filename, datum_index_lists)
+    # The cached results are shared, so must not be modified.
+    datum_index_lists.flags.writeable = False
+    _nn_indices_cache[points_key] = datum_index_lists
 
     # Convert flat indices back into multidimensional sample-space indices.
     sample_space_dimension_indices = np.unravel_index(
-        datum_index_lists, sample_space_cube.data.shape)
+        datum_index_lists, sample_space_shape)
     # Convert this from "pointwise list of index arrays for each dimension",
     # to "list of cube indices for each point".
     sample_space_ndis = np.array(sample_space_dimension_indices).transpose()
@@ -679,9 +838,7 @@ class UnstructuredNearestNeigbourRegridder(object):
     regridding scheme.
 
     """
-    # TODO: cache the necessary bits of the operation so re-use can actually
-    # be more efficient.
-    def __init__(self, src_cube, target_grid_cube):
+    def __init__(self, src_cube, target_grid_cube, cache_dir=None):
         """
         A nearest-neighbour regridder to perform regridding from the source
         grid to the target grid.
@@ -703,6 +860,14 @@ class UnstructuredNearestNeigbourRegridder(object):
             coordinates, mapped to different dimensions.
             All other cube components are ignored.
 
+        Kwargs:
+
+        * cache_dir:
+            An existing directory in which to save the nearest-neighbour
+            search results, so that later regridders between the same grids
+            can re-use them.  Defaults to None, meaning that
+            nothing is saved.
+
         Returns:
             regridder : (object)
 
@@ -794,11 +959,22 @@ class UnstructuredNearestNeigbourRegridder(object):
         self.trajectory = ((tgt_x_coord.name(), x_2d.flatten()),
                            (tgt_y_coord.name(), y_2d.flatten()))
 
+        # Find the nearest source point to each target point, once only.
+        # Record these as flat indices into the source grid, i.e. into the
+        # points arrays of the source X and Y coordinates.
+        column_indexes = _nearest_neighbour_indices_ndcoords(
+            src_cube, self.trajectory, cache_dir=cache_dir)
+        src_xy_dims = src_cube.coord_dims(src_x_coord)
+        src_xy_indices = [[column_index[dim]
+                           for column_index in column_indexes]
+                          for dim in src_xy_dims]
+        self._gather_indices = np.ravel_multi_index(src_xy_indices,
+                                                    src_x_coord.shape)
+
     def __call__(self, src_cube):
         # Check the source cube X and Y coords match the original.
-        # Note: for now, this is sufficient to ensure a valid trajectory
-        # interpolation, but if in future we save + re-use the cache context
-        # for the 'interpolate' call, we may need more checks here.
+        # Note: this is sufficient to ensure that the pre-calculated gather
+        # indices are valid.
 
         # Check the given cube against the original.
         x_cos = src_cube.coords(axis='x')
@@ -810,42 +986,61 @@ class UnstructuredNearestNeigbourRegridder(object):
                    'grid as this regridder.')
             raise ValueError(msg)
 
-        # Convert source XY coordinates to degrees if required.
-        if self.grid_is_latlon:
-            src_cube = src_cube.copy()
-            src_cube.coord(axis='x').convert_units('degrees')
-            src_cube.coord(axis='y').convert_units('degrees')
-
-        # Get the basic interpolated results.
-        result_trajectory_cube = interpolate(src_cube, self.trajectory,
-                                             method='nearest')
+        # Flatten the source grid dimensions into a single last dimension,
+        # in the same order as the source grid coordinates.
+        src_xy_dims = src_cube.coord_dims(x_cos[0])
+        other_dims = [dim for dim in range(src_cube.ndim)
+                      if dim not in src_xy_dims]
+        data = src_cube.core_data().transpose(other_dims + list(src_xy_dims))
+        data = data.reshape(data.shape[:len(other_dims)] + (-1,))
+
+        # Select the nearest source points for the whole target grid.
+        # The result dimensions are the other source dimensions, followed by
+        # the target grid dimensions.
+        if is_lazy_data(data):
+            # Each block must span the whole source grid.
+            data = data.rechunk({data.ndim - 1: -1})
+            chunks = data.chunks[:-1] + tuple((length,) for length in
+                                              self.tgt_grid_shape)
+            data = da.map_blocks(_gather_grid_points, data,
+                                 self._gather_indices, self.tgt_grid_shape,
+                                 chunks=chunks, dtype=data.dtype,
+                                 new_axis=data.ndim)
+        else:
+            data = _gather_grid_points(data, self._gather_indices,
+                                       self.tgt_grid_shape)
 
-        # Reconstruct this as a cube "like" the source data.
+        # Make a new result cube with the regridded data.
         # TODO: handle all aux-coords, cell measures ??
-
-        # The shape is that of the basic result, minus the trajectory (last)
-        # dimension, plus the target grid dimensions.
-        target_shape = result_trajectory_cube.shape[:-1] + self.tgt_grid_shape
-        data_2d_x_and_y = result_trajectory_cube.data.reshape(target_shape)
-
-        # Make a new result cube with the reshaped data.
-        result_cube = iris.cube.Cube(data_2d_x_and_y)
+        result_cube = iris.cube.Cube(data)
         result_cube.metadata = src_cube.metadata
 
-        # Copy all the coords from the trajectory result.
-        i_trajectory_dim = result_trajectory_cube.ndim - 1
-        for coord in result_trajectory_cube.dim_coords:
-            dims = result_trajectory_cube.coord_dims(coord)
-            if i_trajectory_dim not in dims:
+        # Copy all the coords which do not map to the source grid.
+        dimension_remap = {dim: i for i, dim in enumerate(other_dims)}
+        for coord in src_cube.dim_coords:
+            dims = src_cube.coord_dims(coord)
+            if set(src_xy_dims).isdisjoint(dims):
+                dims = [dimension_remap[dim] for dim in dims]
                 result_cube.add_dim_coord(coord.copy(), dims)
-        for coord in result_trajectory_cube.aux_coords:
-            dims = result_trajectory_cube.coord_dims(coord)
-            if i_trajectory_dim not in dims:
+        for coord in src_cube.aux_coords:
+            dims = src_cube.coord_dims(coord)
+            if set(src_xy_dims).isdisjoint(dims):
+                dims = [dimension_remap[dim] for dim in dims]
                 result_cube.add_aux_coord(coord.copy(), dims)
 
         # Add the X+Y grid coords from the grid cube, mapped to the new Y and X
         # dimensions, i.e. the last 2.
         for i_dim, coord in enumerate(self.tgt_grid_coords):
-            result_cube.add_dim_coord(coord.copy(), i_dim + i_trajectory_dim)
+            result_cube.add_dim_coord(coord.copy(), i_dim + len(other_dims))
 
         return result_cube
+
+
+def _gather_grid_points(data, indices, grid_shape):
+    """
+    Select points from the last dimension of an array, and reshape them into
+    a grid.
+
+    """
+    result = data.take(indices, axis=-1)
+    return result.reshape(data.shape[:-1] + grid_shape)
@@ -24,15 +24,76 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import six
 
 from abc import ABCMeta, abstractmethod, abstractproperty
+import functools
 import warnings
 
 import dask.array as da
 import numpy as np
 
 from iris._cube_coord_common import CFVariableMixin
+from iris._lazy_data import _limited_shape, is_lazy_data
 import iris.coords
 
 
+def _memoised_make_coord(make_coord):
+    """
+    Decorate the :meth:`AuxCoordFactory.make_coord` method of a factory
+    class, so that the lazy derived points and bounds are only rebuilt when
+    the dependencies of the factory change.
+
+    A dependency changes when it is replaced by another coordinate, for
+    example by :meth:`AuxCoordFactory.update`, when its points or bounds are
+    replaced, or when it maps to different cube dimensions.
+    Each call still returns a new coordinate, with the current metadata of
+    the factory.
+
+    """
+    @functools.wraps(make_coord)
+    def wrapper(self, coord_dims_func):
+        key = self._dependency_state(coord_dims_func)
+        cached = self.__dict__.get('_derived_coord_cache')
+        if cached is None or not _same_dependency_state(cached[0], key):
+            cached = (key, make_coord(self, coord_dims_func))
+            self._derived_coord_cache = cached
+        derived_coord = cached[1]
+        return iris.coords.AuxCoord(derived_coord.core_points(),
+                                    standard_name=self.standard_name,
+                                    long_name=self.long_name,
+                                    var_name=self.var_name,
+                                    units=self.units,
+                                    bounds=derived_coord.core_bounds(),
+                                    attributes=self.attributes,
+                                    coord_system=self.coord_system)
+    return wrapper
+
+
+def _same_array(array, other):
+    # Whether two arrays from `core_points` or `core_bounds` are the same
+    # lazy array, or views of the same memory, without comparing any values.
+    if array is None or other is None or is_lazy_data(array):
+        result = array is other
+    else:
+        result = (not is_lazy_data(other) and
+                  array.__array_interface__ == other.__array_interface__)
+    return result
+
+
+def _same_dependency_state(state, other):
+    result = len(state) == len(other)
+    if result:
+        for item, other_item in zip(state, other):
+            key, coord, points, bounds, dims = item
+            other_key, other_coord, other_points, other_bounds, other_dims = \
+                other_item
+            if (key != other_key or coord is not other_coord or
+                    not _same_array(points, other_points) or
+                    not _same_array(bounds, other_bounds) or
+                    dims != other_dims):
+                result = False
+                break
+    return result
+
+
 class AuxCoordFactory(six.with_metaclass(ABCMeta, CFVariableMixin)):
     """
     Represents a "factory" which can manufacture an additional auxiliary
@@ -168,6 +229,27 @@ class AuxCoordFactory(six.with_metaclass(ABCMeta, CFVariableMixin)):
         element.appendChild(self.make_coord().xml_element(doc))
         return element
 
+    def __getstate__(self):
+        # Don't copy or pickle the memoised derived coordinate.
+        state = self.__dict__.copy()
+        state.pop('_derived_coord_cache', None)
+        return state
+
+    def _dependency_state(self, coord_dims_func):
+        """
+        Return a list which identifies the current dependency coordinates,
+        their points and bounds arrays, and their cube dimensions.
+
+        """
+        state = []
+        items = sorted(six.iteritems(self.dependencies),
+                       key=lambda item: item[0])
+        for key, coord in items:
+            if coord:
+                state.append((key, coord, coord.core_points(),
+                              coord.core_bounds(), coord_dims_func(coord)))
+        return state
+
     def _dependency_dims(self, coord_dims_func):
         dependency_dims = {}
         for key, coord in six.iteritems(self.dependencies):
@@ -251,6 +333,36 @@ class AuxCoordFactory(six.with_metaclass(ABCMeta, CFVariableMixin)):
             points = points[keys]
         return points
 
+    @staticmethod
+    def _rechunk(nd_values_by_key, with_bounds=False):
+        """
+        Rechunk the aligned lazy dependency arrays, so that combining them
+        produces a derived array with limited chunk sizes, instead of a
+        single chunk spanning the whole derived shape.
+
+        The chunks follow the same heuristic as
+        :func:`iris._lazy_data.as_lazy_data`, reducing the earlier
+        dimensions first.
+        When `with_bounds` is True, the final (bounds) dimension of each
+        array is never split.
+
+        """
+        arrays = [values for values in six.itervalues(nd_values_by_key)
+                  if is_lazy_data(values)]
+        if arrays:
+            shape = np.max([array.shape for array in arrays], axis=0)
+            if with_bounds:
+                chunks = _limited_shape(shape[:-1]) + (shape[-1],)
+            else:
+                chunks = _limited_shape(shape)
+            for key, values in six.iteritems(nd_values_by_key):
+                if is_lazy_data(values):
+                    values_chunks = tuple(
+                        int(chunk) if size > 1 else 1
+                        for chunk, size in zip(chunks, values.shape))
+                    nd_values_by_key[key] = values.rechunk(values_chunks)
+        return nd_values_by_key
+
     def _remap(self, dependency_dims, derived_dims):
         """
         Return a mapping from dependency names to coordinate points arrays.
@@ -287,7 +399,7 @@ class AuxCoordFactory(six.with_metaclass(ABCMeta, CFVariableMixin)):
                 nd_points = np.float16(0)
 
             nd_points_by_key[key] = nd_points
-        return nd_points_by_key
+        return self._rechunk(nd_points_by_key)
 
     def _remap_with_bounds(self, dependency_dims, derived_dims):
         """
@@ -346,7 +458,7 @@ class AuxCoordFactory(six.with_metaclass(ABCMeta, CFVariableMixin)):
                 nd_values = np.float16(0)
 
             nd_values_by_key[key] = nd_values
-        return nd_values_by_key
+        return self._rechunk(nd_values_by_key, with_bounds=True)
 
 
 class HybridHeightFactory(AuxCoordFactory):
@@ -415,6 +527,7 @@ class HybridHeightFactory(AuxCoordFactory):
     def _derive(self, delta, sigma, orography):
         return delta + sigma * orography
 
+    @_memoised_make_coord
     def make_coord(self, coord_dims_func):
         """
         Returns a new :class:`iris.coords.AuxCoord` as defined by this
@@ -601,6 +714,7 @@ class HybridPressureFactory(AuxCoordFactory):
     def _derive(self, delta, sigma, surface_air_pressure):
         return delta + sigma * surface_air_pressure
 
+    @_memoised_make_coord
     def make_coord(self, coord_dims_func):
         """
         Returns a new :class:`iris.coords.AuxCoord` as defined by this
@@ -853,6 +967,7 @@ class OceanSigmaZFactory(AuxCoordFactory):
                                 axis=z_dim)
         return result
 
+    @_memoised_make_coord
     def make_coord(self, coord_dims_func):
         """
         Returns a new :class:`iris.coords.AuxCoord` as defined by this factory.
@@ -1025,6 +1140,7 @@ class OceanSigmaFactory(AuxCoordFactory):
     def _derive(self, sigma, eta, depth):
         return eta + sigma * (depth + eta)
 
+    @_memoised_make_coord
     def make_coord(self, coord_dims_func):
         """
         Returns a new :class:`iris.coords.AuxCoord` as defined by this factory.
@@ -1207,6 +1323,7 @@ class OceanSg1Factory(AuxCoordFactory):
         S = depth_c * s + (depth - depth_c) * c
         return S + eta * (1 + S / depth)
 
+    @_memoised_make_coord
     def make_coord(self, coord_dims_func):
         """
         Returns a new :class:`iris.coords.AuxCoord` as defined by this factory.
@@ -1391,6 +1508,7 @@ class OceanSFactory(AuxCoordFactory):
              (da.tanh(a * (s + 0.5)) / (2 * da.tanh(0.5 * a)) - 0.5))
         return eta * (1 + s) + depth_c * s + (depth - depth_c) * c
 
+    @_memoised_make_coord
     def make_coord(self, coord_dims_func):
         """
         Returns a new :class:`iris.coords.AuxCoord` as defined by this factory.
@@ -1580,6 +1698,7 @@ class OceanSg2Factory(AuxCoordFactory):
         S = (depth_c * s + depth * c) / (depth_c + depth)
         return eta + (eta + depth) * S
 
+    @_memoised_make_coord
     def make_coord(self, coord_dims_func):
         """
         Returns a new :class:`iris.coords.AuxCoord` as defined by this factory.
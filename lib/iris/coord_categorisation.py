@@ -33,10 +33,39 @@ import six
 
 import calendar
 import collections
+import operator
 
 import numpy as np
 
 import iris.coords
+import iris.time
+
+
+# Use a common type for string categories (N.B. limited to 64 chars)
+_STRING_TYPE = '|S64' if six.PY2 else '|U64'
+
+
+def _check_categorisation(cube, name, from_coord):
+    # Interpret coord, if given as a name
+    if isinstance(from_coord, six.string_types):
+        from_coord = cube.coord(from_coord)
+
+    if len(cube.coords(name)) > 0:
+        msg = 'A coordinate "%s" already exists in the cube.' % name
+        raise ValueError(msg)
+    return from_coord
+
+
+def _add_categorised_values(cube, name, from_coord, values, units='1'):
+    # Add a new coordinate to a cube, with the given category values for
+    # the points of 'from_coord'.
+    new_coord = iris.coords.AuxCoord(values,
+                                     units=units,
+                                     attributes=from_coord.attributes.copy())
+    new_coord.rename(name)
+
+    # Add into the cube
+    cube.add_aux_coord(new_coord, cube.coord_dims(from_coord))
 
 
 def add_categorised_coord(cube, name, from_coord, category_function,
@@ -64,13 +93,7 @@ def add_categorised_coord(cube, name, from_coord, category_function,
     * units:
         units of the category value, typically 'no_unit' or '1'.
     """
-    # Interpret coord, if given as a name
-    if isinstance(from_coord, six.string_types):
-        from_coord = cube.coord(from_coord)
-
-    if len(cube.coords(name)) > 0:
-        msg = 'A coordinate "%s" already exists in the cube.' % name
-        raise ValueError(msg)
+    from_coord = _check_categorisation(cube, name, from_coord)
 
     # Construct new coordinate by mapping values, using numpy.vectorize to
     # support multi-dimensional coords.
@@ -79,22 +102,15 @@ def add_categorised_coord(cube, name, from_coord, category_function,
     result = category_function(from_coord, from_coord.points.ravel()[0])
     if isinstance(result, six.string_types):
         str_vectorised_fn = np.vectorize(category_function, otypes=[object])
-        # Use a common type for string arrays (N.B. limited to 64 chars)
-        all_cases_string_type = '|S64' if six.PY2 else '|U64'
 
         def vectorised_fn(*args):
-            return str_vectorised_fn(*args).astype(all_cases_string_type)
+            return str_vectorised_fn(*args).astype(_STRING_TYPE)
 
     else:
         vectorised_fn = np.vectorize(category_function)
-    new_coord = iris.coords.AuxCoord(vectorised_fn(from_coord,
-                                                   from_coord.points),
-                                     units=units,
-                                     attributes=from_coord.attributes.copy())
-    new_coord.rename(name)
-
-    # Add into the cube
-    cube.add_aux_coord(new_coord, cube.coord_dims(from_coord))
+    _add_categorised_values(cube, name, from_coord,
+                            vectorised_fn(from_coord, from_coord.points),
+                            units=units)
 
 
 # ======================================
@@ -113,11 +129,11 @@ def _pt_date(coord, time):
 
     * coord (Coord):
         coordinate (must be Time-type)
-    * time (float):
-        value of a coordinate point
+    * time (float or array):
+        value of a coordinate point, or an array of them
 
     Returns:
-        datetime.date
+        datetime.date, or an array of them
     """
     # NOTE: All of the currently defined categorisation functions are
     # calendar operations on Time coordinates.
@@ -127,44 +143,112 @@ def _pt_date(coord, time):
     return coord.units.num2date(time)
 
 
+# The date-time attributes which are not common to datetime.datetime and
+# cftime.datetime objects.
+_DATE_FIELD_GETTERS = {
+    # Note: cftime.datetime objects return a normal tuple from timetuple(),
+    # unlike datetime.datetime objects that return a namedtuple.
+    # Index the time tuple (element 6 is day of week and element 7 is day of
+    # year) instead of using named elements tm_wday and tm_yday.
+    'dayofyr': lambda date: date.timetuple()[7],
+    'dayofwk': lambda date: date.timetuple()[6]}
+
+
+def _date_fields(coord, *names):
+    """
+    Return the named calendar fields of all the points of a time
+    coordinate, as integer arrays of the same shape as the points.
+
+    The fields are calculated directly from the points where the calendar
+    allows, and otherwise from a single conversion of all the points to
+    date-times.
+
+    """
+    points = coord.points
+    fields = iris.time._calendar_fields(points, coord.units) or {}
+    missing = [name for name in names if name not in fields]
+    if missing:
+        dates = np.asarray(_pt_date(coord, points)).ravel()
+        for name in missing:
+            getter = _DATE_FIELD_GETTERS.get(name,
+                                             operator.attrgetter(name))
+            values = np.array([getter(date) for date in dates], dtype=int)
+            fields[name] = values.reshape(points.shape)
+    return [fields[name] for name in names]
+
+
+def _add_labelled_values(cube, name, from_coord, labels, codes,
+                         categorical=False):
+    # Add a new string coordinate to a cube, with the labels indexed by an
+    # array of integer codes.  If 'categorical', the points are held as the
+    # codes and a lookup table of the labels, rather than as full strings.
+    labels = np.array(labels, dtype=_STRING_TYPE)
+    if categorical:
+        new_coord = iris.coords.AuxCoord.from_categories(
+            labels, codes, units='no_unit',
+            attributes=from_coord.attributes.copy())
+        new_coord.rename(name)
+        cube.add_aux_coord(new_coord, cube.coord_dims(from_coord))
+    else:
+        _add_categorised_values(cube, name, from_coord, labels[codes],
+                                units='no_unit')
+
+
+def _add_date_field(cube, coord, name, field):
+    coord = _check_categorisation(cube, name, coord)
+    values, = _date_fields(coord, field)
+    _add_categorised_values(cube, name, coord, values)
+
+
+def _add_date_label(cube, coord, name, field, labels, categorical):
+    coord = _check_categorisation(cube, name, coord)
+    codes, = _date_fields(coord, field)
+    _add_labelled_values(cube, name, coord, labels, codes,
+                         categorical=categorical)
+
+
 # --------------------------------------------
 # Time categorisations : calendar date components
 
 def add_year(cube, coord, name='year'):
     """Add a categorical calendar-year coordinate."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).year)
+    _add_date_field(cube, coord, name, 'year')
 
 
 def add_month_number(cube, coord, name='month_number'):
     """Add a categorical month coordinate, values 1..12."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).month)
+    _add_date_field(cube, coord, name, 'month')
+
+
+def add_month_fullname(cube, coord, name='month_fullname', categorical=False):
+    """
+    Add a categorical month coordinate, values 'January'..'December'.
+
+    If `categorical` is True, the points are held compactly as integer
+    codes into a table of the labels (see
+    :meth:`iris.coords.AuxCoord.from_categories`).
+
+    """
+    _add_date_label(cube, coord, name, 'month', list(calendar.month_name),
+                    categorical)
 
 
-def add_month_fullname(cube, coord, name='month_fullname'):
-    """Add a categorical month coordinate, values 'January'..'December'."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: calendar.month_name[_pt_date(coord, x).month],
-        units='no_unit')
+def add_month(cube, coord, name='month', categorical=False):
+    """
+    Add a categorical month coordinate, values 'Jan'..'Dec'.
 
+    If `categorical` is True, the points are held compactly as integer
+    codes into a table of the labels (see
+    :meth:`iris.coords.AuxCoord.from_categories`).
 
-def add_month(cube, coord, name='month'):
-    """Add a categorical month coordinate, values 'Jan'..'Dec'."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: calendar.month_abbr[_pt_date(coord, x).month],
-        units='no_unit')
+    """
+    _add_date_label(cube, coord, name, 'month', list(calendar.month_abbr),
+                    categorical)
 
 
 def add_day_of_month(cube, coord, name='day_of_month'):
     """Add a categorical day-of-month coordinate, values 1..31."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).day)
+    _add_date_field(cube, coord, name, 'day')
 
 
 def add_day_of_year(cube, coord, name='day_of_year'):
@@ -173,13 +257,7 @@ def add_day_of_year(cube, coord, name='day_of_year'):
     (1..366 in leap years).
 
     """
-    # Note: cftime.datetime objects return a normal tuple from timetuple(),
-    # unlike datetime.datetime objects that return a namedtuple.
-    # Index the time tuple (element 7 is day of year) instead of using named
-    # element tm_yday.
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).timetuple()[7])
+    _add_date_field(cube, coord, name, 'dayofyr')
 
 
 # --------------------------------------------
@@ -187,25 +265,34 @@ def add_day_of_year(cube, coord, name='day_of_year'):
 
 def add_weekday_number(cube, coord, name='weekday_number'):
     """Add a categorical weekday coordinate, values 0..6  [0=Monday]."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).weekday())
+    _add_date_field(cube, coord, name, 'dayofwk')
 
 
-def add_weekday_fullname(cube, coord, name='weekday_fullname'):
-    """Add a categorical weekday coordinate, values 'Monday'..'Sunday'."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: calendar.day_name[_pt_date(coord, x).weekday()],
-        units='no_unit')
+def add_weekday_fullname(cube, coord, name='weekday_fullname',
+                         categorical=False):
+    """
+    Add a categorical weekday coordinate, values 'Monday'..'Sunday'.
+
+    If `categorical` is True, the points are held compactly as integer
+    codes into a table of the labels (see
+    :meth:`iris.coords.AuxCoord.from_categories`).
 
+    """
+    _add_date_label(cube, coord, name, 'dayofwk', list(calendar.day_name),
+                    categorical)
 
-def add_weekday(cube, coord, name='weekday'):
-    """Add a categorical weekday coordinate, values 'Mon'..'Sun'."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: calendar.day_abbr[_pt_date(coord, x).weekday()],
-        units='no_unit')
+
+def add_weekday(cube, coord, name='weekday', categorical=False):
+    """
+    Add a categorical weekday coordinate, values 'Mon'..'Sun'.
+
+    If `categorical` is True, the points are held compactly as integer
+    codes into a table of the labels (see
+    :meth:`iris.coords.AuxCoord.from_categories`).
+
+    """
+    _add_date_label(cube, coord, name, 'dayofwk', list(calendar.day_abbr),
+                    categorical)
 
 
 # --------------------------------------------
@@ -213,9 +300,7 @@ def add_weekday(cube, coord, name='weekday'):
 
 def add_hour(cube, coord, name='hour'):
     """Add a categorical hour coordinate, values 0..23."""
-    add_categorised_coord(
-        cube, name, coord,
-        lambda coord, x: _pt_date(coord, x).hour)
+    _add_date_field(cube, coord, name, 'hour')
 
 
 # ----------------------------------------------
@@ -296,7 +381,7 @@ def _month_season_numbers(seasons):
 
 
 def add_season(cube, coord, name='season',
-               seasons=('djf', 'mam', 'jja', 'son')):
+               seasons=('djf', 'mam', 'jja', 'son'), categorical=False):
     """
     Add a categorical season-of-year coordinate, with user specified
     seasons.
@@ -317,6 +402,10 @@ def add_season(cube, coord, name='season',
         List of seasons defined by month abbreviations. Each month must
         appear once and only once. Defaults to standard meteorological
         seasons ('djf', 'mam', 'jja', 'son').
+    * categorical (bool):
+        If True, hold the points compactly as integer codes into a table of
+        the seasons (see :meth:`iris.coords.AuxCoord.from_categories`).
+        Defaults to False.
 
     """
     # Check that the seasons are valid.
@@ -325,13 +414,12 @@ def add_season(cube, coord, name='season',
     # as the indices.
     month_season_numbers = _month_season_numbers(seasons)
 
-    # Define a categorisation function.
-    def _season(coord, value):
-        dt = _pt_date(coord, value)
-        return seasons[month_season_numbers[dt.month]]
-
     # Apply the categorisation.
-    add_categorised_coord(cube, name, coord, _season, units='no_unit')
+    coord = _check_categorisation(cube, name, coord)
+    month, = _date_fields(coord, 'month')
+    season_numbers = np.array(month_season_numbers[1:])[month - 1]
+    _add_labelled_values(cube, name, coord, seasons, season_numbers,
+                         categorical=categorical)
 
 
 def add_season_number(cube, coord, name='season_number',
@@ -364,13 +452,11 @@ def add_season_number(cube, coord, name='season_number',
     # as the indices.
     month_season_numbers = _month_season_numbers(seasons)
 
-    # Define a categorisation function.
-    def _season_number(coord, value):
-        dt = _pt_date(coord, value)
-        return month_season_numbers[dt.month]
-
     # Apply the categorisation.
-    add_categorised_coord(cube, name, coord, _season_number)
+    coord = _check_categorisation(cube, name, coord)
+    month, = _date_fields(coord, 'month')
+    _add_categorised_values(cube, name, coord,
+                            np.array(month_season_numbers[1:])[month - 1])
 
 
 def add_season_year(cube, coord, name='season_year',
@@ -402,15 +488,11 @@ def add_season_year(cube, coord, name='season_year',
     # Define the adjustments to be made to the year.
     month_year_adjusts = _month_year_adjusts(seasons)
 
-    # Define a categorisation function.
-    def _season_year(coord, value):
-        dt = _pt_date(coord, value)
-        year = dt.year
-        year += month_year_adjusts[dt.month]
-        return year
-
     # Apply the categorisation.
-    add_categorised_coord(cube, name, coord, _season_year)
+    coord = _check_categorisation(cube, name, coord)
+    year, month = _date_fields(coord, 'year', 'month')
+    year = year + np.array(month_year_adjusts[1:])[month - 1]
+    _add_categorised_values(cube, name, coord, year)
 
 
 def add_season_membership(cube, coord, season, name='season_membership'):
@@ -437,12 +519,10 @@ def add_season_membership(cube, coord, season, name='season_membership'):
         Name of the created coordinate. Defaults to "season_membership".
 
     """
-    months = _months_in_season(season)
-
-    def _season_membership(coord, value):
-        dt = _pt_date(coord, value)
-        if dt.month in months:
-            return True
-        return False
+    # A lookup table of membership, indexed by month number.
+    in_season = np.zeros(13, dtype=bool)
+    in_season[_months_in_season(season)] = True
 
-    add_categorised_coord(cube, name, coord, _season_membership)
+    coord = _check_categorisation(cube, name, coord)
+    month, = _date_fields(coord, 'month')
+    _add_categorised_values(cube, name, coord, in_season[month])
@@ -36,7 +36,7 @@ import cftime
 import numpy as np
 import numpy.ma as ma
 
-from iris._data_manager import DataManager
+from iris._data_manager import CategoricalDataManager, DataManager
 from iris._deprecation import warn_deprecated
 import iris._lazy_data as _lazy
 import iris.aux_factory
@@ -48,6 +48,59 @@ from iris._cube_coord_common import CFVariableMixin
 from iris.util import points_step
 
 
+def _is_basic_index(keys):
+    # Whether indexing with the keys only takes views, without reordering or
+    # repeating any values.
+    if not isinstance(keys, tuple):
+        keys = (keys,)
+    return all(isinstance(key, (six.integer_types, np.integer, slice)) and
+               not isinstance(key, (bool, np.bool_)) for key in keys)
+
+
+def _read_only_view(array, ndmin):
+    # Return a read-only view of a real array, or a lazy array, with at least
+    # `ndmin` dimensions, as `Coord._sanitise_array` but without any copying.
+    if _lazy.is_lazy_data(array):
+        ndims_missing = ndmin - array.ndim
+        if ndims_missing > 0:
+            array = array.reshape((1,) * ndims_missing + array.shape)
+    else:
+        array = np.array(array, ndmin=ndmin, copy=False).view()
+        array.flags.writeable = False
+    return array
+
+
+def _is_read_only(array):
+    # Whether the values of an array cannot change, as it is lazy, or as it
+    # and all the arrays whose memory it shares are read-only.
+    if _lazy.is_lazy_data(array):
+        return True
+    while isinstance(array, np.ndarray):
+        if array.flags.writeable:
+            return False
+        array = array.base
+    return array is None
+
+
+def _snapshot(array):
+    # Record an array, with a copy of its values if they could change.
+    values = None
+    if array is not None and not _is_read_only(array):
+        values = array.copy()
+    return array, values
+
+
+def _unchanged(snapshot, array, compare_values=True):
+    # Whether an array is the recorded array, with the recorded values.
+    # If `compare_values` is False, arrays whose values could have changed
+    # are treated as changed, rather than comparing the values.
+    recorded, values = snapshot
+    result = recorded is array
+    if result and values is not None:
+        result = compare_values and np.array_equal(values, array)
+    return result
+
+
 class CoordDefn(collections.namedtuple('CoordDefn',
                                        ['standard_name', 'long_name',
                                         'var_name', 'units',
@@ -443,6 +496,10 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
                     _MODE_MUL: '*', _MODE_DIV: '/',
                     _MODE_RDIV: '/'}
 
+    # The units, points and bounds from which the cell values were last
+    # decoded, and the decoded values: see `Coord._cell_values`.
+    _cell_values_cache = None
+
     def __init__(self, points, standard_name=None, long_name=None,
                  var_name=None, units='1', bounds=None, attributes=None,
                  coord_system=None):
@@ -518,8 +575,27 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
             indexing.
 
         """
-        # Fetch the points and bounds.
-        points = self._points_dm.core_data()
+        return self._getitem(keys)
+
+    def _getitem(self, keys, copy=True):
+        """
+        Index the coordinate, as for :meth:`__getitem__`.
+
+        If `copy` is False, and the keys only contain integers and slices,
+        the new coordinate shares its points and bounds with this coordinate
+        as read-only views, and they are not validated again, as such
+        indexing cannot break the validity of the values.
+
+        """
+        if not copy and _is_basic_index(keys):
+            return self._view(keys)
+
+        # Fetch the points, or the codes of categorical points, and bounds.
+        categorical = self._categorical_points()
+        if categorical is not None:
+            categories, points = categorical
+        else:
+            points = self._points_dm.core_data()
         if self.has_bounds():
             bounds = self._bounds_dm.core_data()
         else:
@@ -540,8 +616,45 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
 
         # The new coordinate is a copy of the old one with replaced content.
         new_coord = self.copy(points=points, bounds=bounds)
+        if categorical is not None:
+            codes = new_coord._points_dm.core_data()
+            new_coord._points_dm = CategoricalDataManager(categories, codes)
         return new_coord
 
+    def _view(self, keys):
+        # Make a new coordinate whose points and bounds are read-only views
+        # onto the indexed values of this coordinate, skipping the setters.
+        categorical = self._categorical_points()
+        if categorical is not None:
+            categories, points = categorical
+        else:
+            points = self._points_dm.core_data()
+        _, points = iris.util._slice_data_with_keys(points, keys)
+        points = _read_only_view(points, 1)
+        bounds = None
+        if self.has_bounds():
+            bounds = self._bounds_dm.core_data()
+            _, bounds = iris.util._slice_data_with_keys(bounds, keys)
+            bounds = _read_only_view(bounds, 2)
+
+        new_coord = copy.copy(self)
+        new_coord.attributes = copy.deepcopy(self.attributes)
+        if categorical is not None:
+            new_coord._points_dm = CategoricalDataManager(categories, points)
+        else:
+            new_coord._points_dm = DataManager(points)
+        new_coord._bounds_dm = None
+        if bounds is not None:
+            new_coord._bounds_dm = DataManager(bounds)
+        return new_coord
+
+    def __getstate__(self):
+        # Any decoded cell values are not copied or pickled with the
+        # coordinate, as they are cheaper to decode again when needed.
+        state = self.__dict__.copy()
+        state.pop('_cell_values_cache', None)
+        return state
+
     def copy(self, points=None, bounds=None):
         """
         Returns a copy of this coordinate.
@@ -627,14 +740,28 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
         # than the desired (1,).
         points = self._sanitise_array(points, 1)
 
-        # Set or update DataManager.
-        if self._points_dm is None:
+        # Set or update DataManager.  New points replace any categorical
+        # points entirely.
+        if (self._points_dm is None or
+                isinstance(self._points_dm, CategoricalDataManager)):
             self._points_dm = DataManager(points)
         else:
             self._points_dm.data = points
 
     points = property(_points_getter, _points_setter)
 
+    def _categorical_points(self):
+        """
+        Return the categories and the integer codes of the points, if the
+        points are held compactly as codes into a table of categories, or
+        None otherwise.
+
+        """
+        result = None
+        if isinstance(self._points_dm, CategoricalDataManager):
+            result = self._points_dm.categories, self._points_dm.codes
+        return result
+
     def _bounds_getter(self):
         """
         The coordinate bounds values, as a NumPy array,
@@ -817,7 +944,13 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
             eq = self._as_defn() == other._as_defn()
             # points comparison
             if eq:
-                eq = iris.util.array_equal(self.points, other.points)
+                if (isinstance(self._points_dm, CategoricalDataManager) and
+                        isinstance(getattr(other, '_points_dm', None),
+                                   CategoricalDataManager)):
+                    # Compare the codes of categorical points.
+                    eq = self._points_dm == other._points_dm
+                else:
+                    eq = iris.util.array_equal(self.points, other.points)
             # bounds comparison
             if eq:
                 if self.has_bounds() and other.has_bounds():
@@ -995,6 +1128,57 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
         """
         return _CellIterator(self)
 
+    def _core_arrays(self):
+        # The arrays managed for the points and bounds, rather than the views
+        # of them returned by `core_points` and `core_bounds`.
+        bounds = None
+        if self.has_bounds():
+            bounds = self._bounds_dm.core_data()
+        return self._points_dm.core_data(), bounds
+
+    def _cached_cell_values(self, compare_values=True):
+        # Return the cached cell values, or None if the units, points or
+        # bounds have changed since they were decoded.
+        result = None
+        cache = self._cell_values_cache
+        if cache is not None:
+            units, points, bounds, values = cache
+            core_points, core_bounds = self._core_arrays()
+            if (units == self.units and
+                    _unchanged(points, core_points, compare_values) and
+                    _unchanged(bounds, core_bounds, compare_values)):
+                result = values
+        return result
+
+    def _cell_values(self):
+        """
+        Return the points and bounds of all the cells of the coordinate, as
+        in the cells returned by :meth:`cell`.
+
+        For a time reference coordinate, the points and the bounds are each
+        decoded into date-times with a single conversion, and are cached
+        until the units, points or bounds of the coordinate change.
+
+        """
+        points = self.points
+        bounds = self.bounds
+        if not (iris.FUTURE.cell_datetime_objects and
+                self.units.is_time_reference()):
+            return points, bounds
+
+        values = self._cached_cell_values()
+        if values is None:
+            points = self.units.num2date(points)
+            points.flags.writeable = False
+            if bounds is not None:
+                bounds = self.units.num2date(bounds)
+                bounds.flags.writeable = False
+            values = points, bounds
+            core_points, core_bounds = self._core_arrays()
+            self._cell_values_cache = (self.units, _snapshot(core_points),
+                                       _snapshot(core_bounds), values)
+        return values
+
     def _sanity_check_bounds(self):
         if self.ndim == 1:
             if self.nbounds != 2:
@@ -1284,17 +1468,27 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
         """
         index = iris.util._build_full_slice_given_keys(index, self.ndim)
 
-        point = tuple(np.array(self.points[index], ndmin=1).flatten())
+        # Reuse any decoded cell values, unless checking that they are
+        # current would mean comparing all the points and bounds.
+        values = None
+        if iris.FUTURE.cell_datetime_objects:
+            values = self._cached_cell_values(compare_values=False)
+        if values is None:
+            points, bounds = self.points, self.bounds
+        else:
+            points, bounds = values
+
+        point = tuple(np.array(points[index], ndmin=1).flatten())
         if len(point) != 1:
             raise IndexError('The index %s did not uniquely identify a single '
                              'point to create a cell with.' % (index, ))
 
         bound = None
-        if self.has_bounds():
-            bound = tuple(np.array(self.bounds[index], ndmin=1).flatten())
+        if bounds is not None:
+            bound = tuple(np.array(bounds[index], ndmin=1).flatten())
 
         if iris.FUTURE.cell_datetime_objects:
-            if self.units.is_time_reference():
+            if values is None and self.units.is_time_reference():
                 point = self.units.num2date(point)
                 if bound is not None:
                     bound = self.units.num2date(bound)
@@ -1521,25 +1715,17 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
                   'compatible because of differing metadata.'
             raise ValueError(msg)
 
-        # Cache self.cells for speed. We can also use the index operation on a
-        # list conveniently.
-        self_cells = [cell for cell in self.cells()]
+        for coord in (self, other):
+            if coord.ndim != 1:
+                raise iris.exceptions.CoordinateMultiDimError(coord)
 
-        # Maintain a list of indices on self for which cells exist in both self
-        # and other.
-        self_intersect_indices = []
-        for cell in other.cells():
-            try:
-                self_intersect_indices.append(self_cells.index(cell))
-            except ValueError:
-                pass
+        # The indices on self for which cells exist in both self and other.
+        self_intersect_indices = self._equal_cell_indices(other)
 
-        if return_indices is False and self_intersect_indices == []:
+        if return_indices is False and not self_intersect_indices.size:
             raise ValueError('No intersection between %s coords possible.' %
                              self.name())
 
-        self_intersect_indices = np.array(self_intersect_indices)
-
         # Return either the indices, or a Coordinate instance of the
         # intersection.
         if return_indices:
@@ -1547,6 +1733,66 @@ class Coord(six.with_metaclass(ABCMeta, CFVariableMixin)):
         else:
             return self[self_intersect_indices]
 
+    def _equal_cell_indices(self, other):
+        """
+        Return, for each cell of the other one-dimensional coordinate that
+        is equal to a cell of this one, the index of the first such cell of
+        this coordinate.
+
+        """
+        self_points, self_bounds = self._cell_values()
+        other_points, other_bounds = other._cell_values()
+        if self_bounds is None or other_bounds is None:
+            if self_bounds is not other_bounds:
+                # A bounded cell never equals an unbounded one.
+                return np.array([], dtype=np.intp)
+        elif self_bounds.shape[1] != other_bounds.shape[1]:
+            return np.array([], dtype=np.intp)
+
+        arrays = (self_points, self_bounds, other_points, other_bounds)
+        numeric = all(array is None or
+                      (array.dtype.kind in 'biuf' and
+                       not ma.isMaskedArray(array))
+                      for array in arrays)
+        if numeric:
+            # Label the equal cells of both coordinates by sorting the rows
+            # of their points and bounds together. NaN values never compare
+            # equal, as for the cells themselves.
+            def cell_values(points, bounds):
+                if bounds is None:
+                    return points[:, np.newaxis]
+                return np.column_stack([points, bounds])
+            values = np.concatenate([cell_values(self_points, self_bounds),
+                                     cell_values(other_points, other_bounds)])
+            order = np.lexsort(values.T[::-1])
+            values = values[order]
+            new_labels = np.ones(len(values), dtype=bool)
+            new_labels[1:] = np.any(values[1:] != values[:-1], axis=1)
+            labels = np.empty(len(values), dtype=np.intp)
+            labels[order] = np.cumsum(new_labels) - 1
+            self_labels = labels[:self.shape[0]]
+            other_labels = labels[self.shape[0]:]
+            first_indices = np.full(labels.size, -1, dtype=np.intp)
+            self_labels, self_indices = np.unique(self_labels,
+                                                  return_index=True)
+            first_indices[self_labels] = self_indices
+            indices = first_indices[other_labels]
+            indices = indices[indices >= 0]
+        else:
+            # Match the cells, such as date-times or strings, by hashing.
+            def cell_keys(points, bounds):
+                if bounds is None:
+                    return list(points)
+                return list(zip(points, map(tuple, bounds)))
+            first_indices = {}
+            for index, key in enumerate(cell_keys(self_points, self_bounds)):
+                first_indices.setdefault(key, index)
+            indices = [first_indices[key]
+                       for key in cell_keys(other_points, other_bounds)
+                       if key in first_indices]
+            indices = np.array(indices, dtype=np.intp)
+        return indices
+
     def nearest_neighbour_index(self, point):
         """
         Returns the index of the cell nearest to the given point.
@@ -1839,8 +2085,8 @@ class DimCoord(Coord):
     # must be told this explicitly".
     __hash__ = Coord.__hash__
 
-    def __getitem__(self, key):
-        coord = super(DimCoord, self).__getitem__(key)
+    def _getitem(self, keys, copy=True):
+        coord = super(DimCoord, self)._getitem(keys, copy=copy)
         coord.circular = self.circular and coord.shape == self.shape
         return coord
 
@@ -1897,8 +2143,11 @@ class DimCoord(Coord):
             points = self._points_dm.core_data()
             # N.B. always a *real* array, as we realised 'points' at the start.
 
-            # Make the array read-only.
+            # Make the array read-only, along with our own copy of the
+            # points which it is a view of.
             points.flags.writeable = False
+            if points.base is not None:
+                points.base.flags.writeable = False
 
     points = property(Coord._points_getter, _points_setter)
 
@@ -1956,14 +2205,59 @@ class DimCoord(Coord):
             bounds = self._bounds_dm.core_data()
             # N.B. always a *real* array, as we realised 'bounds' at the start.
 
-            # Ensure the array is read-only.
+            # Ensure the array is read-only, along with our own copy of the
+            # bounds which it is a view of.
             bounds.flags.writeable = False
+            if bounds.base is not None:
+                bounds.base.flags.writeable = False
 
     bounds = property(Coord._bounds_getter, _bounds_setter)
 
     def is_monotonic(self):
         return True
 
+    def nearest_neighbour_index(self, point):
+        # Without bounds, the strictly monotonic points allow the nearest
+        # point to be found by a binary search, rather than by measuring the
+        # distance to every point.
+        real_types = (six.integer_types, float, np.integer, np.floating)
+        if (self.has_bounds() or not isinstance(point, real_types) or
+                not np.isfinite(point)):
+            return super(DimCoord, self).nearest_neighbour_index(point)
+
+        points = self.points
+        n_points = points.shape[0]
+        ascending = n_points < 2 or points[-1] > points[0]
+
+        # The candidates for the nearest point, as (distance, position in
+        # order of the points, index).
+        candidates = []
+        if self.circular:
+            # Wrap the point to the range starting at the lowest point, and
+            # also consider the lowest point wrapped to the end of the range,
+            # as for the general algorithm.
+            wrap_modulus = self.units.modulus
+            if ascending:
+                wrap_origin, position, wrap_index = points[0], n_points, 0
+            else:
+                wrap_origin, position, wrap_index = (points[-1], -1,
+                                                     n_points - 1)
+            point = wrap_origin + (point - wrap_origin) % wrap_modulus
+            candidates.append((abs(wrap_origin + wrap_modulus - point),
+                               position, wrap_index))
+
+        # The other candidates are the points either side of the point.
+        if ascending:
+            index = np.searchsorted(points, point)
+        else:
+            index = n_points - np.searchsorted(points[::-1], point)
+        candidates.extend((abs(points[i] - point), i, i)
+                          for i in (index - 1, index) if 0 <= i < n_points)
+
+        # Return the index of the first-occurring nearest point.
+        _, _, result_index = min(candidates)
+        return result_index
+
     def xml_element(self, doc):
         """Return DOM element describing this :class:`iris.coords.DimCoord`."""
         element = super(DimCoord, self).xml_element(doc)
@@ -1989,6 +2283,45 @@ class AuxCoord(Coord):
     # This provides clarity, backwards compatibility, and so we can add
     # AuxCoord-specific code if needed in future.
 
+    @classmethod
+    def from_categories(cls, categories, codes, standard_name=None,
+                        long_name=None, var_name=None, units='1',
+                        bounds=None, attributes=None, coord_system=None):
+        """
+        Create an :class:`AuxCoord` whose points are all drawn from a table
+        of distinct categories, such as string labels.
+
+        The points are held compactly, as integer codes into the table of
+        categories, and are only assembled when they are requested, as a
+        read-only array. Slicing, copying and comparing such coordinates,
+        and grouping by them, operate on the codes.
+
+        The majority of the arguments are defined as for
+        :meth:`Coord.__init__`, but those which differ are defined below.
+
+        Args:
+
+        * categories:
+            A 1-dimensional array of the distinct category values.
+        * codes:
+            An integer array of indices into `categories`, with the shape
+            of the points. The points are ``categories[codes]``.
+
+        For example::
+
+            labels, codes = np.unique(strings, return_inverse=True)
+            coord = AuxCoord.from_categories(labels, codes,
+                                             long_name='label')
+
+        """
+        points_dm = CategoricalDataManager(categories, codes)
+        coord = cls(points_dm.codes, standard_name=standard_name,
+                    long_name=long_name, var_name=var_name, units=units,
+                    bounds=bounds, attributes=attributes,
+                    coord_system=coord_system)
+        coord._points_dm = points_dm
+        return coord
+
 
 class CellMeasure(six.with_metaclass(ABCMeta, CFVariableMixin)):
     """
@@ -2318,12 +2651,18 @@ class _CellIterator(collections.Iterator):
         self._coord = coord
         if coord.ndim != 1:
             raise iris.exceptions.CoordinateMultiDimError(coord)
-        self._indices = iter(range(coord.shape[0]))
+        if iris.FUTURE.cell_datetime_objects:
+            # Make the cells from the values of all the cells at once.
+            points, bounds = coord._cell_values()
+            if bounds is None:
+                bounds = [None] * len(points)
+            self._cells = map(Cell, points, bounds)
+        else:
+            self._cells = (coord.cell(i) for i in range(coord.shape[0]))
 
     def __next__(self):
-        # NB. When self._indices runs out it will raise StopIteration for us.
-        i = next(self._indices)
-        return self._coord.cell(i)
+        # NB. When self._cells runs out it will raise StopIteration for us.
+        return next(self._cells)
 
     next = __next__
 
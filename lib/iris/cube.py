@@ -155,8 +155,11 @@ class _CubeFilterCollection(object):
         constraint pairs.
 
         """
-        for pair in self.pairs:
-            pair.add(cube)
+        constraints = [pair.constraint for pair in self.pairs]
+        sub_cubes = iris._constraints.extract_all(constraints, cube)
+        for pair, sub_cube in zip(self.pairs, sub_cubes):
+            if sub_cube is not None:
+                pair.cubes.append(sub_cube)
 
     def cubes(self):
         """
@@ -287,11 +290,13 @@ class CubeList(list):
         # group the resultant cubes by constraints in a dictionary
         constraint_groups = dict([(constraint, CubeList()) for constraint in
                                  constraints])
+        # evaluate all the constraints against each cube in a single pass
+        group_constraints = list(constraint_groups.keys())
         for cube in cubes:
-            for constraint, cube_list in six.iteritems(constraint_groups):
-                sub_cube = constraint.extract(cube)
+            sub_cubes = iris._constraints.extract_all(group_constraints, cube)
+            for constraint, sub_cube in zip(group_constraints, sub_cubes):
                 if sub_cube is not None:
-                    cube_list.append(sub_cube)
+                    constraint_groups[constraint].append(sub_cube)
 
         if merge_unique is not None:
             for constraint, cubelist in six.iteritems(constraint_groups):
@@ -335,9 +340,11 @@ class CubeList(list):
             coord_names = [coord_names]
 
         def make_overlap_fn(coord_name):
+            cubes_cells = [list(cube.coord(coord_name).cells())
+                           for cube in self]
+
             def overlap_fn(cell):
-                return all(cell in cube.coord(coord_name).cells()
-                           for cube in self)
+                return all(cell in cube_cells for cube_cells in cubes_cells)
             return overlap_fn
 
         coord_values = {coord_name: make_overlap_fn(coord_name)
@@ -621,6 +628,24 @@ class CubeList(list):
         _lazy.co_realise_cubes(*self)
 
 
+def _read_only_view(array):
+    """
+    Return a read-only view of a real array, whose mask, if any, is also a
+    read-only view.
+
+    """
+    values = ma.getdata(array).view()
+    values.flags.writeable = False
+    if ma.isMaskedArray(array):
+        mask = ma.getmask(array)
+        if mask is not ma.nomask:
+            mask = mask.view()
+            mask.flags.writeable = False
+        values = ma.masked_array(values, mask=mask, copy=False,
+                                 fill_value=array.fill_value)
+    return values
+
+
 def _is_single_item(testee):
     """
     Return whether this is a single item, rather than an iterable.
@@ -632,6 +657,104 @@ def _is_single_item(testee):
             not isinstance(testee, collections.Iterable))
 
 
+# Get the (standard_name, long_name, var_name) of a coordinate.
+_get_names = operator.attrgetter('standard_name', 'long_name', 'var_name')
+
+
+class _CoordIndex(object):
+    """
+    An index of the coordinates of a cube, by object identity and by name.
+
+    The index refers to the coordinate containers of the cube it was built
+    from, and is only current for as long as those containers, and the
+    names of their coordinates, are unchanged.
+
+    """
+    def __init__(self, cube):
+        self._containers = (cube._dim_coords_and_dims,
+                            cube._aux_coords_and_dims)
+        self._lengths = tuple(len(container)
+                              for container in self._containers)
+
+        def sort_key(co_di):
+            return (co_di[1], co_di[0].name())
+
+        dim_coords_and_dims = sorted(cube._dim_coords_and_dims, key=sort_key)
+        aux_coords_and_dims = sorted(cube._aux_coords_and_dims, key=sort_key)
+
+        #: The dimension coordinates, ordered by dimension.
+        self.dim_coords = tuple(coord for coord, _ in dim_coords_and_dims)
+        #: The auxiliary coordinates, ordered by dimension(s).
+        self.aux_coords = tuple(coord for coord, _ in aux_coords_and_dims)
+        #: All the coordinates, in the order of :meth:`Cube.coords`.
+        self.items = self.dim_coords + self.aux_coords
+
+        #: The data dimensions of each coordinate, by object identity.
+        self.dims_by_id = {}
+        for coord, dim in dim_coords_and_dims:
+            self.dims_by_id[id(coord)] = (coord, (dim,))
+        for coord, dims in aux_coords_and_dims:
+            self.dims_by_id[id(coord)] = (coord, dims)
+
+        # The positions in `items` of the coordinates with a given name, or a
+        # given (standard_name, long_name, var_name).
+        self._names = tuple(map(_get_names, self.items))
+        self._positions_by_name = collections.defaultdict(list)
+        for position, (item, names) in enumerate(zip(self.items,
+                                                     self._names)):
+            self._positions_by_name[item.name()].append(position)
+            self._positions_by_name[names].append(position)
+
+        # Any coordinates without names are named by their STASH attribute
+        # instead.
+        self._stashes = tuple((item, item.attributes.get('STASH'))
+                              for item, names in zip(self.items, self._names)
+                              if not any(names))
+
+    def is_current(self, cube, check_names=True):
+        """
+        Whether the index still describes the coordinates of the cube.
+
+        If `check_names` is False, the names of the coordinates are assumed
+        to be unchanged.
+
+        """
+        current = all(container is own and len(container) == length
+                      for container, own, length in
+                      zip((cube._dim_coords_and_dims,
+                           cube._aux_coords_and_dims),
+                          self._containers, self._lengths))
+        if current and check_names:
+            current = (self._names == tuple(map(_get_names, self.items)) and
+                       all(item.attributes.get('STASH') is stash
+                           for item, stash in self._stashes))
+        return current
+
+    def candidates(self, name=None, defn=None, dim_coords=None):
+        """
+        Return the coordinates, in order, which may have the given name or
+        metadata definition, and which are, or are not, dimension
+        coordinates.
+
+        """
+        if name is not None:
+            positions = self._positions_by_name.get(name, [])
+        elif defn is not None:
+            key = (defn.standard_name, defn.long_name, defn.var_name)
+            positions = self._positions_by_name.get(key, [])
+        else:
+            positions = range(len(self.items))
+
+        n_dim_coords = len(self.dim_coords)
+        if dim_coords is True:
+            positions = [position for position in positions
+                         if position < n_dim_coords]
+        elif dim_coords is False:
+            positions = [position for position in positions
+                         if position >= n_dim_coords]
+        return [self.items[position] for position in positions]
+
+
 class Cube(CFVariableMixin):
     """
     A single Iris cube of data and metadata.
@@ -671,6 +794,9 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
     #: is similar to Fortran or Matlab, but different than numpy.
     __orthogonal_indexing__ = True
 
+    # The index of the coordinates of the cube, when last built.
+    _coord_index = None
+
     def __init__(self, data, standard_name=None, long_name=None,
                  var_name=None, units=None, attributes=None,
                  cell_methods=None, dim_coords_and_dims=None,
@@ -1151,6 +1277,16 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         for factory in self.aux_factories:
             factory.update(old_coord, new_coord)
 
+    def _current_coord_index(self, check_names=True):
+        # Return the index of the coordinates of the cube, rebuilding it if
+        # any coordinates have been added, removed or renamed since it was
+        # last built.
+        index = self._coord_index
+        if index is None or not index.is_current(self, check_names):
+            index = _CoordIndex(self)
+            self._coord_index = index
+        return index
+
     def coord_dims(self, coord):
         """
         Returns a tuple of the data dimensions relevant to the given
@@ -1167,6 +1303,12 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             The (name of the) coord to look for.
 
         """
+        # Look up a coordinate (object) of the cube directly by identity.
+        if isinstance(coord, iris.coords.Coord):
+            index = self._current_coord_index(check_names=False)
+            coord_, dims = index.dims_by_id.get(id(coord), (None, None))
+            if coord_ is coord:
+                return dims
 
         coord = self.coord(coord)
 
@@ -1334,13 +1476,19 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         else:
             coord = name_or_coord
 
-        coords_and_factories = []
+        defn = None
+        if coord is not None:
+            if isinstance(coord, iris.coords.CoordDefn):
+                defn = coord
+            else:
+                defn = coord._as_defn()
 
-        if dim_coords in [True, None]:
-            coords_and_factories += list(self.dim_coords)
+        # Only consider the coordinates which could match the name or
+        # definition, as found from the index of the coordinates.
+        index = self._current_coord_index()
+        coords_and_factories = index.candidates(name, defn, dim_coords)
 
         if dim_coords in [False, None]:
-            coords_and_factories += list(self.aux_coords)
             coords_and_factories += list(self.aux_factories)
 
         if name is not None:
@@ -1382,11 +1530,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             coords_and_factories = [coord_ for coord_ in coords_and_factories
                                     if coord_.coord_system == coord_system]
 
-        if coord is not None:
-            if isinstance(coord, iris.coords.CoordDefn):
-                defn = coord
-            else:
-                defn = coord._as_defn()
+        if defn is not None:
             coords_and_factories = [coord_ for coord_ in coords_and_factories
                                     if coord_._as_defn() == defn]
 
@@ -1720,9 +1864,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             ``dimensions`` and ``dim_coords`` keyword arguments.
 
         """
-        return tuple((coord for coord, dim in
-                      sorted(self._dim_coords_and_dims,
-                             key=lambda co_di: (co_di[1], co_di[0].name()))))
+        return self._current_coord_index().dim_coords
 
     @property
     def aux_coords(self):
@@ -1731,9 +1873,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         dimension(s).
 
         """
-        return tuple((coord for coord, dims in
-                      sorted(self._aux_coords_and_dims,
-                             key=lambda co_di: (co_di[1], co_di[0].name()))))
+        return self._current_coord_index().aux_coords
 
     @property
     def derived_coords(self):
@@ -2125,6 +2265,18 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         requested must be applicable directly to the cube.data attribute. All
         metadata will be subsequently indexed appropriately.
 
+        """
+        return self._getitem(keys)
+
+    def _getitem(self, keys, copy=True):
+        """
+        Index the cube, as for :meth:`__getitem__`.
+
+        If `copy` is False, the new cube shares its data and the points and
+        bounds of its coordinates with this cube, as read-only views, where
+        the indexing allows it.  This avoids copying for consumers which
+        only read the result.
+
         """
         # turn the keys into a full slice spec (all dims)
         full_slice = iris.util._build_full_slice_given_keys(keys, self.ndim)
@@ -2146,8 +2298,13 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         dimension_mapping, data = iris.util._slice_data_with_keys(
             cube_data, keys)
 
-        # We don't want a view of the data, so take a copy of it.
-        data = deepcopy(data)
+        if copy:
+            # We don't want a view of the data, so take a copy of it.
+            data = deepcopy(data)
+        elif (isinstance(data, np.ndarray) and
+                not isinstance(data, ma.core.MaskedConstant)):
+            # Make sure the shared data can't be modified through the view.
+            data = _read_only_view(data)
 
         # XXX: Slicing a single item from a masked array that is masked,
         #      results in numpy (v1.11.1) *always* returning a MaskedConstant
@@ -2170,7 +2327,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             coord_keys = tuple([full_slice[dim] for dim in
                                 self.coord_dims(coord)])
             try:
-                new_coord = coord[coord_keys]
+                new_coord = coord._getitem(coord_keys, copy=copy)
             except ValueError:
                 # TODO make this except more specific to catch monotonic error
                 # Attempt to slice it by converting to AuxCoord first
@@ -2185,7 +2342,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             # Try/Catch to handle slicing that makes the points/bounds
             # non-monotonic
             try:
-                new_coord = coord[coord_keys]
+                new_coord = coord._getitem(coord_keys, copy=copy)
                 if not new_dims:
                     # If the associated dimension has been sliced so the coord
                     # is a scalar move the coord to the aux_coords container
@@ -2622,7 +2779,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
                 raise TypeError(msg)
         return coords
 
-    def slices_over(self, ref_to_slice):
+    def slices_over(self, ref_to_slice, copy=True):
         """
         Return an iterator of all subcubes along a given coordinate or
         dimension index, or multiple of these.
@@ -2634,6 +2791,12 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             dimensions that are not returned in the subcubes).
             A mix of input types can also be provided.
 
+        Kwargs:
+
+        * copy: if False, the subcubes share their data and coordinate values
+            with this cube as read-only views, instead of copies, as
+            described in :meth:`~iris.cube.Cube.slices`.  Default is True.
+
         Returns:
             An iterator of subcubes.
 
@@ -2674,9 +2837,9 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
         all_dims = set(range(self.ndim))
         opposite_dims = list(all_dims - slice_dims)
-        return self.slices(opposite_dims, ordered=False)
+        return self.slices(opposite_dims, ordered=False, copy=copy)
 
-    def slices(self, ref_to_slice, ordered=True):
+    def slices(self, ref_to_slice, ordered=True, copy=True):
         """
         Return an iterator of all subcubes given the coordinates or dimension
         indices desired to be present in each subcube.
@@ -2696,6 +2859,13 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             the resulting cube slices.  If False, the order will follow that of
             the source cube.  Default is True.
 
+        * copy: if False, the subcubes share their data and the points and
+            bounds of their coordinates with this cube, wherever possible,
+            instead of copying them.  The shared arrays are read-only views,
+            so this suits code which only reads the subcubes, and is much
+            faster when iterating over many small subcubes.
+            Default is True.
+
         Returns:
             An iterator of subcubes.
 
@@ -2752,7 +2922,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         for d in dim_to_slice:
             dims_index[d] = 1
 
-        return _SliceIterator(self, dims_index, dim_to_slice, ordered)
+        return _SliceIterator(self, dims_index, dim_to_slice, ordered, copy)
 
     def transpose(self, new_order=None):
         """
@@ -2975,6 +3145,13 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
     def __deepcopy__(self, memo):
         return self._deepcopy(memo)
 
+    def __getstate__(self):
+        # The index of the coordinates refers to them by object identity, so
+        # it is rebuilt when needed rather than pickled.
+        state = self.__dict__.copy()
+        state.pop('_coord_index', None)
+        return state
+
     def _deepcopy(self, memo, data=None):
         dm = self._data_manager.copy(data=data)
 
@@ -3019,9 +3196,12 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
                               coord_comparison['non_equal_data_dimension'])
 
             # having checked everything else, check approximate data
-            # equality - loading the data if has not already been loaded.
+            # equality - chunk by chunk if the data has not been loaded.
             if result:
-                result = np.all(np.abs(self.data - other.data) < 1e-8)
+                result = iris.util.approx_equal(self.core_data(),
+                                                other.core_data(),
+                                                max_absolute_error=1e-8,
+                                                max_relative_error=0)
 
         return result
 
@@ -3104,16 +3284,21 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             Coordinate names/coordinates over which the cube should be
             collapsed.
 
-        * aggregator (:class:`iris.analysis.Aggregator`):
-            Aggregator to be applied for collapse operation.
+        * aggregator (:class:`iris.analysis.Aggregator` or sequence):
+            Aggregator to be applied for collapse operation.  Alternatively,
+            several aggregators, each of which may be paired with a dictionary
+            of keyword arguments specific to it, as a tuple of
+            (aggregator, kwargs).
 
         Kwargs:
 
         * kwargs:
-            Aggregation function keyword arguments.
+            Aggregation function keyword arguments, common to all the
+            aggregators.
 
         Returns:
-            Collapsed cube.
+            Collapsed cube, or a :class:`CubeList` of the cubes collapsed by
+            each of several aggregators.
 
         For example:
 
@@ -3166,7 +3351,27 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
 
                 cube.collapsed(['latitude', 'longitude'],
                                iris.analysis.VARIANCE)
+
+        .. note::
+
+            When collapsing a cube with lazy data by several aggregators at
+            once, the lazy results share a single calculation of the
+            moments behind any of :data:`~iris.analysis.MEAN`,
+            :data:`~iris.analysis.SUM`, :data:`~iris.analysis.VARIANCE`,
+            :data:`~iris.analysis.STD_DEV` and :data:`~iris.analysis.RMS`.
+            Realise the results together, so that the source data is read
+            only once::
+
+                stats = cube.collapsed('time', [iris.analysis.MEAN,
+                                                iris.analysis.STD_DEV,
+                                                iris.analysis.MIN,
+                                                iris.analysis.MAX])
+                stats.realise_data()
+
         """
+        if not isinstance(aggregator, iris.analysis._Aggregator):
+            return self._collapsed_multiple(coords, aggregator, **kwargs)
+
         # Convert any coordinate names to coordinates
         coords = self._as_list_of_coords(coords)
 
@@ -3232,13 +3437,16 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             new_shape = untouched_shape + collapsed_shape
 
             array_dims = untouched_dims + dims_to_collapse
-            unrolled_data = np.transpose(
-                self.data, array_dims).reshape(new_shape)
+            if aggregator.lazy_func is not None and self.has_lazy_data():
+                unrolled_data = self.lazy_data().transpose(array_dims)
+                aggregate = aggregator.lazy_aggregate
+            else:
+                unrolled_data = np.transpose(
+                    self.data, array_dims).reshape(new_shape)
+                aggregate = aggregator.aggregate
 
             for dim in dims_to_collapse:
-                unrolled_data = aggregator.aggregate(unrolled_data,
-                                                     axis=-1,
-                                                     **kwargs)
+                unrolled_data = aggregate(unrolled_data, axis=-1, **kwargs)
             data_result = unrolled_data
 
         # Perform the aggregation in lazy form if possible.
@@ -3260,6 +3468,15 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         # If we weren't able to complete a lazy aggregation, compute it
         # directly now.
         if data_result is None:
+            if self.has_lazy_data():
+                if aggregator.lazy_func is None:
+                    msg = ('Realising the lazy data of the cube, as the {!r} '
+                           'aggregator does not support lazy operation.')
+                else:
+                    msg = ('Realising the lazy data of the cube, as the {!r} '
+                           'aggregator does not support lazy operation with '
+                           'the given keywords.')
+                warnings.warn(msg.format(aggregator.name()))
             # Perform the (non-lazy) aggregation over the cube data
             # First reshape the data so that the dimensions being aggregated
             # over are grouped 'at the end' (i.e. axis=-1).
@@ -3287,6 +3504,43 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
                                          **kwargs)
         return result
 
+    def _collapsed_multiple(self, coords, aggregators, **kwargs):
+        """
+        Collapse the cube by each of several aggregators, with any of their
+        own keyword arguments, returning a :class:`CubeList`.
+
+        """
+        if (not isinstance(aggregators, collections.Sequence) or
+                isinstance(aggregators, six.string_types)):
+            msg = ('Expected an aggregator or a sequence of aggregators, '
+                   'got {!r}.')
+            raise TypeError(msg.format(aggregators))
+        if not aggregators:
+            raise ValueError('Expected at least one aggregator, got an empty '
+                             'sequence.')
+
+        requests = []
+        for aggregator in aggregators:
+            aggregator_kwargs = dict(kwargs)
+            if isinstance(aggregator, tuple):
+                aggregator, own_kwargs = aggregator
+                aggregator_kwargs.update(own_kwargs)
+            if not isinstance(aggregator, iris.analysis._Aggregator):
+                msg = 'Expected an aggregator, got {!r}.'
+                raise TypeError(msg.format(aggregator))
+            if aggregator_kwargs.get('returned', False):
+                msg = ("The 'returned' keyword is not supported when "
+                       "collapsing by several aggregators.")
+                raise ValueError(msg)
+            requests.append((aggregator, aggregator_kwargs))
+
+        aggregators = [aggregator for aggregator, _ in requests]
+        if self.has_lazy_data():
+            aggregators = iris.analysis._share_moments(aggregators)
+        return CubeList([self.collapsed(coords, aggregator, **request_kwargs)
+                         for aggregator, (_, request_kwargs)
+                         in zip(aggregators, requests)])
+
     def aggregated_by(self, coords, aggregator, **kwargs):
         """
         Perform aggregation over the cube given one or more "group
@@ -3404,18 +3658,29 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
         data_shape = list(self.shape + aggregator.aggregate_shape(**kwargs))
         data_shape[dimension_to_groupby] = len(groupby)
 
-        # Aggregate the group-by data.
-        cube_slice = [slice(None, None)] * len(data_shape)
+        # Aggregate the group-by data.  The aggregate-by data may have
+        # additional trailing dimensions, so has a slice of its own.
+        cube_slice = [slice(None, None)] * self.ndim
+        aggregateby_slice = [slice(None, None)] * len(data_shape)
+        # The group-by sub-data of a contiguous group is a view of the cube
+        # data.  The built-in aggregators are given read-only views, but any
+        # other aggregator may modify its input, so is given a copy.
+        data = self.data
+        builtin = aggregator in iris.analysis._BUILTIN_AGGREGATORS
+        if builtin:
+            data = _read_only_view(data)
 
         for i, groupby_slice in enumerate(groupby.group()):
-            # Slice the cube with the group-by slice to create a group-by
-            # sub-cube.
+            # Slice the data with the group-by slice to create the group-by
+            # sub-data.
             cube_slice[dimension_to_groupby] = groupby_slice
-            groupby_sub_cube = self[tuple(cube_slice)]
-            # Perform the aggregation over the group-by sub-cube and
+            groupby_sub_data = data[tuple(cube_slice)]
+            if not builtin and isinstance(groupby_slice, slice):
+                groupby_sub_data = groupby_sub_data.copy()
+            # Perform the aggregation over the group-by sub-data and
             # repatriate the aggregated data into the aggregate-by cube data.
-            cube_slice[dimension_to_groupby] = i
-            result = aggregator.aggregate(groupby_sub_cube.data,
+            aggregateby_slice[dimension_to_groupby] = i
+            result = aggregator.aggregate(groupby_sub_data,
                                           axis=dimension_to_groupby,
                                           **kwargs)
 
@@ -3427,7 +3692,7 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
                 else:
                     aggregateby_data = np.zeros(data_shape, dtype=result.dtype)
 
-            aggregateby_data[tuple(cube_slice)] = result
+            aggregateby_data[tuple(aggregateby_slice)] = result
 
         # Add the aggregation meta data to the aggregate-by cube.
         aggregator.update_metadata(aggregateby_cube,
@@ -3832,8 +4097,9 @@ def sorted_axes(axes):
 
 # See Cube.slice() for the definition/context.
 class _SliceIterator(collections.Iterator):
-    def __init__(self, cube, dims_index, requested_dims, ordered):
+    def __init__(self, cube, dims_index, requested_dims, ordered, copy=True):
         self._cube = cube
+        self._copy = copy
 
         # Let Numpy do some work in providing all of the permutations of our
         # data shape. This functionality is something like:
@@ -3859,7 +4125,7 @@ class _SliceIterator(collections.Iterator):
             index_list[d] = slice(None, None)
 
         # Request the slice
-        cube = self._cube[tuple(index_list)]
+        cube = self._cube._getitem(tuple(index_list), copy=self._copy)
 
         if self._ordered:
             if any(self._mod_requested_dims != list(range(len(cube.shape)))):
@@ -776,6 +776,19 @@ class _FillValueMaskCheckAndStoreTarget(object):
         self.target[keys] = arr
 
 
+def _label_chars(labels, depth):
+    """
+    Return the characters of an array of string labels, each padded with
+    spaces to the given length, as an array with an extra trailing
+    dimension of that length.
+
+    """
+    labels = np.char.ljust(labels, depth)
+    dtype = '{}{}'.format(labels.dtype.kind, depth)
+    chars = labels.astype(dtype).view(dtype[0] + '1')
+    return chars.reshape(labels.shape + (depth,))
+
+
 class Saver(object):
     """A manager for saving netcdf files."""
 
@@ -1608,9 +1621,9 @@ class Saver(object):
         cf_dimensions = [dimension_names[dim] for dim in
                          cube.coord_dims(coord)]
 
-        if np.issubdtype(coord.points.dtype, np.str_):
-            string_dimension_depth = coord.points.dtype.itemsize
-            if coord.points.dtype.kind == 'U':
+        if np.issubdtype(coord.dtype, np.str_):
+            string_dimension_depth = coord.dtype.itemsize
+            if coord.dtype.kind == 'U':
                 string_dimension_depth //= 4
             string_dimension_name = 'string%d' % string_dimension_depth
 
@@ -1626,16 +1639,17 @@ class Saver(object):
             cf_var = self._dataset.createVariable(cf_name, '|S1',
                                                   cf_dimensions)
 
-            # Add the payload to the label coordinate variable.
-            if len(cf_dimensions) == 1:
-                cf_var[:] = list('%- *s' % (string_dimension_depth,
-                                            coord.points[0]))
+            # Add the payload to the label coordinate variable, as the
+            # characters of each label padded with spaces.  The characters
+            # of categorical points are those of their categories.
+            categorical = coord._categorical_points()
+            if categorical is None:
+                chars = _label_chars(coord.points, string_dimension_depth)
             else:
-                for index in np.ndindex(coord.points.shape):
-                    index_slice = tuple(list(index) + [slice(None, None)])
-                    cf_var[index_slice] = list('%- *s' %
-                                               (string_dimension_depth,
-                                                coord.points[index]))
+                categories, codes = categorical
+                chars = _label_chars(categories,
+                                     string_dimension_depth)[codes]
+            cf_var[:] = chars.reshape(cf_var.shape)
         else:
             # Identify the collection of coordinates that represent CF-netCDF
             # coordinate variables.
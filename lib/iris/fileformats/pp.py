@@ -1990,7 +1990,8 @@ def save(cube, target, append=False, field_coords=None):
     See also :func:`iris.io.save`.
 
     """
-    fields = as_fields(cube, field_coords, target)
+    fields = (field for _, field in _save_pairs_from_cube(
+        cube, field_coords, target, copy=False))
     save_fields(fields, target, append=append)
 
 
@@ -2016,6 +2017,13 @@ def save_pairs_from_cube(cube, field_coords=None, target=None):
         A filename or open file handle.
 
     """
+    return _save_pairs_from_cube(cube, field_coords, target)
+
+
+def _save_pairs_from_cube(cube, field_coords, target, copy=True):
+    # As save_pairs_from_cube, but the 2D cubes are read-only views of the
+    # given cube when 'copy' is False, which is enough for saving them.
+
     # Open issues
     # Could use rules in "sections" ... e.g. to process the extensive
     # dimensions; ...?
@@ -2073,7 +2081,7 @@ def save_pairs_from_cube(cube, field_coords=None, target=None):
                         cube.coords(dimensions=n_dims-1)[0])
 
     # Save each named or latlon slice2D in the cube
-    for slice2D in cube.slices(field_coords):
+    for slice2D in cube.slices(field_coords, copy=copy):
         # Start with a blank PPField
         pp_field = PPField3()
 
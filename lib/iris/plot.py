@@ -538,8 +538,8 @@ def _fixup_dates(coord, values):
     if coord.units.calendar is not None and values.ndim == 1:
         # Convert coordinate values into tuples of
         # (year, month, day, hour, min, sec)
-        dates = [coord.units.num2date(val).timetuple()[0:6]
-                 for val in values]
+        dates = [date.timetuple()[0:6]
+                 for date in coord.units.num2date(values)]
         if coord.units.calendar == 'gregorian':
             r = [datetime.datetime(*date) for date in dates]
         else:
@@ -104,6 +104,24 @@ class Test_cubes_with_aux_coord(tests.IrisTest):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].shape, (4, 2))
 
+    def test_ignore_diff_aux_coord_second_axis(self):
+        # Tiles are concatenated along time, then along latitude, with the
+        # differing heights of the latitude bands ignored in both passes.
+        cube_a = self.create_cube()
+        cube_b = cube_a.copy()
+        cube_b.coord('time').points = [12, 18]
+        cube_c = cube_a.copy()
+        cube_c.coord('latitude').points = [60, 90]
+        cube_c.coord('height').points = [10.]
+        cube_d = cube_c.copy()
+        cube_d.coord('time').points = [12, 18]
+
+        cubes = [cube_a, cube_b, cube_c, cube_d]
+        self.assertEqual(len(concatenate(cubes)), 2)
+        result = concatenate(cubes, check_aux_coords=False)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].shape, (4, 4))
+
 
 class Test_anonymous_dims(tests.IrisTest):
     def setUp(self):
@@ -30,6 +30,7 @@ import cf_units
 import numpy as np
 
 import iris
+from iris._data_manager import CategoricalDataManager
 import iris.coord_categorisation as ccat
 
 
@@ -164,6 +165,22 @@ class TestCategorisations(tests.IrisTest):
         membership_locations = np.where(coord_membership.points)[0]
         self.assertArrayEqual(membership_locations, season_locations)
 
+    def test_categorical(self):
+        # String categories can be held as codes into a table of labels.
+        for func in (ccat.add_weekday, ccat.add_weekday_fullname,
+                     ccat.add_month, ccat.add_month_fullname,
+                     ccat.add_season):
+            cube = self.cube.copy()
+            func(cube, 'time', name='plain')
+            func(cube, 'time', name='compact', categorical=True)
+            plain = cube.coord('plain')
+            compact = cube.coord('compact')
+            self.assertIsInstance(compact._points_dm,
+                                  CategoricalDataManager)
+            self.assertEqual(compact.units, plain.units)
+            self.assertArrayEqual(compact.points, plain.points)
+            self.assertEqual(cube.coord_dims(compact), (0,))
+
     def test_add_season_invalid_spec(self):
         # custom seasons with an invalid season raises an error?
         seasons = ('djf', 'maj', 'jja', 'son')   # MAJ not a season!
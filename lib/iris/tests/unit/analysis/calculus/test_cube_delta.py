@@ -0,0 +1,80 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :func:`iris.analysis.calculus.cube_delta` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import as_lazy_data
+from iris.analysis.calculus import cube_delta, differentiate
+from iris.coords import DimCoord
+from iris.cube import Cube
+
+
+class Test__lazy(tests.IrisTest):
+    def setUp(self):
+        data = np.arange(60.).reshape(3, 4, 5) ** 2
+        cube = Cube(data, long_name='foo', units='m')
+        cube.add_dim_coord(DimCoord([0., 1., 3.], long_name='z'), 0)
+        cube.add_dim_coord(DimCoord(np.arange(4.) * 90, 'longitude',
+                                    units='degrees', circular=True), 1)
+        cube.add_dim_coord(DimCoord(np.arange(5.) * 10, 'latitude',
+                                    units='degrees'), 2)
+        self.cube = cube
+        self.lazy_cube = cube.copy(as_lazy_data(data, chunks=(2, 3, 2)))
+
+    def _check(self, func, coord):
+        expected = func(self.cube, coord)
+        result = func(self.lazy_cube, coord)
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.coords(), expected.coords())
+        self.assertEqual(result.name(), expected.name())
+        self.assertArrayAllClose(result.data, expected.data)
+
+    def test_delta(self):
+        self._check(cube_delta, 'z')
+        self._check(cube_delta, 'latitude')
+
+    def test_delta_circular(self):
+        self._check(cube_delta, 'longitude')
+
+    def test_differentiate(self):
+        self._check(differentiate, 'z')
+        self._check(differentiate, 'latitude')
+
+    def test_differentiate_circular(self):
+        self._check(differentiate, 'longitude')
+
+    def test_masked(self):
+        data = ma.masked_greater(self.cube.data, 1000)
+        self.cube.data = data
+        self.lazy_cube.data = as_lazy_data(data, chunks=(2, 3, 2))
+        self._check(cube_delta, 'latitude')
+        result = cube_delta(self.lazy_cube, 'latitude')
+        expected = cube_delta(self.cube, 'latitude')
+        self.assertArrayEqual(result.data.mask, expected.data.mask)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,87 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :func:`iris.analysis.calculus.curl` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris._lazy_data import as_lazy_data
+from iris.analysis.calculus import curl
+from iris.coord_systems import GeogCS
+from iris.coords import DimCoord
+from iris.cube import Cube
+
+
+def _wind_cube(name, data, spherical):
+    cube = Cube(data, long_name=name, units='m s-1')
+    cube.add_dim_coord(DimCoord(np.arange(data.shape[0]) * 10., long_name='z',
+                                units='m', attributes={'positive': 'up'}), 0)
+    if spherical:
+        cs = GeogCS(6371229)
+        cube.add_dim_coord(DimCoord(np.linspace(-80, 80, data.shape[1]),
+                                    'latitude', units='degrees',
+                                    coord_system=cs), 1)
+        cube.add_dim_coord(DimCoord(np.linspace(0, 350, data.shape[2]),
+                                    'longitude', units='degrees',
+                                    coord_system=cs, circular=True), 2)
+    else:
+        cube.add_dim_coord(DimCoord(np.arange(data.shape[1]) * 25.,
+                                    'projection_y_coordinate', units='m'), 1)
+        cube.add_dim_coord(DimCoord(np.arange(data.shape[2]) * 20.,
+                                    'projection_x_coordinate', units='m'), 2)
+    return cube
+
+
+class Test__lazy(tests.IrisTest):
+    def _check(self, spherical, with_k):
+        state = np.random.RandomState(0)
+        names = ['u_wind', 'v_wind', 'w_wind'][:3 if with_k else 2]
+        cubes = [_wind_cube(name, state.rand(4, 9, 12), spherical)
+                 for name in names]
+        lazy_cubes = [cube.copy(as_lazy_data(cube.data, chunks=(2, 4, 5)))
+                      for cube in cubes]
+        expected = curl(*cubes)
+        result = curl(*lazy_cubes)
+        for result_cube, expected_cube in zip(result, expected):
+            if expected_cube is None:
+                self.assertIsNone(result_cube)
+            else:
+                self.assertTrue(result_cube.has_lazy_data())
+                self.assertEqual(result_cube.coords(), expected_cube.coords())
+                self.assertEqual(result_cube.metadata, expected_cube.metadata)
+                self.assertArrayAllClose(result_cube.data, expected_cube.data)
+        for cube in lazy_cubes:
+            self.assertTrue(cube.has_lazy_data())
+
+    def test_cartesian_2d(self):
+        self._check(spherical=False, with_k=False)
+
+    def test_cartesian_3d(self):
+        self._check(spherical=False, with_k=True)
+
+    def test_spherical_2d(self):
+        self._check(spherical=True, with_k=False)
+
+
+if __name__ == '__main__':
+    tests.main()
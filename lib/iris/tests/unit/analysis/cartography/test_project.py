@@ -26,6 +26,7 @@ import iris.tests as tests
 import cartopy.crs as ccrs
 import numpy as np
 
+from iris._lazy_data import as_lazy_data
 import iris.coord_systems
 import iris.coords
 import iris.cube
@@ -70,6 +71,45 @@ class TestAll(tests.IrisTest):
         self.assertIsNot(res.coord('projection_x_coordinate').coord_system,
                          self.tcs)
 
+    def _3d_cube(self):
+        # Make a 3d cube (z, y, x), based on the 2d test cube.
+        cubes = iris.cube.CubeList()
+        for i_z in range(3):
+            cube = self.cube.copy(data=np.arange(25.0).reshape(5, 5) + i_z)
+            cube.add_aux_coord(iris.coords.DimCoord(i_z, long_name='z'))
+            cubes.append(cube)
+        cube = cubes.merge_cube()
+        cs = iris.coord_systems.GeogCS(6371229.0)
+        cube.coord('latitude').coord_system = cs
+        cube.coord('longitude').coord_system = cs
+        return cube
+
+    def test_multiple_slices(self):
+        # Check that each slice is projected the same as a separate 2d cube.
+        cube = self._3d_cube()
+        res, _ = project(cube, ROBINSON)
+        self.assertEqual(res.shape, cube.shape)
+        for i_z in range(3):
+            expected, _ = project(cube[i_z], ROBINSON)
+            self.assertMaskedArrayEqual(res[i_z].data, expected.data)
+
+    def test_lazy_data(self):
+        cube = self._3d_cube()
+        expected, _ = project(cube, ROBINSON)
+        cube.data = as_lazy_data(cube.data, chunks=(1, 5, 5))
+        res, _ = project(cube, ROBINSON)
+        self.assertTrue(res.has_lazy_data())
+        self.assertTrue(cube.has_lazy_data())
+        self.assertMaskedArrayEqual(res.data, expected.data)
+
+    def test_transposed_data(self):
+        cube = self._3d_cube()
+        expected, _ = project(cube, ROBINSON)
+        cube.transpose((2, 0, 1))
+        res, _ = project(cube, ROBINSON)
+        res.transpose((1, 2, 0))
+        self.assertMaskedArrayEqual(res.data, expected.data)
+
     @tests.skip_data
     def test_bad_resolution_negative(self):
         cube = low_res_4d()
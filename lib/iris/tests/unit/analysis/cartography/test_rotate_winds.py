@@ -415,6 +415,63 @@ class TestMasking(tests.IrisTest):
         self.assertFalse(ma.isMaskedArray(vt.data))
 
 
+class TestLazy(tests.IrisTest):
+    def _lazy_copies(self, u, v):
+        u_lazy, v_lazy = u.copy(u.lazy_data()), v.copy(v.lazy_data())
+        return u_lazy, v_lazy
+
+    def test_stays_lazy(self):
+        u, v = uv_cubes_3d(uv_cubes()[0])
+        u_lazy, v_lazy = self._lazy_copies(u, v)
+        ut, vt = rotate_winds(u_lazy, v_lazy,
+                              iris.coord_systems.GeogCS(6371229))
+        self.assertTrue(ut.has_lazy_data())
+        self.assertTrue(vt.has_lazy_data())
+        self.assertTrue(u_lazy.has_lazy_data())
+        self.assertTrue(v_lazy.has_lazy_data())
+        expected_ut, expected_vt = rotate_winds(
+            u, v, iris.coord_systems.GeogCS(6371229))
+        self.assertArrayAlmostEqual(ut.data, expected_ut.data)
+        self.assertArrayAlmostEqual(vt.data, expected_vt.data)
+
+    def test_masked(self):
+        x = np.linspace(311.9, 391.1, 10)
+        y = np.linspace(-23.6, 24.8, 8)
+        u, v = uv_cubes_3d(uv_cubes(x, y)[0])
+        u_lazy, v_lazy = self._lazy_copies(u, v)
+        ut, vt = rotate_winds(u_lazy, v_lazy, iris.coord_systems.OSGB())
+        self.assertTrue(ut.has_lazy_data())
+        expected_ut, expected_vt = rotate_winds(u, v,
+                                                iris.coord_systems.OSGB())
+        self.assertMaskedArrayAlmostEqual(ut.data, expected_ut.data)
+        self.assertMaskedArrayAlmostEqual(vt.data, expected_vt.data)
+
+
+class TestSliceEquivalence(tests.IrisTest):
+    def test_transposed_nd_data(self):
+        # Every horizontal slice of a rotated nd cube matches the rotation
+        # of that slice on its own.
+        x = np.linspace(311.9, 391.1, 10)
+        y = np.linspace(-23.6, 24.8, 8)
+        u, v = uv_cubes_3d(uv_cubes(x, y)[0])
+        u.transpose([2, 0, 1])
+        v.transpose([2, 0, 1])
+        ut, vt = rotate_winds(u, v, iris.coord_systems.OSGB())
+        for i in range(u.shape[1]):
+            ut_slice, vt_slice = rotate_winds(u[:, i], v[:, i],
+                                              iris.coord_systems.OSGB())
+            self.assertMaskedArrayAlmostEqual(ut.data[:, i], ut_slice.data)
+            self.assertMaskedArrayAlmostEqual(vt.data[:, i], vt_slice.data)
+
+    def test_dtype_preserved(self):
+        u, v = uv_cubes()
+        u.data = u.data.astype(np.float32)
+        v.data = v.data.astype(np.float32)
+        ut, vt = rotate_winds(u, v, iris.coord_systems.GeogCS(6371229))
+        self.assertEqual(ut.dtype, np.float32)
+        self.assertEqual(vt.dtype, np.float32)
+
+
 class TestRoundTrip(tests.IrisTest):
     def test_rotated_to_unrotated(self):
         # Check ability to use 2d coords as input.
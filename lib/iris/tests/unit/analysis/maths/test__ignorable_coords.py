@@ -0,0 +1,152 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for :func:`iris.analysis.maths._ignorable_coords`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import hashlib
+
+import numpy as np
+
+import iris.analysis
+import iris.util
+from iris.analysis.maths import _ignorable_coords
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube
+from iris.tests import mock
+
+
+def _cube(realization=0):
+    cube = Cube(np.zeros((2, 3)))
+    cube.add_dim_coord(DimCoord([0., 1.], 'latitude', units='degrees'), 0)
+    cube.add_dim_coord(DimCoord([0., 10., 20.], 'longitude',
+                                units='degrees'), 1)
+    cube.add_aux_coord(AuxCoord([realization], long_name='realization'))
+    return cube
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        patch = mock.patch('iris.analysis.maths._coord_compatibility_cache',
+                           iris.util._LRUCache(256))
+        patch.start()
+        self.addCleanup(patch.stop)
+        patch = mock.patch('iris.analysis.maths._array_digest_cache',
+                           iris.util._LRUCache(1024))
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.comparison = mock.Mock(
+            side_effect=iris.analysis.coord_comparison)
+        patch = mock.patch('iris.analysis.coord_comparison', self.comparison)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_compatible(self):
+        self.assertEqual(_ignorable_coords(_cube(), _cube()), [])
+
+    def test_ignorable(self):
+        cube = _cube()
+        result = _ignorable_coords(cube, _cube(realization=1))
+        self.assertEqual(len(result), 1)
+        self.assertIs(result[0], cube.coord('realization'))
+
+    def test_incompatible(self):
+        other = _cube()
+        other.coord('latitude').points = [5., 6.]
+        msg = 'differing coordinates \\(latitude\\)'
+        with self.assertRaisesRegexp(ValueError, msg):
+            _ignorable_coords(_cube(), other)
+
+    def test_cached(self):
+        _ignorable_coords(_cube(), _cube(realization=1))
+        cube = _cube()
+        result = _ignorable_coords(cube, _cube(realization=1))
+        self.assertEqual(self.comparison.call_count, 1)
+        self.assertEqual(len(result), 1)
+        self.assertIs(result[0], cube.coord('realization'))
+
+    def test_values_digested_once(self):
+        cube, other = _cube(), _cube(realization=1)
+        with mock.patch('hashlib.sha1', side_effect=hashlib.sha1) as sha1:
+            _ignorable_coords(cube, other)
+            count = sha1.call_count
+            _ignorable_coords(cube, other)
+        self.assertEqual(count, 6)
+        # Only the writeable points of the auxiliary coordinates are
+        # digested again.
+        self.assertEqual(sha1.call_count, count + 2)
+
+    def test_cached_incompatible(self):
+        other = _cube()
+        other.coord('latitude').points = [5., 6.]
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                _ignorable_coords(_cube(), other)
+        self.assertEqual(self.comparison.call_count, 1)
+
+    def test_changed_points(self):
+        cube, other = _cube(), _cube()
+        _ignorable_coords(cube, other)
+        other.coord('longitude').points = [0., 10., 30.]
+        with self.assertRaises(ValueError):
+            _ignorable_coords(cube, other)
+        self.assertEqual(self.comparison.call_count, 2)
+
+    def test_points_changed_in_place(self):
+        cube, other = _cube(), _cube()
+        cube.add_aux_coord(AuxCoord([1., 2.], long_name='height'), 0)
+        other.add_aux_coord(AuxCoord([1., 2.], long_name='height'), 0)
+        _ignorable_coords(cube, other)
+        other.coord('height').points[0] = 99.
+        msg = 'differing coordinates \\(height\\)'
+        with self.assertRaisesRegexp(ValueError, msg):
+            _ignorable_coords(cube, other)
+
+    def test_changed_metadata(self):
+        cube, other = _cube(), _cube()
+        _ignorable_coords(cube, other)
+        other.coord('realization').attributes['source'] = 'model'
+        result = _ignorable_coords(cube, other)
+        self.assertEqual(self.comparison.call_count, 2)
+        self.assertEqual(len(result), 1)
+
+    def test_changed_dims(self):
+        cube = Cube(np.zeros((3, 3)))
+        cube.add_dim_coord(DimCoord([0., 1., 2.], 'latitude'), 0)
+        cube.add_dim_coord(DimCoord([0., 1., 2.], 'longitude'), 1)
+        transposed = cube.copy()
+        transposed.transpose()
+        _ignorable_coords(cube, cube.copy())
+        _ignorable_coords(cube, transposed)
+        self.assertEqual(self.comparison.call_count, 2)
+
+    def test_lazy_points_not_cached(self):
+        cube = _cube()
+        cube.add_aux_coord(AuxCoord(cube.coord('latitude').lazy_points(),
+                                    long_name='lazy'), 0)
+        for _ in range(2):
+            _ignorable_coords(cube, cube.copy())
+        self.assertEqual(self.comparison.call_count, 2)
+
+
+if __name__ == '__main__':
+    tests.main()
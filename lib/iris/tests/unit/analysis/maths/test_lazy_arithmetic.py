@@ -0,0 +1,115 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :func:`iris.analysis.maths.lazy_arithmetic` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+import iris.analysis.maths
+from iris.analysis.maths import lazy_arithmetic
+from iris.coords import DimCoord
+from iris.cube import Cube
+
+
+def _cube(data):
+    cube = Cube(data)
+    cube.add_dim_coord(DimCoord(np.arange(data.shape[0]), 'latitude'), 0)
+    return cube
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.a = _cube(np.arange(12, dtype=np.float64).reshape(3, 4))
+        self.b = _cube(np.arange(12, dtype=np.float64).reshape(3, 4) + 1)
+
+    def _chain(self):
+        return (self.a * self.b + self.a - 2) / self.b ** 2
+
+    def test_lazy_result(self):
+        with lazy_arithmetic():
+            result = self._chain()
+        self.assertTrue(result.has_lazy_data())
+        self.assertFalse(self.a.has_lazy_data())
+        self.assertFalse(self.b.has_lazy_data())
+
+    def test_matches_eager(self):
+        expected = self._chain()
+        with lazy_arithmetic():
+            result = self._chain()
+        self.assertFalse(expected.has_lazy_data())
+        self.assertEqual(result.units, expected.units)
+        self.assertEqual(result.coords(), expected.coords())
+        self.assertArrayAllClose(result.data, expected.data)
+
+    def test_masked(self):
+        self.a.data = ma.masked_array(self.a.data, mask=self.a.data % 5 == 0)
+        expected = self._chain()
+        with lazy_arithmetic():
+            result = self._chain()
+        self.assertMaskedArrayAlmostEqual(result.data, expected.data)
+
+    def test_shares_operand_data(self):
+        # Lazy results read the data of their operands when realised.
+        with lazy_arithmetic():
+            result = self.a * 2
+            other = self.a * 2
+        other.data
+        self.a.data[0, 0] = 100
+        self.assertEqual(result.data[0, 0], 200)
+        self.assertEqual(other.data[0, 0], 0)
+
+    def test_unary(self):
+        with lazy_arithmetic():
+            result = iris.analysis.maths.exp(self.a / 10)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayAllClose(result.data, np.exp(self.a.data / 10))
+
+    def test_in_place(self):
+        with lazy_arithmetic():
+            self.a += self.b
+        self.assertFalse(self.a.has_lazy_data())
+        self.assertArrayEqual(self.a.data,
+                              np.arange(12).reshape(3, 4) * 2 + 1)
+
+    def test_state_restored(self):
+        with lazy_arithmetic():
+            pass
+        self.assertFalse((self.a * self.b).has_lazy_data())
+
+    def test_state_restored_on_error(self):
+        with self.assertRaises(ValueError):
+            with lazy_arithmetic():
+                raise ValueError()
+        self.assertFalse((self.a * self.b).has_lazy_data())
+
+    def test_nested(self):
+        with lazy_arithmetic():
+            with lazy_arithmetic():
+                pass
+            result = self.a * self.b
+        self.assertTrue(result.has_lazy_data())
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2014 - 2017, Met Office
+# (C) British Crown Copyright 2014 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -26,6 +26,7 @@ import iris.tests as tests
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import as_lazy_data
 from iris.analysis._regrid import RectilinearRegridder as Regridder
 from iris.aux_factory import HybridHeightFactory
 from iris.coord_systems import GeogCS, OSGB
@@ -1209,6 +1210,47 @@ class Test___call____NOP(tests.IrisTest):
         self.assertEqual(result, self.src)
 
 
+class Test___call____lazy(tests.IrisTest):
+    def setUp(self):
+        data = np.arange(5 * 6 * 7, dtype=np.float32).reshape(5, 6, 7)
+        src = Cube(data)
+        cs = OSGB()
+        src.add_dim_coord(DimCoord(np.arange(5), long_name='z'), 0)
+        src.add_dim_coord(DimCoord(np.arange(6), 'projection_y_coordinate',
+                                   units='m', coord_system=cs), 1)
+        src.add_dim_coord(DimCoord(np.arange(7), 'projection_x_coordinate',
+                                   units='m', coord_system=cs), 2)
+        self.src = src
+        grid = src[0, 1:4, 1:5].copy()
+        grid.coord('projection_x_coordinate').points = [0.5, 2.2, 3, 7.5]
+        self.grid = grid
+
+    def _check(self, src, method):
+        regridder = Regridder(self.src, self.grid, method, 'mask')
+        expected = regridder(src.copy())
+        lazy_src = src.copy(as_lazy_data(src.data, chunks=(2, 4, 3)))
+        result = regridder(lazy_src)
+        self.assertTrue(lazy_src.has_lazy_data())
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertEqual(result.coords(), expected.coords())
+        self.assertMaskedArrayEqual(result.data, expected.data)
+
+    def test_linear(self):
+        self._check(self.src, 'linear')
+
+    def test_nearest(self):
+        self._check(self.src, 'nearest')
+
+    def test_masked(self):
+        src = self.src.copy(ma.masked_equal(self.src.data % 9, 0))
+        self._check(src, 'linear')
+
+    def test_integer(self):
+        src = self.src.copy(self.src.data.astype(np.int32))
+        self._check(src, 'linear')
+
+
 @tests.skip_data
 class Test___call____circular(tests.IrisTest):
     def setUp(self):
@@ -28,7 +28,9 @@ import numpy.ma as ma
 
 import iris
 import iris.analysis.stats as stats
-from iris.exceptions import CoordinateNotFoundError
+from iris.coords import DimCoord
+from iris.cube import Cube
+from iris.exceptions import CoordinateCollapseError, CoordinateNotFoundError
 
 
 @tests.skip_data
@@ -151,5 +153,131 @@ class Test(tests.IrisTest):
         self.assertArrayAlmostEqual(r.data, np.array([1., 1.]))
 
 
+def _reference(x, y, weights=None):
+    # The weighted correlation of two 1-d arrays, ignoring masked points of
+    # either array.
+    valid = ~(ma.getmaskarray(x) | ma.getmaskarray(y))
+    x = ma.getdata(x)[valid]
+    y = ma.getdata(y)[valid]
+    weights = np.ones(x.shape) if weights is None else weights[valid]
+    x = x - np.average(x, weights=weights)
+    y = y - np.average(y, weights=weights)
+    return (np.sum(weights * x * y) /
+            np.sqrt(np.sum(weights * x * x) * np.sum(weights * y * y)))
+
+
+class TestSynthetic(tests.IrisTest):
+    def setUp(self):
+        shape = (20, 3, 4)
+        rng = np.random.RandomState(0)
+        self.cube_a = self._cube(280 + 5 * rng.randn(*shape))
+        self.cube_b = self._cube(self.cube_a.data + 5 * rng.randn(*shape))
+        self.weights = rng.rand(*shape)
+
+    def _cube(self, data):
+        cube = Cube(data, standard_name='air_temperature', units='K')
+        for dim, name in enumerate(['time', 'latitude', 'longitude']):
+            points = np.arange(data.shape[dim], dtype=np.float64)
+            cube.add_dim_coord(DimCoord(points, name), dim)
+        return cube
+
+    def _check(self, result, cube_a, cube_b, weights=None):
+        for i, j in np.ndindex(result.shape):
+            w = None if weights is None else weights[:, i, j]
+            expected = _reference(cube_a.data[:, i, j], cube_b.data[:, i, j],
+                                  w)
+            self.assertAlmostEqual(result.data[i, j], expected)
+
+    def test_lazy_result(self):
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time')
+        self.assertTrue(r.has_lazy_data())
+        self.assertFalse(self.cube_a.has_lazy_data())
+        self.assertFalse(self.cube_b.has_lazy_data())
+        self.assertEqual(r.name(), "Pearson's r")
+        self.assertEqual(r.units, 1)
+        self._check(r, self.cube_a, self.cube_b)
+
+    def test_lazy_chunked_inputs(self):
+        expected = stats.pearsonr(self.cube_a, self.cube_b, 'time')
+        for cube in (self.cube_a, self.cube_b):
+            cube.data = cube.lazy_data().rechunk((7, 2, 3))
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time')
+        self.assertTrue(self.cube_a.has_lazy_data())
+        self.assertTrue(self.cube_b.has_lazy_data())
+        self.assertArrayAllClose(r.data, expected.data)
+
+    def test_weights(self):
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time',
+                           weights=self.weights)
+        self._check(r, self.cube_a, self.cube_b, self.weights)
+
+    def test_large_offset(self):
+        # Values far from zero, relative to their variation.
+        self.cube_a.data = self.cube_a.data * 1e-3 + 1e6
+        self.cube_b.data = self.cube_b.data * 1e-3 + 1e6
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time')
+        self._check(r, self.cube_a, self.cube_b)
+
+    def test_all_dims(self):
+        r = stats.pearsonr(self.cube_a, self.cube_b)
+        self.assertEqual(r.shape, ())
+        expected = _reference(self.cube_a.data.ravel(),
+                              self.cube_b.data.ravel())
+        self.assertAlmostEqual(r.data, expected)
+
+    def test_mdtol(self):
+        mask = np.zeros(self.cube_b.shape, dtype=bool)
+        mask[:5, 0, 0] = True
+        mask[:15, 1, 1] = True
+        self.cube_b.data = ma.masked_array(self.cube_b.data, mask=mask)
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time', mdtol=0.5)
+        self.assertEqual(r.data.mask.sum(), 1)
+        self.assertTrue(r.data.mask[1, 1])
+
+    def test_separate_masks(self):
+        # Without a common mask, the mean and variance of each cube are
+        # calculated from all of its own unmasked points.
+        mask = np.zeros(self.cube_b.shape, dtype=bool)
+        mask[:5] = True
+        self.cube_b.data = ma.masked_array(self.cube_b.data, mask=mask)
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time')
+        x = self.cube_a.data[:, 0, 0]
+        y = self.cube_b.data[:, 0, 0]
+        covar = np.sum((x[5:] - x.mean()) * (y[5:] - y.mean()))
+        expected = covar / np.sqrt(np.sum((x - x.mean()) ** 2) *
+                                   np.sum((y[5:] - y.mean()) ** 2))
+        self.assertAlmostEqual(r.data[0, 0], expected)
+
+    def test_common_mask(self):
+        mask = np.zeros(self.cube_b.shape, dtype=bool)
+        mask[:5] = True
+        self.cube_b.data = ma.masked_array(self.cube_b.data, mask=mask)
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time',
+                           common_mask=True)
+        self._check(r, self.cube_a, self.cube_b)
+
+    def test_broadcast_masked(self):
+        mask = np.zeros(self.cube_b.shape, dtype=bool)
+        mask[:, 0, 0] = True
+        self.cube_b.data = ma.masked_array(self.cube_b.data, mask=mask)
+        cube_b = self.cube_b[0]
+        r = stats.pearsonr(self.cube_a, cube_b, ['latitude', 'longitude'],
+                           common_mask=True)
+        for i in range(self.cube_a.shape[0]):
+            expected = _reference(self.cube_a.data[i].ravel(),
+                                  cube_b.data.ravel())
+            self.assertAlmostEqual(r.data[i], expected)
+
+    def test_zero_variance(self):
+        self.cube_a.data[:, 0, 0] = 1.5
+        r = stats.pearsonr(self.cube_a, self.cube_b, 'time')
+        self.assertTrue(r.data.mask[0, 0])
+        self.assertEqual(r.data.mask.sum(), 1)
+
+    def test_collapse_scalar_coord(self):
+        with self.assertRaises(CoordinateCollapseError):
+            stats.pearsonr(self.cube_a, self.cube_b[:, :, 0], 'longitude')
+
+
 if __name__ == '__main__':
     tests.main()
@@ -0,0 +1,71 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :data:`iris.analysis.HMEAN` aggregator."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris.analysis import HMEAN
+from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
+
+
+class Test_lazy_aggregate(tests.IrisTest):
+    def setUp(self):
+        self.data = ma.arange(1., 13.).reshape(3, 4)
+        self.data[1, 1:] = ma.masked
+        self.data[:, 3] = ma.masked
+        self.array = as_lazy_data(self.data, chunks=(1, 2))
+
+    def test_lazy(self):
+        result = HMEAN.lazy_aggregate(self.array, axis=0)
+        self.assertTrue(is_lazy_data(result))
+        # The last column is entirely masked.
+        expected = ma.array([3. / (1 + 1. / 5 + 1. / 9),
+                             2. / (1. / 2 + 1. / 10),
+                             2. / (1. / 3 + 1. / 11), 0.],
+                            mask=[False, False, False, True])
+        self.assertMaskedArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_multiple_axes(self):
+        result = HMEAN.lazy_aggregate(as_lazy_data(np.array([[1., 2.],
+                                                             [4., 4.]])),
+                                      axis=[0, 1])
+        self.assertAlmostEqual(as_concrete_data(result), 2.)
+
+    def test_dtype(self):
+        # Match the real aggregation of masked data.
+        data = self.data.astype(np.float32)
+        result = HMEAN.lazy_aggregate(as_lazy_data(data), axis=0)
+        expected = HMEAN.aggregate(data, axis=0)
+        self.assertEqual(result.dtype, expected.dtype)
+        self.assertEqual(as_concrete_data(result).dtype, expected.dtype)
+
+
+class Test_name(tests.IrisTest):
+    def test(self):
+        self.assertEqual(HMEAN.name(), 'harmonic_mean')
+
+
+if __name__ == "__main__":
+    tests.main()
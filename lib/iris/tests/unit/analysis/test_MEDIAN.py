@@ -0,0 +1,65 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :data:`iris.analysis.MEDIAN` aggregator."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris.analysis import MEDIAN
+from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
+
+
+class Test_lazy_aggregate(tests.IrisTest):
+    def setUp(self):
+        self.data = ma.arange(12.).reshape(3, 4) % 5
+        self.data[1, 1:] = ma.masked
+        self.data[:, 3] = ma.masked
+        self.array = as_lazy_data(self.data, chunks=(1, 2))
+
+    def test_lazy(self):
+        result = MEDIAN.lazy_aggregate(self.array, axis=0)
+        self.assertTrue(is_lazy_data(result))
+        self.assertMaskedArrayEqual(as_concrete_data(result),
+                                    ma.median(self.data, axis=0))
+
+    def test_multiple_axes(self):
+        data = np.arange(24.).reshape(2, 3, 4) % 7
+        array = as_lazy_data(data, chunks=(1, 1, 2))
+        result = MEDIAN.lazy_aggregate(array, axis=[0, 2])
+        expected = np.median(data.transpose(1, 0, 2).reshape(3, 8), axis=1)
+        self.assertArrayEqual(as_concrete_data(result), expected)
+
+    def test_mdtol(self):
+        result = MEDIAN.lazy_aggregate(self.array, axis=0, mdtol=0.1)
+        expected = MEDIAN.aggregate(self.data, axis=0, mdtol=0.1)
+        self.assertMaskedArrayEqual(as_concrete_data(result), expected)
+
+
+class Test_name(tests.IrisTest):
+    def test(self):
+        self.assertEqual(MEDIAN.name(), 'median')
+
+
+if __name__ == "__main__":
+    tests.main()
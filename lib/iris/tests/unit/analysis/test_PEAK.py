@@ -0,0 +1,82 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :data:`iris.analysis.PEAK` aggregator."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris.analysis import PEAK
+from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
+
+
+class Test_lazy_aggregate(tests.IrisTest):
+    def setUp(self):
+        self.data = np.array([[1., 2., 4., 2., 1.],
+                              [3., 3., 3., 3., 3.],
+                              [1., 5., 3., 2., np.nan]])
+        self.array = as_lazy_data(self.data, chunks=(1, 2))
+
+    def test_lazy(self):
+        result = PEAK.lazy_aggregate(self.array, axis=1)
+        self.assertTrue(is_lazy_data(result))
+        expected = PEAK.aggregate(self.data, axis=1)
+        self.assertArrayEqual(as_concrete_data(result), expected)
+
+    def test_masked(self):
+        data = ma.masked_array(self.data, mask=np.isnan(self.data))
+        data[1] = ma.masked
+        result = PEAK.lazy_aggregate(as_lazy_data(data, chunks=(1, 2)),
+                                     axis=1)
+        expected = PEAK.aggregate(data, axis=1)
+        self.assertMaskedArrayEqual(as_concrete_data(result), expected)
+
+    def test_axis_0(self):
+        result = PEAK.lazy_aggregate(self.array[:2], axis=0)
+        expected = PEAK.aggregate(self.data[:2].T, axis=1)
+        self.assertArrayEqual(as_concrete_data(result), expected)
+
+    def test_mdtol(self):
+        data = ma.masked_array(self.data, mask=np.isnan(self.data))
+        data[1, 1:] = ma.masked
+        result = PEAK.lazy_aggregate(as_lazy_data(data, chunks=(1, 2)),
+                                     axis=1, mdtol=0.5)
+        expected = PEAK.aggregate(data, axis=1, mdtol=0.5)
+        self.assertMaskedArrayEqual(as_concrete_data(result), expected)
+        self.assertArrayEqual(ma.getmaskarray(expected), [False, True, False])
+
+    def test_1d(self):
+        # As for the real aggregation, the result has shape (1,).
+        result = PEAK.lazy_aggregate(self.array[0], axis=0)
+        expected = PEAK.aggregate(self.data[0], axis=0)
+        self.assertEqual(result.shape, (1,))
+        self.assertArrayEqual(as_concrete_data(result), expected)
+
+
+class Test_name(tests.IrisTest):
+    def test(self):
+        self.assertEqual(PEAK.name(), 'peak')
+
+
+if __name__ == "__main__":
+    tests.main()
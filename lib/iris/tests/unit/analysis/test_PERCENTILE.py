@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2015, Met Office
+# (C) British Crown Copyright 2015 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -27,6 +27,8 @@ import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import PERCENTILE
+from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
+from iris.tests import mock
 
 
 class Test_aggregate(tests.IrisTest):
@@ -111,6 +113,106 @@ class Test_aggregate(tests.IrisTest):
         self.assertArrayAlmostEqual(actual, expected)
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(60.).reshape(3, 4, 5) % 7
+        self.array = as_lazy_data(self.data, chunks=(2, 2, 2))
+
+    def test_missing_mandatory_kwarg(self):
+        emsg = "percentile aggregator requires .* keyword argument 'percent'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            PERCENTILE.lazy_aggregate(self.array, axis=0)
+
+    def test_1d_single(self):
+        array = as_lazy_data(np.arange(11), chunks=3)
+        result = PERCENTILE.lazy_aggregate(array, axis=0, percent=50)
+        self.assertTrue(is_lazy_data(result))
+        self.assertEqual(as_concrete_data(result), 5)
+
+    def test_single(self):
+        result = PERCENTILE.lazy_aggregate(self.array, axis=1, percent=50)
+        self.assertTrue(is_lazy_data(result))
+        expected = PERCENTILE.aggregate(self.data, axis=1, percent=50)
+        self.assertArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_multi(self):
+        percent = [10, 50, 90]
+        result = PERCENTILE.lazy_aggregate(self.array, axis=1,
+                                           percent=percent)
+        self.assertEqual(result.shape, (3, 5, 3))
+        expected = PERCENTILE.aggregate(self.data, axis=1, percent=percent)
+        self.assertArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_multiple_axes(self):
+        percent = [25, 75]
+        result = PERCENTILE.lazy_aggregate(self.array, axis=[0, 2],
+                                           percent=percent)
+        self.assertEqual(result.shape, (4, 2))
+        data = self.data.transpose(1, 0, 2).reshape(4, 15)
+        expected = PERCENTILE.aggregate(data, axis=1, percent=percent)
+        self.assertArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_masked_mdtol(self):
+        data = ma.masked_array(self.data, mask=self.data > 4)
+        array = as_lazy_data(data, chunks=(2, 2, 2))
+        percent = [10, 90]
+        result = PERCENTILE.lazy_aggregate(array, axis=0, percent=percent,
+                                           mdtol=0.5)
+        expected = PERCENTILE.aggregate(data, axis=0, percent=percent,
+                                        mdtol=0.5)
+        self.assertMaskedArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_approx_small(self):
+        # A sketch without any merged centroids is exact.
+        percent = [0, 10, 50, 90, 100]
+        result = PERCENTILE.lazy_aggregate(self.array, axis=[0, 2],
+                                           percent=percent, approx=True)
+        self.assertTrue(is_lazy_data(result))
+        exact = PERCENTILE.lazy_aggregate(self.array, axis=[0, 2],
+                                          percent=percent)
+        self.assertArrayAlmostEqual(as_concrete_data(result),
+                                    as_concrete_data(exact))
+
+    def test_approx_masked(self):
+        data = ma.masked_array(self.data, mask=self.data > 4)
+        data[:, 0, 0] = ma.masked
+        array = as_lazy_data(data, chunks=(2, 2, 2))
+        result = PERCENTILE.lazy_aggregate(array, axis=0, percent=50,
+                                           approx=True)
+        expected = PERCENTILE.aggregate(data, axis=0, percent=50)
+        self.assertMaskedArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_approx_large(self):
+        data = np.random.RandomState(0).normal(size=(2, 100000))
+        array = as_lazy_data(data, chunks=(1, 10000))
+        percent = [1, 10, 50, 90, 99]
+        result = PERCENTILE.lazy_aggregate(array, axis=1, percent=percent,
+                                           approx=True)
+        expected = np.percentile(data, percent, axis=1).T
+        self.assertArrayAllClose(as_concrete_data(result), expected,
+                                 atol=0.01)
+
+    def test_approx_numpy_1_14(self):
+        # The approximation does not use numpy.take_along_axis, which is
+        # only available from numpy 1.15.
+        with mock.patch('numpy.take_along_axis', side_effect=AttributeError):
+            self.test_approx_masked()
+            self.test_approx_large()
+
+    def test_approx_compression(self):
+        emsg = 'compression must be at least 2'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            PERCENTILE.lazy_aggregate(self.array, axis=0, percent=50,
+                                      approx=True, compression=1)
+
+    def test_approx_real_data(self):
+        # The approximation only applies to lazy data.
+        actual = PERCENTILE.aggregate(self.data, axis=0, percent=50,
+                                      approx=True, compression=2)
+        expected = PERCENTILE.aggregate(self.data, axis=0, percent=50)
+        self.assertArrayEqual(actual, expected)
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(PERCENTILE.name(), 'percentile')
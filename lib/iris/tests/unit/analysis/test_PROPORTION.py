@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2013 - 2017, Met Office
+# (C) British Crown Copyright 2013 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -23,11 +23,13 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import PROPORTION
 import iris.cube
 from iris.coords import DimCoord
+from iris._lazy_data import as_concrete_data, as_lazy_data
 
 
 class Test_units_func(tests.IrisTest):
@@ -49,6 +51,35 @@ class Test_masked(tests.IrisTest):
         self.assertArrayEqual(cube.data, [0.5])
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def setUp(self):
+        self.data = ma.arange(12).reshape(3, 4)
+        self.data[1, 1:] = ma.masked
+        self.data[:, 3] = ma.masked
+        self.array = as_lazy_data(self.data, chunks=(1, 2))
+        self.func = lambda x: x >= 5
+
+    def test_masked(self):
+        result = PROPORTION.lazy_aggregate(self.array, axis=0,
+                                           function=self.func)
+        expected = PROPORTION.aggregate(self.data, axis=0, function=self.func)
+        self.assertMaskedArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_mdtol(self):
+        result = PROPORTION.lazy_aggregate(self.array, axis=0, mdtol=0.1,
+                                           function=self.func)
+        expected = PROPORTION.aggregate(self.data, axis=0, mdtol=0.1,
+                                        function=self.func)
+        self.assertMaskedArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_lazy_cube(self):
+        cube = iris.cube.Cube(as_lazy_data(np.arange(10.), chunks=3))
+        cube.add_dim_coord(DimCoord(np.arange(10), long_name='foo'), 0)
+        result = cube.collapsed('foo', PROPORTION, function=self.func)
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayAlmostEqual(result.data, 0.5)
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(PROPORTION.name(), 'proportion')
@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2013 - 2015, Met Office
+# (C) British Crown Copyright 2013 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -27,6 +27,7 @@ import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import RMS
+from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
 
 
 class Test_aggregate(tests.IrisTest):
@@ -88,6 +89,48 @@ class Test_aggregate(tests.IrisTest):
         self.assertAlmostEqual(rms, expected_rms)
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def test_2d(self):
+        data = np.array([[5, 2, 6, 4], [12, 4, 10, 8]], dtype=np.float64)
+        rms = RMS.lazy_aggregate(as_lazy_data(data, chunks=(1, 2)), 1)
+        self.assertTrue(is_lazy_data(rms))
+        self.assertArrayAlmostEqual(as_concrete_data(rms), [4.5, 9.0])
+
+    def test_2d_weighted(self):
+        data = np.array([[4, 7, 10, 8], [14, 16, 20, 8]], dtype=np.float64)
+        weights = np.array([[1, 4, 3, 2], [2, 1, 1.5, 0.5]], dtype=np.float64)
+        rms = RMS.lazy_aggregate(as_lazy_data(data, chunks=(1, 2)), 1,
+                                 weights=weights)
+        self.assertArrayAlmostEqual(as_concrete_data(rms), [8.0, 16.0])
+
+    def test_masked_weighted(self):
+        data = ma.array([4, 7, 18, 10, 11, 8],
+                        mask=[False, False, True, False, True, False],
+                        dtype=np.float64)
+        weights = np.array([1, 4, 5, 3, 8, 2], dtype=np.float64)
+        rms = RMS.lazy_aggregate(as_lazy_data(data, chunks=2), 0,
+                                 weights=weights)
+        self.assertAlmostEqual(as_concrete_data(rms), 8.0)
+
+    def test_dtype(self):
+        # Match the real aggregation of masked data.
+        data = ma.array([[4, 7], [10, 8]],
+                        mask=[[False, True], [False, False]], dtype=np.float32)
+        rms = RMS.lazy_aggregate(as_lazy_data(data), 0)
+        expected = RMS.aggregate(data, 0)
+        self.assertEqual(rms.dtype, expected.dtype)
+        self.assertEqual(as_concrete_data(rms).dtype, expected.dtype)
+
+    def test_weighted_dtype(self):
+        data = ma.array([[4, 7], [10, 8]],
+                        mask=[[False, True], [False, False]], dtype=np.float32)
+        weights = np.ones((2, 2), dtype=np.float32)
+        rms = RMS.lazy_aggregate(as_lazy_data(data), 0, weights=weights)
+        expected = RMS.aggregate(data, 0, weights=weights)
+        self.assertEqual(rms.dtype, expected.dtype)
+        self.assertEqual(as_concrete_data(rms).dtype, expected.dtype)
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(RMS.name(), 'root_mean_square')
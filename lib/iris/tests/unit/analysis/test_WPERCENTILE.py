@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2015 - 2016, Met Office
+# (C) British Crown Copyright 2015 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -27,6 +27,7 @@ import numpy as np
 import numpy.ma as ma
 
 from iris.analysis import WPERCENTILE
+from iris._lazy_data import as_concrete_data, as_lazy_data, is_lazy_data
 
 
 class Test_aggregate(tests.IrisTest):
@@ -183,6 +184,79 @@ class Test_aggregate(tests.IrisTest):
         self.assertArrayEqual(weight_total, np.repeat(4, shape[-1]))
 
 
+class Test_lazy_aggregate(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(60.).reshape(3, 4, 5) % 7
+        self.array = as_lazy_data(self.data, chunks=(2, 2, 2))
+        self.weights = np.arange(60.).reshape(3, 4, 5) % 5 + 1
+
+    def test_missing_mandatory_kwargs(self):
+        emsg = "weighted_percentile aggregator requires " \
+               ".* keyword argument 'weights'"
+        with self.assertRaisesRegexp(ValueError, emsg):
+            WPERCENTILE.lazy_aggregate(self.array, axis=0, percent=50)
+
+    def test_wrong_weights_shape(self):
+        emsg = "_weighted_percentile: weights wrong shape."
+        with self.assertRaisesRegexp(ValueError, emsg):
+            WPERCENTILE.lazy_aggregate(self.array, axis=0, percent=50,
+                                       weights=np.ones(3))
+
+    def test_multi(self):
+        percent = [10, 50, 90]
+        result = WPERCENTILE.lazy_aggregate(self.array, axis=1,
+                                            percent=percent,
+                                            weights=self.weights)
+        self.assertTrue(is_lazy_data(result))
+        self.assertEqual(result.shape, (3, 5, 3))
+        expected = WPERCENTILE.aggregate(self.data, axis=1, percent=percent,
+                                         weights=self.weights)
+        self.assertArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_multiple_axes_returned(self):
+        result, weights = WPERCENTILE.lazy_aggregate(
+            self.array, axis=[0, 2], percent=50, weights=self.weights,
+            returned=True)
+        self.assertEqual(result.shape, (4,))
+        data = self.data.transpose(1, 0, 2).reshape(4, 15)
+        expected = WPERCENTILE.aggregate(
+            data, axis=1, percent=50,
+            weights=self.weights.transpose(1, 0, 2).reshape(4, 15))
+        self.assertArrayAlmostEqual(as_concrete_data(result), expected)
+        self.assertArrayAlmostEqual(as_concrete_data(weights),
+                                    self.weights.sum(axis=(0, 2)))
+
+    def test_masked(self):
+        data = ma.masked_array(self.data, mask=self.data > 4)
+        data[:, 0, 0] = ma.masked
+        array = as_lazy_data(data, chunks=(2, 2, 2))
+        result = WPERCENTILE.lazy_aggregate(array, axis=0, percent=[25, 75],
+                                            weights=self.weights)
+        expected = WPERCENTILE.aggregate(data, axis=0, percent=[25, 75],
+                                         weights=self.weights)
+        self.assertMaskedArrayAlmostEqual(as_concrete_data(result), expected)
+
+    def test_approx(self):
+        data = np.random.RandomState(0).normal(size=(2, 100000))
+        weights = np.random.RandomState(1).uniform(size=data.shape)
+        array = as_lazy_data(data, chunks=(1, 10000))
+        percent = [1, 10, 50, 90, 99]
+        result = WPERCENTILE.lazy_aggregate(array, axis=1, percent=percent,
+                                            weights=weights, approx=True)
+        self.assertTrue(is_lazy_data(result))
+        expected = WPERCENTILE.aggregate(data, axis=1, percent=percent,
+                                         weights=weights)
+        self.assertArrayAllClose(as_concrete_data(result), expected,
+                                 atol=0.01)
+
+    def test_approx_kind(self):
+        emsg = 'Only linear interpolation is supported'
+        with self.assertRaisesRegexp(ValueError, emsg):
+            WPERCENTILE.lazy_aggregate(self.array, axis=0, percent=50,
+                                       weights=self.weights, approx=True,
+                                       kind='nearest')
+
+
 class Test_name(tests.IrisTest):
     def test(self):
         self.assertEqual(WPERCENTILE.name(), 'weighted_percentile')
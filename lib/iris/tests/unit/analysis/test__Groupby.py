@@ -0,0 +1,106 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :class:`iris.analysis._Groupby` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.analysis import _Groupby
+from iris.coords import AuxCoord, DimCoord
+from iris.tests import mock
+
+
+class Test_group(tests.IrisTest):
+    def test_single_coord(self):
+        coord = AuxCoord([1, 1, 2, 2, 2, 3], long_name='a')
+        groupby = _Groupby([coord])
+        self.assertEqual(list(groupby.group()),
+                         [slice(0, 2), slice(2, 5), slice(5, 6)])
+        self.assertArrayEqual(groupby.coords[0].points, [1, 2, 3])
+
+    def test_non_contiguous_groups(self):
+        coord = AuxCoord(['b', 'a', 'a', 'b', 'c', 'a'], long_name='a')
+        groupby = _Groupby([coord])
+        self.assertEqual(list(groupby.group()),
+                         [(0, 3), (1, 2, 5), slice(4, 5)])
+        self.assertArrayEqual(groupby.coords[0].points, ['b', 'a', 'c'])
+
+    def test_multiple_coords(self):
+        year = AuxCoord([2000, 2000, 2000, 2001, 2001, 2000], long_name='y')
+        month = AuxCoord([1, 2, 2, 1, 2, 1], long_name='m')
+        groupby = _Groupby([year, month])
+        self.assertEqual(list(groupby.group()),
+                         [(0, 5), slice(1, 3), slice(3, 4), slice(4, 5)])
+        self.assertArrayEqual(groupby.coords[0].points,
+                              [2000, 2000, 2001, 2001])
+        self.assertArrayEqual(groupby.coords[1].points, [1, 2, 1, 2])
+
+    def test_nan_never_grouped(self):
+        coord = AuxCoord([1.0, np.nan, np.nan, 1.0], long_name='a')
+        groupby = _Groupby([coord])
+        self.assertEqual(list(groupby.group()),
+                         [(0, 3), slice(1, 2), slice(2, 3)])
+
+    def test_categorical_coord(self):
+        coord = AuxCoord.from_categories(np.array(['x', 'y']),
+                                         np.array([1, 1, 0, 1]),
+                                         long_name='a')
+        groupby = _Groupby([coord])
+        self.assertEqual(list(groupby.group()),
+                         [(0, 1, 3), slice(2, 3)])
+        self.assertArrayEqual(groupby.coords[0].points, ['y', 'x'])
+        self.assertIsNotNone(groupby.coords[0]._categorical_points())
+
+    def test_zero_length_coords(self):
+        # Zero-length group-by coordinates have no groups.
+        coords = [mock.Mock(ndim=1, shape=(0,), points=np.array([]),
+                            **{'_categorical_points.return_value': None})
+                  for _ in range(2)]
+        groupby = _Groupby(coords)
+        self.assertEqual(list(groupby.group()), [])
+        self.assertEqual(len(groupby), 0)
+        self.assertEqual(groupby.coords, [])
+
+    def test_shared_coords(self):
+        coord = AuxCoord([1, 1, 2, 2, 1], long_name='a')
+        shared = AuxCoord([0., 1., 2., 3., 4.], long_name='b')
+        labels = AuxCoord(['p', 'q', 'r', 's', 't'], long_name='c')
+        groupby = _Groupby([coord], [shared, labels])
+        list(groupby.group())
+        _, shared, labels = groupby.coords
+        self.assertArrayEqual(shared.bounds, [[0., 4.], [2., 3.]])
+        self.assertArrayEqual(shared.points, [2., 2.5])
+        self.assertArrayEqual(labels.points, ['p|q|t', 'r|s'])
+
+    def test_circular_shared_coord(self):
+        coord = AuxCoord([1, 1, 2, 2], long_name='a')
+        shared = DimCoord([0., 90., 180., 270.], long_name='lon',
+                          units='degrees', circular=True)
+        groupby = _Groupby([coord], [shared])
+        list(groupby.group())
+        self.assertArrayEqual(groupby.coords[1].bounds,
+                              [[0., 90.], [180., 360.]])
+
+
+if __name__ == '__main__':
+    tests.main()
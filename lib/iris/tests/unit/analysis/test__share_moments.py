@@ -0,0 +1,75 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for :func:`iris.analysis._share_moments`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.analysis import MAX, MEAN, RMS, STD_DEV, _share_moments
+from iris._lazy_data import as_concrete_data, as_lazy_data
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(12.).reshape(3, 4) ** 2
+        self.array = as_lazy_data(self.data, chunks=(1, 2))
+
+    def test_copies(self):
+        lazy_func = MEAN.lazy_func
+        mean, maximum = _share_moments([MEAN, MAX])
+        self.assertIsNot(mean, MEAN)
+        self.assertIsNot(mean.lazy_func, lazy_func)
+        self.assertIs(MEAN.lazy_func, lazy_func)
+        self.assertEqual(mean.name(), MEAN.name())
+        self.assertIs(maximum, MAX)
+
+    def test_statistics(self):
+        mean, std_dev, rms = _share_moments([MEAN, STD_DEV, RMS])
+        for shared, aggregator in ((mean, MEAN), (std_dev, STD_DEV),
+                                   (rms, RMS)):
+            result = shared.lazy_aggregate(self.array, axis=[0, 1])
+            expected = aggregator.lazy_aggregate(self.array, axis=[0, 1])
+            self.assertArrayAlmostEqual(as_concrete_data(result),
+                                        as_concrete_data(expected))
+
+    def test_precision(self):
+        # The moments are relative to a reference value, so the variance
+        # of values with a large offset is not lost to rounding.
+        data = 1e8 + np.arange(4.)
+        std_dev, = _share_moments([STD_DEV])
+        result = std_dev.lazy_aggregate(as_lazy_data(data), axis=0)
+        self.assertAlmostEqual(as_concrete_data(result),
+                               np.std(np.arange(4.), ddof=1))
+
+    def test_weights(self):
+        # Other keywords use the aggregator's own lazy operation.
+        weights = np.ones(self.data.shape)
+        weights[0] = 3
+        rms, = _share_moments([RMS])
+        result = rms.lazy_aggregate(self.array, axis=0, weights=weights)
+        expected = RMS.aggregate(self.data, axis=0, weights=weights)
+        self.assertArrayAlmostEqual(as_concrete_data(result), expected)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,84 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :func:`iris.analysis.coord_comparison` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.analysis import coord_comparison
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube
+
+
+def _cube(height=0.):
+    cube = Cube(np.zeros((2, 3)))
+    cube.add_dim_coord(DimCoord([0., 1.], 'latitude'), 0)
+    cube.add_aux_coord(AuxCoord([0., np.nan, 2.], long_name='foo'), 1)
+    cube.add_aux_coord(AuxCoord([height], 'height'))
+    return cube
+
+
+def _names(groups):
+    return [group.name() for group in groups]
+
+
+class Test(tests.IrisTest):
+    def test_same_cube(self):
+        cube = _cube()
+        result = coord_comparison(cube, cube)
+        self.assertEqual(_names(result['equal']),
+                         ['foo', 'height', 'latitude'])
+        self.assertEqual(result['not_equal'], [])
+
+    def test_groups(self):
+        cube1 = _cube()
+        cube2 = _cube(height=1.)
+        cube2.remove_coord('latitude')
+        cube2.add_aux_coord(AuxCoord([0., 1.], 'latitude'), 0)
+        result = coord_comparison(cube1, cube2)
+        self.assertEqual(_names(result['grouped_coords']),
+                         ['foo', 'height', 'latitude'])
+        self.assertEqual([list(group) for group in result['grouped_coords']
+                          if group.name() == 'latitude'],
+                         [[cube1.coord('latitude'), cube2.coord('latitude')]])
+        # NaN points are not equal.
+        self.assertEqual(_names(result['not_equal']), ['foo', 'height'])
+        self.assertEqual(_names(result['equal']), ['latitude'])
+        self.assertEqual(_names(result['ignorable']), ['height'])
+        self.assertEqual(_names(result['resamplable']), ['foo'])
+        self.assertEqual(_names(result['scalar']), ['height'])
+        self.assertEqual(result['ungroupable'], [])
+
+    def test_ungroupable(self):
+        cube1 = _cube()
+        cube2 = _cube()
+        cube2.remove_coord('foo')
+        result = coord_comparison(cube1, cube2)
+        self.assertEqual(_names(result['ungroupable_and_dimensioned']),
+                         ['foo'])
+        self.assertEqual([list(group) for group in result['ungroupable']],
+                         [[cube1.coord('foo'), None]])
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -25,11 +25,13 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # Import iris.tests first so that some things can be initialised before
 # importing anything else.
 import iris.tests as tests
+from iris.tests import mock
 
 from contextlib import contextmanager
 
 import numpy as np
 
+from iris._lazy_data import as_lazy_data
 from iris.coords import AuxCoord, DimCoord
 from iris.coord_systems import GeogCS, RotatedGeogCS
 from iris.cube import Cube, CubeList
@@ -301,6 +303,43 @@ class Test__call__(MixinExampleSetup, tests.IrisTest):
                 cube.coord(coord_name).coord_system = cs
         self._check_expected()
 
+    def test_lazy_data(self):
+        src_cube = self.src_z_cube
+        src_cube.data = as_lazy_data(src_cube.data, chunks=(1, 2))
+        gridder = unn_gridder(src_cube, self.grid_cube)
+        result = gridder(src_cube)
+        self.assertTrue(result.has_lazy_data())
+        self.assertTrue(src_cube.has_lazy_data())
+        self.assertArrayEqual(result.data, self.expected_data_zxy)
+
+    def test_masked_data(self):
+        src_cube = self.src_cube
+        src_cube.data = np.ma.masked_array(src_cube.data,
+                                           mask=[False, True, False, False])
+        gridder = unn_gridder(src_cube, self.grid_cube)
+        result = gridder(src_cube)
+        expected = np.ma.masked_array(self.expected_data,
+                                      mask=self.expected_data == 1.12)
+        self.assertMaskedArrayEqual(result.data, expected)
+
+    def test_dtype_preserved(self):
+        src_cube = self.src_cube
+        src_cube.data = src_cube.data.astype(np.float32)
+        gridder = unn_gridder(src_cube, self.grid_cube)
+        result = gridder(src_cube)
+        self.assertEqual(result.dtype, np.float32)
+
+    def test_no_repeated_search(self):
+        # The nearest-neighbour search is only done when the regridder is
+        # created, and not for each call.
+        target = ('iris.analysis.trajectory.'
+                  '_nearest_neighbour_indices_ndcoords')
+        gridder = unn_gridder(self.src_cube, self.grid_cube)
+        with mock.patch(target) as search:
+            gridder(self.src_cube)
+            gridder(self.src_z_cube)
+        self.assertEqual(search.call_count, 0)
+
 
 if __name__ == "__main__":
     tests.main()
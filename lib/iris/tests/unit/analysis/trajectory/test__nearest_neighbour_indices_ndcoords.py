@@ -26,11 +26,18 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # Import iris.tests first so that some things can be initialised before
 # importing anything else.
 import iris.tests as tests
+from iris.tests import mock
+
+import os
+import shutil
+import tempfile
 
 import numpy as np
+from scipy.spatial import cKDTree
 
 from iris.cube import Cube
 from iris.coords import DimCoord, AuxCoord
+import iris.util
 
 from iris.analysis.trajectory import \
     _nearest_neighbour_indices_ndcoords as nn_ndinds
@@ -223,5 +230,93 @@ class TestLatlon(tests.IrisTest):
             expect=1)
 
 
+class TestCache(tests.IrisTest):
+    # Check re-use of the nearest-neighbour search.
+    def setUp(self):
+        co_x = AuxCoord([1.0, 2.0, 3.0], long_name='x')
+        co_y = AuxCoord([10.0, 20.0], long_name='y')
+        cube = Cube(np.zeros((2, 3)))
+        cube.add_aux_coord(co_y, 0)
+        cube.add_aux_coord(co_x, 1)
+        self.cube = cube
+        self.sample_point = [('x', 2.8), ('y', 18.5)]
+        self.temp_dir = tempfile.mkdtemp()
+        for name, size in [('_kdtree_cache', 8), ('_nn_indices_cache', 64)]:
+            patch = mock.patch('iris.analysis.trajectory.' + name,
+                               iris.util._LRUCache(size))
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_memory(self):
+        # Results are shared by cubes on the same grid, without a cache_dir.
+        result = nn_ndinds(self.cube, self.sample_point)
+        other_cube = self.cube.copy(data=np.ones((2, 3)))
+        with mock.patch('iris.analysis.trajectory.cKDTree') as kdtree:
+            other_result = nn_ndinds(other_cube, self.sample_point)
+        self.assertEqual(kdtree.call_count, 0)
+        self.assertEqual(other_result, result)
+
+    def test_memory_new_points(self):
+        # The search tree of a grid is shared by different sample points.
+        nn_ndinds(self.cube, self.sample_point)
+        with mock.patch('iris.analysis.trajectory.cKDTree',
+                        side_effect=cKDTree) as kdtree:
+            result = nn_ndinds(self.cube, [('x', 1.1), ('y', 11.0)])
+        self.assertEqual(kdtree.call_count, 0)
+        self.assertEqual(result, [(0, 0)])
+
+    def test_memory_different_grid(self):
+        nn_ndinds(self.cube, self.sample_point)
+        self.cube.coord('x').points = [1.0, 2.7, 4.0]
+        result = nn_ndinds(self.cube, self.sample_point)
+        self.assertEqual(result, [(1, 1)])
+
+    def test_memory_bounded(self):
+        with mock.patch('iris.analysis.trajectory._kdtree_cache',
+                        iris.util._LRUCache(1)) as trees:
+            nn_ndinds(self.cube, self.sample_point)
+            self.cube.coord('x').points = [1.0, 2.7, 4.0]
+            nn_ndinds(self.cube, self.sample_point)
+        self.assertEqual(len(trees), 1)
+
+    def test_cache_dir(self):
+        # Saved results can be shared by cubes on the same grid.
+        result = nn_ndinds(self.cube, self.sample_point,
+                           cache_dir=self.temp_dir)
+        self.assertEqual(len(os.listdir(self.temp_dir)), 1)
+        other_cube = self.cube.copy(data=np.ones((2, 3)))
+        with mock.patch('iris.analysis.trajectory.cKDTree') as kdtree:
+            other_result = nn_ndinds(other_cube, self.sample_point,
+                                     cache_dir=self.temp_dir)
+        self.assertEqual(kdtree.call_count, 0)
+        self.assertEqual(other_result, result)
+
+    def test_cache_dir_different_grid(self):
+        nn_ndinds(self.cube, self.sample_point, cache_dir=self.temp_dir)
+        self.cube.coord('x').points = [1.0, 2.7, 4.0]
+        result = nn_ndinds(self.cube, self.sample_point,
+                           cache_dir=self.temp_dir)
+        self.assertEqual(result, [(1, 1)])
+        self.assertEqual(len(os.listdir(self.temp_dir)), 2)
+
+    def test_cache_dir_no_pickle(self):
+        # The saved results are plain arrays, readable without unpickling.
+        nn_ndinds(self.cube, self.sample_point, cache_dir=self.temp_dir)
+        filename, = os.listdir(self.temp_dir)
+        indices = np.load(os.path.join(self.temp_dir, filename),
+                          allow_pickle=False)
+        self.assertArrayEqual(indices, [5])
+
+    def test_cache_dir_new_points(self):
+        nn_ndinds(self.cube, self.sample_point, cache_dir=self.temp_dir)
+        result = nn_ndinds(self.cube, [('x', 1.1), ('y', 11.0)],
+                           cache_dir=self.temp_dir)
+        self.assertEqual(result, [(0, 0)])
+        self.assertEqual(len(os.listdir(self.temp_dir)), 2)
+
+
 if __name__ == "__main__":
     tests.main()
@@ -28,6 +28,8 @@ import iris.tests as tests
 
 import numpy as np
 
+from iris._lazy_data import as_lazy_data
+from iris.analysis import Linear
 from iris.coords import AuxCoord, DimCoord
 import iris.tests.stock
 
@@ -181,5 +183,69 @@ class TestNearest(tests.IrisTest):
         self.assertEqual(result, expected)
 
 
+class TestLinear(tests.IrisTest):
+    # Test interpolation with 'linear' method.
+    # Results are checked against single-point cube interpolations.
+    def setUp(self):
+        cube = iris.tests.stock.simple_3d()
+        for coord_name in ('longitude', 'latitude'):
+            coord = cube.coord(coord_name)
+            coord.points = coord.points.astype(float)
+        self.test_cube = cube
+        self.sample_points = [('latitude', [0.0, 10.0, 20.5, -45.0]),
+                              ('longitude', [-90.0, 10.0, 45.0, 90.0])]
+
+    def _expected_data(self, cube):
+        columns = [cube.interpolate([('latitude', lat), ('longitude', lon)],
+                                    Linear()).data
+                   for lat, lon in zip(*[values for _, values in
+                                         self.sample_points])]
+        return np.ma.stack(columns, axis=-1)
+
+    def test_multi_point(self):
+        cube = self.test_cube
+        result = interpolate(cube, self.sample_points)
+        self.assertEqual(result.shape, (2, 4))
+        self.assertArrayAllClose(result.data, self._expected_data(cube))
+        self.assertArrayEqual(result.coord('latitude').points,
+                              self.sample_points[0][1])
+        self.assertArrayEqual(result.coord('longitude').points,
+                              self.sample_points[1][1])
+
+    def test_aux_coord_one_interp_dim(self):
+        cube = self.test_cube
+        cube.add_aux_coord(AuxCoord([11.0, 12.0, 13.0, 14.0],
+                                    long_name='aux_x'), 2)
+        result = interpolate(cube, self.sample_points)
+        expected = [12.0, 13.0 + 1.0 / 9, 13.5, 14.0]
+        self.assertArrayAllClose(result.coord('aux_x').points, expected)
+
+    def test_aux_coord_fail_mixed_dims(self):
+        cube = self.test_cube
+        cube.add_aux_coord(AuxCoord([[111, 112, 113, 114],
+                                     [211, 212, 213, 214]],
+                                    long_name='aux_0x'),
+                           (0, 2))
+        msg = 'aux_0x.*cannot be interpolated along the trajectory'
+        with self.assertRaisesRegexp(ValueError, msg):
+            interpolate(cube, self.sample_points)
+
+    def test_lazy_data(self):
+        cube = self.test_cube
+        expected = self._expected_data(cube)
+        cube.data = as_lazy_data(cube.data, chunks=(1, 3, 2))
+        result = interpolate(cube, self.sample_points)
+        self.assertTrue(result.has_lazy_data())
+        self.assertTrue(cube.has_lazy_data())
+        self.assertArrayAllClose(result.data, expected)
+
+    def test_masked_data(self):
+        cube = self.test_cube
+        cube.data = np.ma.masked_greater(cube.data.astype(float), 16)
+        result = interpolate(cube, self.sample_points)
+        self.assertMaskedArrayAlmostEqual(result.data,
+                                          self._expected_data(cube))
+
+
 if __name__ == "__main__":
     tests.main()
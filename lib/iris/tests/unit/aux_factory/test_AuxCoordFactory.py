@@ -26,12 +26,15 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else.
 import iris.tests as tests
 
+import copy
+
 import numpy as np
 
 import iris
-from iris._lazy_data import as_lazy_data, is_lazy_data
-from iris.aux_factory import AuxCoordFactory
+from iris._lazy_data import _MAX_CHUNK_SIZE, as_lazy_data, is_lazy_data
+from iris.aux_factory import AuxCoordFactory, HybridHeightFactory
 from iris.coords import AuxCoord
+from iris.tests import mock
 
 
 class Test__nd_points(tests.IrisTest):
@@ -151,6 +154,113 @@ class Test__nd_bounds(tests.IrisTest):
         self.assertArrayEqual(result, expected)
 
 
+class Test_make_coord__memoised(tests.IrisTest):
+    def setUp(self):
+        self.delta = AuxCoord([0.0, 1.0, 2.0], long_name='level_height',
+                              units='m', bounds=[[-0.5, 0.5], [0.5, 1.5],
+                                                 [1.5, 2.5]])
+        self.sigma = AuxCoord([1.0, 0.9, 0.8], long_name='sigma',
+                              bounds=[[1.05, 0.95], [0.95, 0.85],
+                                      [0.85, 0.75]])
+        self.orography = AuxCoord(np.arange(12.0).reshape(3, 4),
+                                  standard_name='surface_altitude', units='m')
+        self.factory = HybridHeightFactory(delta=self.delta, sigma=self.sigma,
+                                           orography=self.orography)
+        self.dims = {id(self.delta): (0,), id(self.sigma): (0,),
+                     id(self.orography): (1, 2)}
+
+    def coord_dims(self, coord):
+        return self.dims[id(coord)]
+
+    def test_reuses_derived_arrays(self):
+        with mock.patch.object(self.factory, '_remap',
+                               side_effect=self.factory._remap) as remap:
+            coord = self.factory.make_coord(self.coord_dims)
+            other = self.factory.make_coord(self.coord_dims)
+        self.assertEqual(remap.call_count, 1)
+        self.assertIsNot(coord, other)
+        self.assertTrue(other.has_lazy_points())
+        self.assertEqual(coord, other)
+
+    def test_result_independent(self):
+        coord = self.factory.make_coord(self.coord_dims)
+        coord.points = np.zeros(coord.shape)
+        coord.rename('foo')
+        other = self.factory.make_coord(self.coord_dims)
+        self.assertEqual(other.name(), 'altitude')
+        self.assertArrayEqual(other.points[0, 0], [0, 1, 2, 3])
+
+    def test_factory_metadata(self):
+        self.factory.make_coord(self.coord_dims)
+        self.factory.var_name = 'height'
+        coord = self.factory.make_coord(self.coord_dims)
+        self.assertEqual(coord.var_name, 'height')
+
+    def test_update(self):
+        self.factory.make_coord(self.coord_dims)
+        new_delta = self.delta.copy(self.delta.points + 10,
+                                    self.delta.bounds + 10)
+        self.dims[id(new_delta)] = (0,)
+        self.factory.update(self.delta, new_delta)
+        coord = self.factory.make_coord(self.coord_dims)
+        self.assertArrayEqual(coord.points[:, 0, 0], [10.0, 11.0, 12.0])
+
+    def test_dependency_points_replaced(self):
+        self.factory.make_coord(self.coord_dims)
+        self.orography.points = self.orography.points + 100
+        coord = self.factory.make_coord(self.coord_dims)
+        self.assertArrayEqual(coord.points[0, 0], [100, 101, 102, 103])
+
+    def test_dependency_dims_changed(self):
+        self.factory.make_coord(self.coord_dims)
+        self.dims[id(self.delta)] = (2,)
+        self.dims[id(self.sigma)] = (2,)
+        self.dims[id(self.orography)] = (0, 1)
+        coord = self.factory.make_coord(self.coord_dims)
+        self.assertEqual(coord.shape, (3, 4, 3))
+
+    def test_copy(self):
+        self.factory.make_coord(self.coord_dims)
+        factory = copy.deepcopy(self.factory)
+        self.assertNotIn('_derived_coord_cache', factory.__dict__)
+
+
+class Test_make_coord__chunks(tests.IrisTest):
+    def setUp(self):
+        # Enough levels and times to need more than one chunk.
+        self.delta = AuxCoord(np.arange(70.0), long_name='level_height',
+                              units='m')
+        self.sigma = AuxCoord(np.linspace(1, 0, 70), long_name='sigma')
+        raw_orography = np.arange(1000 * 50 * 60,
+                                  dtype=np.float64).reshape(1000, 50, 60)
+        self.orography = AuxCoord(as_lazy_data(raw_orography),
+                                  standard_name='surface_altitude', units='m')
+        self.factory = HybridHeightFactory(delta=self.delta, sigma=self.sigma,
+                                           orography=self.orography)
+        self.dims = {id(self.delta): (1,), id(self.sigma): (1,),
+                     id(self.orography): (0, 2, 3)}
+
+    def coord_dims(self, coord):
+        return self.dims[id(coord)]
+
+    def test_chunks_limited(self):
+        coord = self.factory.make_coord(self.coord_dims)
+        self.assertTrue(coord.has_lazy_points())
+        self.assertTrue(self.orography.has_lazy_points())
+        points = coord.core_points()
+        self.assertEqual(points.shape, (1000, 70, 50, 60))
+        self.assertLessEqual(np.prod(points.chunksize), _MAX_CHUNK_SIZE)
+        # The horizontal dimensions are not split.
+        self.assertEqual(points.chunksize[2:], (50, 60))
+
+    def test_values(self):
+        coord = self.factory.make_coord(self.coord_dims)
+        orography = self.orography.core_points()[-1].compute()
+        expected = (self.delta.points[:, None, None] +
+                    self.sigma.points[:, None, None] * orography)
+        self.assertArrayAllClose(coord.core_points()[-1].compute(), expected)
+
+
 @tests.skip_data
 class Test_lazy_aux_coords(tests.IrisTest):
     def setUp(self):
@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2014 - 2015, Met Office
+# (C) British Crown Copyright 2014 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -97,5 +97,50 @@ class Test__coordinate_dim_metadata_equality(tests.IrisTest):
         self.assertEqual(circular.dim_metadata, circular.dim_metadata)
 
 
+class Test_key(tests.IrisTest):
+    def setUp(self):
+        cube = Cube(np.arange(6, dtype=np.float32).reshape(2, 3),
+                    standard_name='air_temperature', units='K')
+        cube.add_dim_coord(DimCoord(np.arange(2), standard_name='time',
+                                    units='hours since 1970-01-01'), 0)
+        cube.add_aux_coord(AuxCoord(np.arange(3), long_name='foo'), 1)
+        cube.add_aux_coord(AuxCoord(0, long_name='bar'))
+        self.cube = cube
+
+    def test_hashable(self):
+        hash(CubeSignature(self.cube).key())
+
+    def test_other_extent(self):
+        other = self.cube.copy()
+        other.coord('time').points = [2, 3]
+        other.coord('bar').points = [1]
+        self.assertEqual(CubeSignature(self.cube).key(),
+                         CubeSignature(other).key())
+
+    def _assert_key_differs(self, other):
+        self.assertNotEqual(CubeSignature(self.cube).key(),
+                            CubeSignature(other).key())
+
+    def test_name_differs(self):
+        other = self.cube.copy()
+        other.rename('air_pressure')
+        self._assert_key_differs(other)
+
+    def test_dtype_differs(self):
+        other = self.cube.copy(self.cube.data.astype(np.float64))
+        self._assert_key_differs(other)
+
+    def test_aux_coord_dims_differ(self):
+        other = self.cube.copy()
+        other.remove_coord('foo')
+        other.add_aux_coord(AuxCoord(np.arange(2), long_name='foo'), 0)
+        self._assert_key_differs(other)
+
+    def test_scalar_coord_differs(self):
+        other = self.cube.copy()
+        other.remove_coord('bar')
+        self._assert_key_differs(other)
+
+
 if __name__ == '__main__':
     tests.main()
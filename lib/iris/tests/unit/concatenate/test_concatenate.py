@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2014 - 2017, Met Office
+# (C) British Crown Copyright 2014 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -282,6 +282,28 @@ class TestOrder(tests.IrisTest):
         self.assertEqual(len(result2), 1)
         self.assertEqual(result1, result2)
 
+    def test_many_unordered(self):
+        cubes = [self._make_cube([i * 2, i * 2 + 1]) for i in range(50)]
+        cubes = cubes[1::2] + cubes[-2::-2]
+        result = concatenate(cubes)
+        self.assertEqual(len(result), 1)
+        self.assertArrayEqual(result[0].coord('latitude').points,
+                              np.arange(100))
+
+    def test_overlap_with_interior_cube(self):
+        cubes = [self._make_cube([0, 1]), self._make_cube([6, 7]),
+                 self._make_cube([3, 4]), self._make_cube([4, 5])]
+        result = concatenate(cubes)
+        self.assertEqual(len(result), 2)
+        self.assertEqual([cube.shape[0] for cube in result], [6, 2])
+
+    def test_overlap_bounds_with_interior_cube(self):
+        cubes = [self._make_cube([0.5], [[0, 1]]),
+                 self._make_cube([3.5], [[3, 4]]),
+                 self._make_cube([2], [[1.5, 3]])]
+        result = concatenate(cubes)
+        self.assertEqual(len(result), 2)
+
 
 class TestConcatenate__dask(tests.IrisTest):
     def build_lazy_cube(self, points, bounds=None, nx=4):
@@ -0,0 +1,186 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :class:`iris._constraints._CoordConstraint` class."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import warnings
+
+import cf_units
+import numpy as np
+
+from iris._constraints import _CoordConstraint, _VectorisedCells
+from iris.coords import AuxCoord, Cell, DimCoord
+from iris.cube import Cube
+from iris.tests import mock
+from iris.time import PartialDateTime
+from iris.util import between
+
+
+class Test_extract(tests.IrisTest):
+    def setUp(self):
+        self.cube = Cube(np.zeros(10))
+        self.coord = AuxCoord(np.arange(10.0), long_name='foo')
+        self.cube.add_aux_coord(self.coord, 0)
+
+    def _check(self, coord_thing, vectorised=True):
+        # Compare against the result of matching one cell at a time.
+        if callable(coord_thing):
+            call_func = coord_thing
+        elif isinstance(coord_thing, list):
+            def call_func(cell):
+                return cell in coord_thing
+        else:
+            def call_func(cell):
+                return cell == coord_thing
+        expected = np.array([call_func(cell) for cell in self.coord.cells()])
+        constraint = _CoordConstraint(self.coord.name(), coord_thing)
+        with mock.patch('iris.coords.Coord.cells',
+                        side_effect=self.coord.cells) as cells:
+            result = constraint.extract(self.cube)
+        self.assertArrayEqual(result[0], expected)
+        self.assertEqual(cells.called, not vectorised)
+
+    def test_value(self):
+        self._check(3)
+
+    def test_value_bounded(self):
+        self.coord.guess_bounds()
+        self._check(3.5)
+
+    def test_list(self):
+        self._check([1, 3.5, 7])
+
+    def test_list_bounded(self):
+        self.coord.guess_bounds()
+        self._check([1, 3.5, 7])
+
+    def test_generator(self):
+        # The values of a one-shot iterable are only iterated once.
+        constraint = _CoordConstraint(self.coord.name(),
+                                      (value for value in [1, 3.5, 7]))
+        result = constraint.extract(self.cube)
+        expected = np.zeros(10, dtype=bool)
+        expected[[1, 7]] = True
+        self.assertArrayEqual(result[0], expected)
+
+    def test_between(self):
+        self._check(between(2, 5))
+
+    def test_between_exclusive_bounded(self):
+        self.coord.guess_bounds()
+        self._check(between(2, 5, lh_inclusive=False, rh_inclusive=False))
+
+    def test_function(self):
+        # Functions are only ever called with individual cells.
+        self.coord.guess_bounds()
+        self._check(lambda cell: cell.bound[1] - cell.bound[0] > 0.5,
+                    vectorised=False)
+
+    def test_function_calls(self):
+        func = mock.Mock(return_value=True)
+        constraint = _CoordConstraint(self.coord.name(), func)
+        constraint.extract(self.cube)
+        self.assertEqual(func.call_count, 10)
+        self.assertEqual([call[0][0] for call in func.call_args_list],
+                         list(self.coord.cells()))
+
+    def test_warning(self):
+        # Unrelated warnings do not prevent the use of array operations.
+        compare = _VectorisedCells._compare
+
+        def warning_compare(cells, other, operator_method):
+            warnings.warn('unrelated', DeprecationWarning)
+            return compare(cells, other, operator_method)
+
+        with mock.patch.object(_VectorisedCells, '_compare',
+                               warning_compare):
+            with warnings.catch_warnings(record=True):
+                warnings.simplefilter('always')
+                self._check(between(2, 5))
+
+    def test_cell(self):
+        self._check(Cell(3), vectorised=False)
+
+    def test_string(self):
+        self.coord = AuxCoord(np.array(['a', 'b', 'c', 'b']), long_name='foo')
+        self.cube = Cube(np.zeros(4))
+        self.cube.add_aux_coord(self.coord, 0)
+        self._check('b')
+
+
+class Test_extract__time(tests.IrisTest):
+    def setUp(self):
+        self.cube = Cube(np.zeros(24 * 90))
+        self.coord = DimCoord(np.arange(24 * 90.0), standard_name='time',
+                              units='hours since 2000-01-01 00:00')
+        self.cube.add_dim_coord(self.coord, 0)
+
+    def _check(self, coord_thing, calendar='gregorian', vectorised=True):
+        self.coord.units = cf_units.Unit(self.coord.units.origin,
+                                         calendar=calendar)
+        if callable(coord_thing):
+            call_func = coord_thing
+        elif isinstance(coord_thing, list):
+            def call_func(cell):
+                return cell.point in coord_thing
+        else:
+            def call_func(cell):
+                return cell == coord_thing
+        expected = np.array([call_func(cell) for cell in self.coord.cells()])
+        constraint = _CoordConstraint(self.coord.name(), coord_thing)
+        with mock.patch('iris.coords.Coord.cells',
+                        side_effect=self.coord.cells) as cells:
+            result = constraint.extract(self.cube)
+        self.assertArrayEqual(result[0], expected)
+        self.assertEqual(cells.called, not vectorised)
+
+    def test_partial_datetime(self):
+        self._check(PartialDateTime(month=2, hour=12))
+
+    def test_partial_datetime_list(self):
+        self._check([PartialDateTime(day=d) for d in (1, 15, 29)])
+
+    def test_between_partial_datetimes(self):
+        self._check(between(PartialDateTime(month=1, day=20),
+                            PartialDateTime(month=2, day=10, hour=6),
+                            rh_inclusive=False))
+
+    def test_360_day(self):
+        self._check(between(PartialDateTime(month=2, day=20),
+                            PartialDateTime(month=3, day=1)),
+                    calendar='360_day')
+
+    def test_comparison(self):
+        self._check(lambda cell: cell >= PartialDateTime(month=3),
+                    vectorised=False)
+
+    def test_microsecond(self):
+        self._check(PartialDateTime(microsecond=0), vectorised=False)
+
+    def test_julian(self):
+        # Calendar fields are calculated from the date-times instead.
+        self._check(PartialDateTime(day=29), calendar='julian')
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,107 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :func:`iris._constraints.extract_all` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris._constraints import extract_all
+from iris.coords import AuxCoord, DimCoord
+from iris.cube import Cube
+from iris.exceptions import CoordinateMultiDimError
+from iris import Constraint
+from iris.tests import mock
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.cube = Cube(np.zeros((4, 3)), long_name='wibble')
+        self.cube.add_dim_coord(DimCoord(np.arange(4.0), long_name='foo'), 0)
+        self.cube.add_aux_coord(AuxCoord(np.arange(3.0), long_name='bar'), 1)
+        self.constraints = [Constraint('wibble', foo=1),
+                            Constraint('wobble', foo=1),
+                            Constraint(bar=lambda cell: cell > 0),
+                            Constraint(foo=[1, 2]) & Constraint(bar=2),
+                            Constraint(baz=1),
+                            Constraint('wibble')]
+
+    def test_matches_extract(self):
+        result = extract_all(self.constraints, self.cube)
+        expected = [constraint.extract(self.cube)
+                    for constraint in self.constraints]
+        self.assertEqual(result, expected)
+
+    def test_no_constraints(self):
+        self.assertEqual(extract_all([], self.cube), [])
+
+    def test_shared_coord_lookup(self):
+        constraints = [Constraint(foo=1), Constraint(foo=2),
+                       Constraint(foo=[0, 3])]
+        with mock.patch.object(Cube, 'coord',
+                               side_effect=self.cube.coord) as coord:
+            extract_all(constraints, self.cube)
+        self.assertEqual(coord.call_count, 1)
+
+    def test_equal_coord_constraints_evaluated_once(self):
+        func = mock.Mock(side_effect=lambda cell: cell > 1)
+        constraints = [Constraint('wibble', bar=func),
+                       Constraint(bar=func) & Constraint(foo=3)]
+        result = extract_all(constraints, self.cube)
+        # Called once for each cell of 'bar', rather than for each constraint.
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(result[0].shape, (4,))
+        self.assertEqual(result[1].shape, ())
+
+    def test_sliced_once_per_subset(self):
+        constraints = [Constraint(foo=1), Constraint('wibble', foo=1),
+                       Constraint(foo=2)]
+        with mock.patch.object(Cube, '__getitem__',
+                               side_effect=self.cube.__getitem__) as getitem:
+            result = extract_all(constraints, self.cube)
+        self.assertEqual(getitem.call_count, 2)
+        self.assertEqual(result[0], result[1])
+        self.assertEqual(result[2].coord('foo').points, [2])
+
+    def test_same_subset_not_shared(self):
+        constraints = [Constraint(foo=1), Constraint('wibble', foo=1)]
+        result = extract_all(constraints, self.cube)
+        self.assertIsNot(result[0], result[1])
+        result[0].data[0] = 1
+        result[0].coord('bar').points = [5, 6, 7]
+        self.assertArrayEqual(result[1].data, [0, 0, 0])
+        self.assertArrayEqual(result[1].coord('bar').points, [0, 1, 2])
+
+    def test_unmatched(self):
+        result = extract_all([Constraint(foo=10), Constraint('wobble')],
+                             self.cube)
+        self.assertEqual(result, [None, None])
+
+    def test_multidimensional_coord(self):
+        self.cube.add_aux_coord(AuxCoord(np.zeros((4, 3)), long_name='baz'),
+                                (0, 1))
+        with self.assertRaises(CoordinateMultiDimError):
+            extract_all([Constraint(baz=0)], self.cube)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,75 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :func:`iris.coord_categorisation._date_fields`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# import iris tests first so that some things can be initialised before
+# importing anything else
+import iris.tests as tests
+
+from cf_units import Unit
+import numpy as np
+
+from iris.coord_categorisation import _date_fields
+from iris.coords import AuxCoord
+from iris.tests import mock
+
+
+NAMES = ('year', 'month', 'day', 'hour', 'dayofyr', 'dayofwk')
+
+
+class Test(tests.IrisTest):
+    def _check(self, calendar):
+        points = np.linspace(-1000, 1000, 24).reshape(4, 6)
+        units = Unit('days since 2000-02-28 12:00', calendar=calendar)
+        coord = AuxCoord(points, standard_name='time', units=units)
+        result = _date_fields(coord, *NAMES)
+        dates = units.num2date(points.ravel())
+        expected = {
+            'year': [date.year for date in dates],
+            'month': [date.month for date in dates],
+            'day': [date.day for date in dates],
+            'hour': [date.hour for date in dates],
+            'dayofyr': [date.timetuple()[7] for date in dates],
+            'dayofwk': [date.timetuple()[6] for date in dates]}
+        for name, values in zip(NAMES, result):
+            self.assertEqual(values.shape, points.shape)
+            self.assertArrayEqual(values.ravel(), expected[name],
+                                  err_msg='{}: {}'.format(calendar, name))
+
+    def test_calendars(self):
+        for calendar in ('gregorian', 'proleptic_gregorian', '360_day',
+                         '365_day', '366_day', 'julian'):
+            self._check(calendar)
+
+    def test_single_date_conversion(self):
+        # Fields which cannot be calculated from the points are taken from
+        # a single conversion of all the points to date-times.
+        units = Unit('days since 2000-01-01', calendar='julian')
+        coord = AuxCoord(np.arange(10), standard_name='time', units=units)
+        with mock.patch.object(Unit, 'num2date',
+                               wraps=units.num2date) as num2date:
+            year, month = _date_fields(coord, 'year', 'month')
+        num2date.assert_called_once()
+        self.assertArrayEqual(year, [2000] * 10)
+        self.assertArrayEqual(month, [1] * 10)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -37,6 +37,7 @@ from iris.tests.unit.coords import (CoordTestMixin,
 
 from cf_units import Unit
 from iris.coords import AuxCoord
+from iris._data_manager import CategoricalDataManager, DataManager
 from iris._lazy_data import as_lazy_data
 
 
@@ -605,6 +606,61 @@ class Test_bounds__setter(tests.IrisTest, AuxCoordTestMixin):
         self.assertTrue(coord.has_lazy_points())
 
 
+class Test_from_categories(tests.IrisTest):
+    def setUp(self):
+        self.coord = AuxCoord.from_categories(
+            np.array(['a', 'bb', 'c']), np.array([[2, 0], [1, 0]]),
+            long_name='label', units='no_unit')
+
+    def _check_categorical(self, coord):
+        self.assertIsInstance(coord._points_dm, CategoricalDataManager)
+
+    def test_points(self):
+        self.assertArrayEqual(self.coord.points, [['c', 'a'], ['bb', 'a']])
+        self.assertEqual(self.coord.shape, (2, 2))
+        self.assertEqual(self.coord.long_name, 'label')
+        self._check_categorical(self.coord)
+
+    def test_points_read_only(self):
+        with self.assertRaises(ValueError):
+            self.coord.points[0, 0] = 'x'
+
+    def test_set_points(self):
+        self.coord.points = np.array([['w', 'x'], ['y', 'z']])
+        self.assertIs(type(self.coord._points_dm), DataManager)
+        self.assertArrayEqual(self.coord.points, [['w', 'x'], ['y', 'z']])
+
+    def test_getitem(self):
+        result = self.coord[1]
+        self._check_categorical(result)
+        self.assertArrayEqual(result.points, ['bb', 'a'])
+
+    def test_getitem_scalar(self):
+        result = self.coord[1, 0]
+        self._check_categorical(result)
+        self.assertArrayEqual(result.points, ['bb'])
+
+    def test_view(self):
+        result = self.coord._getitem((slice(None), 0), copy=False)
+        self._check_categorical(result)
+        self.assertArrayEqual(result.points, ['c', 'bb'])
+
+    def test_copy(self):
+        result = self.coord.copy()
+        self._check_categorical(result)
+        self.assertEqual(result, self.coord)
+
+    def test_eq(self):
+        other = AuxCoord.from_categories(
+            np.array(['c', 'a', 'bb']), np.array([[0, 1], [2, 1]]),
+            long_name='label', units='no_unit')
+        self.assertEqual(self.coord, other)
+        other = AuxCoord(self.coord.points, long_name='label',
+                         units='no_unit')
+        self.assertEqual(self.coord, other)
+        self.assertEqual(other, self.coord)
+
+
 class Test_convert_units(tests.IrisTest):
     def test_preserves_lazy(self):
         test_bounds = np.array([[[11.0, 12.0], [12.0, 13.0], [13.0, 14.0]],
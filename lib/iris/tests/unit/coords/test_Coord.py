@@ -27,10 +27,12 @@ import collections
 import mock
 import warnings
 
+from cf_units import Unit
 import numpy as np
 
 import iris
-from iris.coords import DimCoord, AuxCoord, Coord
+from iris.coords import AuxCoord, Cell, Coord, DimCoord
+import iris.exceptions
 from iris.tests import mock
 from iris.exceptions import UnitConversionError
 from iris.tests.unit.coords import CoordTestMixin
@@ -122,6 +124,92 @@ class Test_nearest_neighbour_index__descending(tests.IrisTest):
         self._test_nearest_neighbour_index(target, bounds=True, circular=True)
 
 
+class Test_intersect(tests.IrisTest):
+    def test_points(self):
+        coord = AuxCoord([1, 2, 3, 2], long_name='x')
+        other = AuxCoord([2., 5., 1., 3.], long_name='x')
+        result = coord.intersect(other, return_indices=True)
+        self.assertArrayEqual(result, [1, 0, 2])
+        self.assertEqual(coord.intersect(other), coord[[1, 0, 2]])
+
+    def test_bounds(self):
+        coord = DimCoord([1, 2, 3], bounds=[[0, 2], [1, 3], [2, 4]],
+                         long_name='x')
+        other = AuxCoord([1, 2, 3], bounds=[[0, 2], [2, 3], [2, 4]],
+                         long_name='x')
+        result = coord.intersect(other, return_indices=True)
+        self.assertArrayEqual(result, [0, 2])
+
+    def test_bounded_and_unbounded(self):
+        coord = DimCoord([1, 2], bounds=[[0, 2], [1, 3]], long_name='x')
+        other = DimCoord([1, 2], long_name='x')
+        result = coord.intersect(other, return_indices=True)
+        self.assertArrayEqual(result, [])
+        with self.assertRaisesRegexp(ValueError, 'No intersection'):
+            coord.intersect(other)
+
+    def test_nan(self):
+        coord = AuxCoord([np.nan, 0., 1.], long_name='x')
+        other = AuxCoord([1., np.nan, -0.], long_name='x')
+        result = coord.intersect(other, return_indices=True)
+        self.assertArrayEqual(result, [2, 1])
+
+    def test_time(self):
+        units = Unit('hours since 1970-01-01')
+        coord = DimCoord([0, 1, 2], units=units, long_name='t')
+        other = DimCoord([1, 2.0001, 3], units=units, long_name='t')
+        # The cells are compared as date-times, to the nearest second.
+        result = coord.intersect(other, return_indices=True)
+        self.assertArrayEqual(result, [1, 2])
+
+    def test_strings(self):
+        coord = AuxCoord(['a', 'b', 'a'], long_name='x')
+        other = AuxCoord(['c', 'a'], long_name='x')
+        result = coord.intersect(other, return_indices=True)
+        self.assertArrayEqual(result, [0])
+
+    def test_multidimensional(self):
+        coord = AuxCoord(np.zeros((2, 2)), long_name='x')
+        with self.assertRaises(iris.exceptions.CoordinateMultiDimError):
+            coord.intersect(AuxCoord([0], long_name='x'))
+
+
+class Test_nearest_neighbour_index__binary_search(tests.IrisTest):
+    def check(self, points, circular=False):
+        coord = DimCoord(points, units='degrees', circular=circular)
+        for point in np.arange(-400, 800, 7.5):
+            expected = Coord.nearest_neighbour_index(coord, point)
+            self.assertEqual(coord.nearest_neighbour_index(point), expected)
+
+    def test_ascending(self):
+        self.check([0, 90, 180, 270])
+
+    def test_descending(self):
+        self.check([270, 180, 90, 0])
+
+    def test_ascending_circular(self):
+        self.check([0, 90, 180, 270], circular=True)
+
+    def test_descending_circular(self):
+        self.check([270., 180., 90., 0.], circular=True)
+
+    def test_ties(self):
+        coord = DimCoord([270, 180, 90, 0], units='degrees', circular=True)
+        self.assertEqual(coord.nearest_neighbour_index(45), 2)
+        self.assertEqual(coord.nearest_neighbour_index(315), 3)
+
+    def test_no_distances(self):
+        coord = DimCoord(np.arange(1000000.))
+        with mock.patch('numpy.abs') as np_abs:
+            self.assertEqual(coord.nearest_neighbour_index(1234.4), 1234)
+        self.assertEqual(np_abs.call_count, 0)
+
+    def test_not_a_number(self):
+        coord = DimCoord([0, 1])
+        with self.assertRaises(TypeError):
+            coord.nearest_neighbour_index('a')
+
+
 class Test_guess_bounds(tests.IrisTest):
     def setUp(self):
         self.coord = DimCoord(np.array([-160, -120, 0, 30, 150, 170]),
@@ -214,6 +302,7 @@ class Test_cell(tests.IrisTest):
                           points=np.array([mock.sentinel.time]),
                           bounds=np.array([[mock.sentinel.lower,
                                             mock.sentinel.upper]]))
+        coord._cached_cell_values.return_value = None
         return coord
 
     def test_time_as_object(self):
@@ -235,6 +324,64 @@ class Test_cell(tests.IrisTest):
                                      mock.sentinel.upper))])
 
 
+class Test_cells(tests.IrisTest):
+    def setUp(self):
+        self.units = Unit('hours since 1970-01-01')
+        points = np.arange(4.)
+        self.bounds = np.stack([points - 0.5, points + 0.5], axis=-1)
+        self.coord = DimCoord(points, bounds=self.bounds, units=self.units)
+        patch = mock.patch('cf_units.Unit.num2date', autospec=True,
+                           side_effect=Unit.num2date)
+        self.num2date = patch.start()
+        self.addCleanup(patch.stop)
+
+    def expected(self, points, bounds):
+        return [Cell(self.units.num2date(point),
+                     tuple(self.units.num2date(bound)))
+                for point, bound in zip(points, bounds)]
+
+    def test_decoded_once(self):
+        expected = self.expected(self.coord.points, self.bounds)
+        self.num2date.reset_mock()
+        result = list(self.coord.cells())
+        self.assertEqual(result, expected)
+        self.assertEqual(self.num2date.call_count, 2)
+
+    def test_cached(self):
+        expected = list(self.coord.cells())
+        self.num2date.reset_mock()
+        self.assertEqual(list(self.coord.cells()), expected)
+        self.assertEqual([self.coord.cell(i) for i in range(4)], expected)
+        self.assertEqual(self.num2date.call_count, 0)
+
+    def test_points_changed(self):
+        coord = AuxCoord(self.coord.points, bounds=self.bounds,
+                         units=self.units)
+        list(coord.cells())
+        coord.points[0] = 10.
+        expected = self.expected(coord.points, self.bounds)
+        self.assertEqual(list(coord.cells()), expected)
+        self.assertEqual(coord.cell(0), expected[0])
+
+    def test_units_changed(self):
+        list(self.coord.cells())
+        self.coord.units = 'days since 1970-01-01'
+        self.units = self.coord.units
+        expected = self.expected(self.coord.points, self.bounds)
+        self.assertEqual(list(self.coord.cells()), expected)
+
+    def test_not_copied(self):
+        list(self.coord.cells())
+        self.assertIsNone(self.coord.copy()._cell_values_cache)
+
+    def test_not_time(self):
+        coord = DimCoord(np.arange(4.), bounds=self.bounds, units='m')
+        expected = [Cell(point, bound)
+                    for point, bound in zip(coord.points, self.bounds)]
+        self.assertEqual(list(coord.cells()), expected)
+        self.assertEqual(self.num2date.call_count, 0)
+
+
 class Test_collapsed(tests.IrisTest, CoordTestMixin):
 
     def test_serialize(self):
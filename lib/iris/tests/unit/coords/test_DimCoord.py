@@ -36,6 +36,7 @@ from iris.tests.unit.coords import (CoordTestMixin,
                                     coords_all_dtypes_and_lazynesses)
 
 from iris.coords import DimCoord
+from iris.tests import mock
 
 
 class DimCoordTestMixin(CoordTestMixin):
@@ -218,6 +219,39 @@ class Test_bounds_dtype(tests.IrisTest):
         self.assertEqual(result, test_dtype)
 
 
+class Test__getitem(tests.IrisTest):
+    def setUp(self):
+        self.coord = DimCoord(np.arange(4.), long_name='x',
+                              bounds=np.arange(8.).reshape(4, 2) - 0.5,
+                              units='degrees', circular=True)
+
+    def test_view(self):
+        with mock.patch.object(DimCoord, '_new_points_requirements') as req:
+            result = self.coord._getitem(slice(1, 3), copy=False)
+        self.assertEqual(req.call_count, 0)
+        self.assertEqual(result, self.coord[1:3])
+        self.assertTrue(np.shares_memory(result.points, self.coord.points))
+        self.assertFalse(result.points.flags.writeable)
+        self.assertFalse(result.bounds.flags.writeable)
+
+    def test_view_circular(self):
+        self.assertTrue(self.coord._getitem(slice(None), copy=False).circular)
+        self.assertFalse(self.coord._getitem(slice(1), copy=False).circular)
+
+    def test_view_scalar(self):
+        result = self.coord._getitem(2, copy=False)
+        self.assertEqual(result.shape, (1,))
+        self.assertEqual(result.bounds.shape, (1, 2))
+
+    def test_fancy_index_validated(self):
+        with self.assertRaises(ValueError):
+            self.coord._getitem([1, 0, 1], copy=False)
+
+    def test_copy(self):
+        result = self.coord._getitem(slice(1, 3))
+        self.assertFalse(np.shares_memory(result.points, self.coord.points))
+
+
 class Test__getitem__(tests.IrisTest, DimCoordTestMixin):
     # Test for DimCoord indexing with various types of points and bounds.
     def setUp(self):
@@ -24,6 +24,7 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 import iris.tests as tests
 
 from itertools import permutations
+import pickle
 
 import numpy as np
 import numpy.ma as ma
@@ -37,7 +38,7 @@ import iris.exceptions
 from iris.analysis import WeightedAggregator, Aggregator
 from iris.analysis import MEAN
 from iris.aux_factory import HybridHeightFactory
-from iris.cube import Cube
+from iris.cube import Cube, CubeList
 from iris.coords import AuxCoord, DimCoord, CellMeasure
 from iris.exceptions import (CoordinateNotFoundError, CellMeasureNotFoundError,
                              UnitConversionError)
@@ -301,13 +302,144 @@ class Test_collapsed__lazy(tests.IrisTest):
         self.assertTrue(cube_collapsed.has_lazy_data())
         self.assertArrayAllClose(cube_collapsed.data, 2.5)
 
+    def test_percentile(self):
+        cube_collapsed = self.cube.collapsed('x', iris.analysis.PERCENTILE,
+                                             percent=[50, 100])
+        self.assertTrue(cube_collapsed.has_lazy_data())
+        self.assertArrayAlmostEqual(cube_collapsed.data,
+                                    [[1.0, 4.0], [2.0, 5.0]])
+        self.assertArrayEqual(cube_collapsed.coord('percentile_over_x').points,
+                              [50, 100])
+
+    def test_peak(self):
+        cube_collapsed = self.cube.collapsed(('x', 'y'), iris.analysis.PEAK)
+        self.assertTrue(cube_collapsed.has_lazy_data())
+        self.assertArrayAllClose(cube_collapsed.data, 5.0)
+        # The shape matches that of the real collapse.
+        self.assertEqual(cube_collapsed.shape, (1,))
+
+    def test_peak_mdtol(self):
+        self.cube.data = ma.masked_array(self.data, mask=[[True, False, False],
+                                                          [False, False,
+                                                           False]])
+        self.cube.data = self.cube.lazy_data()
+        cube_collapsed = self.cube.collapsed('x', iris.analysis.PEAK,
+                                             mdtol=0.3)
+        self.assertTrue(cube_collapsed.has_lazy_data())
+        self.assertMaskedArrayEqual(cube_collapsed.data,
+                                    ma.masked_array([0., 5.], mask=[1, 0]))
+
     def test_non_lazy_aggregator(self):
         # An aggregator which doesn't have a lazy function should still work.
         dummy_agg = Aggregator('custom_op',
                                lambda x, axis=None: np.mean(x, axis=axis))
-        result = self.cube.collapsed('x', dummy_agg)
+        with mock.patch('warnings.warn') as warn:
+            result = self.cube.collapsed('x', dummy_agg)
         self.assertFalse(result.has_lazy_data())
         self.assertArrayEqual(result.data, np.mean(self.data, axis=1))
+        # The data is not realised silently.
+        msg = ("Realising the lazy data of the cube, as the 'custom_op' "
+               "aggregator does not support lazy operation.")
+        self.assertIn(mock.call(msg), warn.call_args_list)
+
+    def test_unsupported_lazy_keywords(self):
+        def lazy_func(data, axis=None):
+            return data.mean(axis=axis)
+
+        def call_func(data, axis=None, **kwargs):
+            return np.mean(data, axis=axis)
+
+        dummy_agg = Aggregator('custom_op', call_func, lazy_func=lazy_func)
+        with mock.patch('warnings.warn') as warn:
+            result = self.cube.collapsed('x', dummy_agg, wibble=1)
+        self.assertFalse(result.has_lazy_data())
+        self.assertArrayEqual(result.data, np.mean(self.data, axis=1))
+        msg = ("Realising the lazy data of the cube, as the 'custom_op' "
+               "aggregator does not support lazy operation with the given "
+               "keywords.")
+        self.assertIn(mock.call(msg), warn.call_args_list)
+
+
+class Test_collapsed__multiple(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(24.0).reshape((4, 6)) % 5
+        cube = Cube(as_lazy_data(self.data, chunks=(2, 3)), units='m')
+        for i_dim, name in enumerate(('y', 'x')):
+            npts = cube.shape[i_dim]
+            coord = DimCoord(np.arange(npts), long_name=name)
+            cube.add_dim_coord(coord, i_dim)
+        self.cube = cube
+        self.aggregators = [iris.analysis.MEAN, iris.analysis.STD_DEV,
+                            iris.analysis.MIN, iris.analysis.MAX]
+
+    def test_cubelist(self):
+        result = self.cube.collapsed('y', self.aggregators)
+        self.assertIsInstance(result, CubeList)
+        self.assertEqual(len(result), 4)
+        for cube, aggregator in zip(result, self.aggregators):
+            self.assertTrue(cube.has_lazy_data())
+            expected = self.cube.collapsed('y', aggregator)
+            self.assertEqual(cube.metadata, expected.metadata)
+            self.assertArrayAlmostEqual(cube.data, expected.data)
+
+    def test_real_data(self):
+        self.cube.data
+        result = self.cube.collapsed('x', self.aggregators)
+        for cube, aggregator in zip(result, self.aggregators):
+            expected = self.cube.collapsed('x', aggregator)
+            self.assertEqual(cube, expected)
+
+    def test_kwargs(self):
+        aggregators = [iris.analysis.VARIANCE,
+                       (iris.analysis.VARIANCE, dict(ddof=0)),
+                       (iris.analysis.PERCENTILE, dict(percent=[10, 90]))]
+        result = self.cube.collapsed('y', aggregators, mdtol=0.5)
+        result.realise_data()
+        self.assertArrayAlmostEqual(result[0].data,
+                                    np.var(self.data, axis=0, ddof=1))
+        self.assertArrayAlmostEqual(result[1].data,
+                                    np.var(self.data, axis=0))
+        self.assertEqual(result[2].shape, (2, 6))
+
+    def test_masked(self):
+        data = ma.masked_array(self.data, mask=self.data > 3)
+        data[:, 0] = ma.masked
+        cube = self.cube.copy(as_lazy_data(data, chunks=(2, 3)))
+        aggregators = [iris.analysis.MEAN, iris.analysis.SUM,
+                       iris.analysis.RMS, iris.analysis.STD_DEV]
+        result = cube.collapsed('y', aggregators, mdtol=0.3)
+        result.realise_data()
+        for cube, aggregator in zip(result, aggregators):
+            expected = aggregator.aggregate(data, axis=0, mdtol=0.3)
+            self.assertMaskedArrayAlmostEqual(cube.data, expected)
+
+    def test_shared_moments(self):
+        with mock.patch('iris._lazy_data.lazy_moments',
+                        wraps=iris._lazy_data.lazy_moments) as moments:
+            result = self.cube.collapsed('y', [iris.analysis.MEAN,
+                                               iris.analysis.VARIANCE,
+                                               iris.analysis.SUM])
+        self.assertEqual(moments.call_count, 1)
+        self.assertArrayAlmostEqual(result[2].data, self.data.sum(axis=0))
+
+    def test_returned(self):
+        msg = "The 'returned' keyword is not supported"
+        with self.assertRaisesRegexp(ValueError, msg):
+            self.cube.collapsed('y', [iris.analysis.MEAN], returned=True)
+
+    def test_not_aggregator(self):
+        with self.assertRaisesRegexp(TypeError, 'Expected an aggregator'):
+            self.cube.collapsed('y', ['mean'])
+
+    def test_not_sequence(self):
+        msg = 'Expected an aggregator or a sequence of aggregators'
+        for aggregator in (5, iris.analysis.MEAN.name, 'mean'):
+            with self.assertRaisesRegexp(TypeError, msg):
+                self.cube.collapsed('y', aggregator)
+
+    def test_empty_sequence(self):
+        with self.assertRaisesRegexp(ValueError, 'at least one aggregator'):
+            self.cube.collapsed('y', [])
 
 
 class Test_collapsed__warning(tests.IrisTest):
@@ -503,6 +635,56 @@ class Test_aggregated_by(tests.IrisTest):
         self.assertEqual(result.coord('bar'),
                          AuxCoord(['a|a', 'a'], long_name='bar'))
 
+    def test_multiple_percentiles(self):
+        # The aggregated data has an additional percentile dimension.
+        cube = Cube(np.arange(12.).reshape(6, 2))
+        cube.add_aux_coord(AuxCoord([0, 0, 0, 1, 1, 1], long_name='foo'), 0)
+        result = cube.aggregated_by('foo', iris.analysis.PERCENTILE,
+                                    percent=[0, 50, 100])
+        expected = np.array([[[0, 1], [6, 7]],
+                             [[2, 3], [8, 9]],
+                             [[4, 5], [10, 11]]])
+        self.assertEqual(result.shape, (3, 2, 2))
+        self.assertArrayAlmostEqual(result.data, expected)
+
+    def test_source_data_protected(self):
+        # An aggregator may modify its group-by sub-data without modifying
+        # the cube data.
+        def sort_max(data, axis):
+            data.sort(axis)
+            return data.max(axis)
+
+        def mask_max(data, axis):
+            data[0] = ma.masked
+            return data.max(axis)
+
+        def decrement_sum(data, axis):
+            data -= 1
+            return data.sum(axis)
+
+        data = ma.masked_array([[3, 1], [1, 5], [2, 0]], mask=False)
+        cube = Cube(data.copy())
+        cube.add_aux_coord(AuxCoord([0, 0, 1], long_name='foo'), 0)
+        expected = {sort_max: [[3, 5], [2, 0]],
+                    mask_max: [[1, 5], [2, 0]],
+                    decrement_sum: [[2, 4], [1, -1]]}
+        for func in (sort_max, mask_max, decrement_sum):
+            result = cube.aggregated_by('foo', Aggregator('custom', func))
+            self.assertArrayEqual(result.data, expected[func])
+        self.assertMaskedArrayEqual(cube.data, data)
+
+    def test_builtin_read_only(self):
+        # The built-in aggregators are given read-only views of the cube
+        # data.
+        cube = Cube(np.arange(6.).reshape(3, 2))
+        cube.add_aux_coord(AuxCoord([0, 0, 1], long_name='foo'), 0)
+        call_func = mock.Mock(return_value=np.zeros(2))
+        with mock.patch.object(MEAN, 'call_func', call_func):
+            cube.aggregated_by('foo', MEAN)
+        self.assertEqual(call_func.call_count, 2)
+        for call in call_func.call_args_list:
+            self.assertFalse(call[0][0].flags.writeable)
+
 
 class Test_rolling_window(tests.IrisTest):
     def setUp(self):
@@ -753,6 +935,73 @@ class Test_slices_over(tests.IrisTest):
         self.assertEqual(next(res), self.cube)
 
 
+class Test_slices__copy(tests.IrisTest):
+    def setUp(self):
+        cube = Cube(np.arange(24, dtype=np.float32).reshape(2, 3, 4))
+        cube.add_dim_coord(DimCoord(np.arange(2), long_name='t'), 0)
+        cube.add_dim_coord(DimCoord(np.arange(3.), long_name='y',
+                                    bounds=[[-0.5, 0.5], [0.5, 1.5],
+                                            [1.5, 2.5]]), 1)
+        cube.add_aux_coord(AuxCoord(np.arange(12).reshape(3, 4),
+                                    long_name='yx'), (1, 2))
+        self.cube = cube
+
+    def test_same_result(self):
+        copies = list(self.cube.slices(['y'], copy=True))
+        views = list(self.cube.slices(['y'], copy=False))
+        self.assertEqual(views, copies)
+
+    def test_data_view(self):
+        result = next(self.cube.slices('yx', copy=False))
+        self.assertTrue(np.shares_memory(result.data, self.cube.data))
+        self.assertFalse(result.data.flags.writeable)
+
+    def test_masked_data_view(self):
+        self.cube.data = ma.masked_less(self.cube.data, 2)
+        result = next(self.cube.slices('yx', copy=False))
+        with self.assertRaises(ValueError):
+            result.data[0, 0] = ma.masked
+        with self.assertRaises(ValueError):
+            result.data[0, 0] = 0
+        with self.assertRaises(ValueError):
+            result.data.mask[0, 1] = False
+        self.assertArrayEqual(self.cube.data.mask[0, 0],
+                              [True, True, False, False])
+        self.assertArrayEqual(result.data, self.cube.data[0])
+
+    def test_data_copy(self):
+        result = next(self.cube.slices('yx', copy=True))
+        self.assertFalse(np.shares_memory(result.data, self.cube.data))
+        self.assertTrue(result.data.flags.writeable)
+
+    def test_coord_views(self):
+        result = next(self.cube.slices_over('t', copy=False))
+        for name in ['y', 'yx']:
+            points = result.coord(name).points
+            self.assertTrue(np.shares_memory(points,
+                                             self.cube.coord(name).points))
+            self.assertFalse(points.flags.writeable)
+        self.assertFalse(result.coord('y').bounds.flags.writeable)
+
+    def test_coord_reassign(self):
+        result = next(self.cube.slices_over('t', copy=False))
+        result.coord('yx').points = np.zeros((3, 4))
+        self.assertArrayEqual(self.cube.coord('yx').points,
+                              np.arange(12).reshape(3, 4))
+
+    def test_attributes_independent(self):
+        self.cube.coord('y').attributes['a'] = [1]
+        result = next(self.cube.slices_over('t', copy=False))
+        result.coord('y').attributes['a'].append(2)
+        self.assertEqual(self.cube.coord('y').attributes['a'], [1])
+
+    def test_lazy(self):
+        self.cube.data = as_lazy_data(self.cube.data)
+        result = next(self.cube.slices('yx', copy=False))
+        self.assertTrue(result.has_lazy_data())
+        self.assertArrayEqual(result.data, np.arange(12).reshape(3, 4))
+
+
 def create_cube(lon_min, lon_max, bounds=False):
     n_lons = max(lon_min, lon_max) - min(lon_max, lon_min)
     data = np.arange(4 * 3 * n_lons, dtype='f4').reshape(4, 3, -1)
@@ -1572,6 +1821,68 @@ class Test_add_metadata(tests.IrisTest):
             cube.add_aux_factory(factory)
 
 
+class Test_coords__index(tests.IrisTest):
+    def setUp(self):
+        cube = Cube(np.arange(6).reshape(2, 3))
+        self.x_coord = DimCoord(np.arange(3), long_name='x')
+        cube.add_dim_coord(self.x_coord, 1)
+        self.z_coord = AuxCoord(np.arange(6).reshape(2, 3), long_name='z')
+        cube.add_aux_coord(self.z_coord, (0, 1))
+        self.cube = cube
+
+    def test_coord_dims_by_identity(self):
+        with mock.patch.object(Cube, 'coord') as coord:
+            self.assertEqual(self.cube.coord_dims(self.z_coord), (0, 1))
+        self.assertEqual(coord.call_count, 0)
+
+    def test_coord_dims_by_metadata(self):
+        self.assertEqual(self.cube.coord_dims(self.z_coord.copy()), (0, 1))
+        self.assertEqual(self.cube.coord_dims('x'), (1,))
+
+    def test_rename(self):
+        self.assertIs(self.cube.coord('x'), self.x_coord)
+        self.x_coord.rename('longitude')
+        self.assertEqual(self.cube.coords('x'), [])
+        self.assertIs(self.cube.coord('longitude'), self.x_coord)
+        self.assertIs(self.cube.coord(standard_name='longitude'),
+                      self.x_coord)
+
+    def test_var_name(self):
+        self.assertEqual(self.cube.coords(var_name='x_var'), [])
+        self.x_coord.var_name = 'x_var'
+        self.assertIs(self.cube.coord(self.x_coord.copy()), self.x_coord)
+        self.assertIs(self.cube.coord(var_name='x_var'), self.x_coord)
+
+    def test_stash(self):
+        coord = AuxCoord(0)
+        self.cube.add_aux_coord(coord)
+        self.assertIs(self.cube.coord('unknown'), coord)
+        coord.attributes['STASH'] = 'm01s00i004'
+        self.assertIs(self.cube.coord('m01s00i004'), coord)
+        self.assertEqual(self.cube.coords('unknown'), [])
+
+    def test_add_remove(self):
+        self.cube.remove_coord('z')
+        self.assertEqual(self.cube.coords('z'), [])
+        self.assertEqual(self.cube.aux_coords, ())
+        y_coord = DimCoord([0, 1], long_name='y')
+        self.cube.add_dim_coord(y_coord, 0)
+        self.assertEqual(self.cube.dim_coords, (y_coord, self.x_coord))
+        self.assertEqual(self.cube.coord_dims(y_coord), (0,))
+
+    def test_transpose(self):
+        self.cube.coord_dims(self.x_coord)
+        self.cube.transpose()
+        self.assertEqual(self.cube.coord_dims(self.x_coord), (0,))
+        self.assertEqual(self.cube.coord_dims(self.z_coord), (1, 0))
+
+    def test_pickle(self):
+        self.cube.coord_dims(self.x_coord)
+        cube = pickle.loads(pickle.dumps(self.cube))
+        self.assertEqual(cube.coord_dims(cube.coord('z')), (0, 1))
+        self.assertIsNone(cube._coord_index.dims_by_id.get(id(self.z_coord)))
+
+
 class Test_remove_metadata(tests.IrisTest):
     def setUp(self):
         cube = Cube(np.arange(6).reshape(2, 3))
@@ -1749,5 +2060,49 @@ class Test_convert_units(tests.IrisTest):
         self.assertArrayAllClose(cube.data, real_data_ft)
 
 
+class Test___eq__(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(12.).reshape((3, 4))
+
+    def test_equal(self):
+        self.assertEqual(Cube(self.data), Cube(self.data.copy()))
+
+    def test_within_tolerance(self):
+        self.assertEqual(Cube(self.data), Cube(self.data + 1e-9))
+
+    def test_different_data(self):
+        other = self.data.copy()
+        other[2, 3] = 100
+        self.assertNotEqual(Cube(self.data), Cube(other))
+
+    def test_different_shape(self):
+        self.assertNotEqual(Cube(self.data), Cube(self.data[:2]))
+
+    def test_lazy(self):
+        cube = Cube(as_lazy_data(self.data, chunks=(1, 4)))
+        other = Cube(as_lazy_data(self.data.copy(), chunks=(2, 2)))
+        self.assertEqual(cube, other)
+        self.assertTrue(cube.has_lazy_data())
+        self.assertTrue(other.has_lazy_data())
+
+    def test_lazy_and_real(self):
+        other = self.data.copy()
+        other[0, 0] = -1
+        cube = Cube(as_lazy_data(self.data, chunks=(1, 4)))
+        self.assertEqual(cube, Cube(self.data))
+        self.assertNotEqual(cube, Cube(other))
+        self.assertTrue(cube.has_lazy_data())
+
+    def test_masked_points_ignored(self):
+        data = ma.masked_array(self.data, mask=self.data > 10)
+        other = data.copy()
+        other[2, 3] = -1
+        self.assertEqual(Cube(data), Cube(other))
+
+    def test_fully_masked(self):
+        data = ma.masked_all((3, 4))
+        self.assertEqual(Cube(data), Cube(data.copy()))
+
+
 if __name__ == '__main__':
     tests.main()
@@ -0,0 +1,140 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Unit tests for the :class:`iris._data_manager.CategoricalDataManager`.
+
+"""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import copy
+import numpy as np
+
+from iris._data_manager import (CategoricalDataManager, DataManager,
+                                category_indices)
+
+
+class Test___init__(tests.IrisTest):
+    def test(self):
+        categories = np.array(['a', 'bb', 'c'])
+        codes = np.array([[2, 0], [1, 0]])
+        dm = CategoricalDataManager(categories, codes)
+        self.assertArrayEqual(dm.data, [['c', 'a'], ['bb', 'a']])
+        self.assertEqual(dm.shape, (2, 2))
+        self.assertEqual(dm.ndim, 2)
+        self.assertEqual(dm.dtype, categories.dtype)
+        self.assertFalse(dm.has_lazy_data())
+
+    def test_compact_codes(self):
+        dm = CategoricalDataManager(['a', 'b'], np.array([0, 1, 1]))
+        self.assertEqual(dm.codes.dtype, np.uint8)
+
+    def test_codes_not_modified(self):
+        codes = np.array([0, 1], dtype=np.uint8)
+        CategoricalDataManager(['a', 'b'], codes)
+        self.assertTrue(codes.flags.writeable)
+
+    def test_duplicate_categories(self):
+        with self.assertRaisesRegexp(ValueError, 'must be distinct'):
+            CategoricalDataManager(['a', 'a'], [0, 1])
+
+    def test_codes_out_of_range(self):
+        with self.assertRaisesRegexp(ValueError, 'must index'):
+            CategoricalDataManager(['a', 'b'], [0, 2])
+
+    def test_non_integer_codes(self):
+        with self.assertRaisesRegexp(TypeError, 'integer codes'):
+            CategoricalDataManager(['a', 'b'], [0., 1.])
+
+
+class Test_data(tests.IrisTest):
+    def setUp(self):
+        self.dm = CategoricalDataManager(['a', 'b'], [1, 0])
+
+    def test_read_only(self):
+        with self.assertRaises(ValueError):
+            self.dm.data[0] = 'c'
+
+    def test_set(self):
+        with self.assertRaisesRegexp(TypeError, 'cannot be replaced'):
+            self.dm.data = np.array(['c', 'd'])
+
+    def test_lazy_data(self):
+        self.assertArrayEqual(self.dm.lazy_data().compute(), ['b', 'a'])
+
+
+class Test___eq__(tests.IrisTest):
+    def setUp(self):
+        self.dm = CategoricalDataManager(['a', 'b', 'c'], [2, 0, 0])
+
+    def test_same_categories(self):
+        other = CategoricalDataManager(['a', 'b', 'c'], [2, 0, 0])
+        self.assertEqual(self.dm, other)
+        other = CategoricalDataManager(['a', 'b', 'c'], [2, 1, 0])
+        self.assertNotEqual(self.dm, other)
+
+    def test_different_categories(self):
+        other = CategoricalDataManager(['c', 'x', 'a'], [0, 2, 2])
+        self.assertEqual(self.dm, other)
+        other = CategoricalDataManager(['c', 'x', 'a'], [0, 1, 2])
+        self.assertNotEqual(self.dm, other)
+
+    def test_different_shape(self):
+        other = CategoricalDataManager(['a', 'b', 'c'], [2, 0])
+        self.assertNotEqual(self.dm, other)
+
+    def test_data_manager(self):
+        other = DataManager(np.array(['c', 'a', 'a']))
+        self.assertEqual(self.dm, other)
+        self.assertEqual(other, self.dm)
+
+
+class Test__deepcopy(tests.IrisTest):
+    def setUp(self):
+        self.dm = CategoricalDataManager(['a', 'b'], [1, 0])
+
+    def test(self):
+        result = copy.deepcopy(self.dm)
+        self.assertIsInstance(result, CategoricalDataManager)
+        self.assertIs(result.categories, self.dm.categories)
+        self.assertIsNot(result.codes, self.dm.codes)
+        self.assertEqual(result, self.dm)
+
+    def test_replace_data(self):
+        result = self.dm.copy(data=np.array(['x', 'y']))
+        self.assertIs(type(result), DataManager)
+        self.assertArrayEqual(result.data, ['x', 'y'])
+
+
+class Test_category_indices(tests.IrisTest):
+    def test(self):
+        result = category_indices(np.array(['b', 'z', 'a', 'b']),
+                                  np.array(['c', 'a', 'b']))
+        self.assertArrayEqual(result, [2, -1, 1, 2])
+
+    def test_no_categories(self):
+        result = category_indices(np.array(['a']), np.array([], dtype='U1'))
+        self.assertArrayEqual(result, [-1])
+
+
+if __name__ == '__main__':
+    tests.main()
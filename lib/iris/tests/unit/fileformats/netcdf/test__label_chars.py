@@ -0,0 +1,51 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the `iris.fileformats.netcdf._label_chars` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris.fileformats.netcdf import _label_chars
+
+
+class Test(tests.IrisTest):
+    def test_1d(self):
+        result = _label_chars(np.array(['ab', 'c', '']), 3)
+        self.assertArrayEqual(result, [['a', 'b', ' '],
+                                       ['c', ' ', ' '],
+                                       [' ', ' ', ' ']])
+
+    def test_2d(self):
+        labels = np.array([['ab', 'c'], ['d', 'ef']])
+        result = _label_chars(labels, 4)
+        self.assertEqual(result.shape, (2, 2, 4))
+        self.assertArrayEqual(result[1, 1], ['e', 'f', ' ', ' '])
+
+    def test_bytes(self):
+        result = _label_chars(np.array([b'ab', b'c']), 2)
+        self.assertEqual(result.dtype, np.dtype('S1'))
+        self.assertArrayEqual(result, [[b'a', b'b'], [b'c', b' ']])
+
+
+if __name__ == '__main__':
+    tests.main()
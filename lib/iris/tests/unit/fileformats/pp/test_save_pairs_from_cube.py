@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2015 - 2017, Met Office
+# (C) British Crown Copyright 2015 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -56,6 +56,14 @@ class TestSaveFields(tests.IrisTest):
         for aslice, _ in slices_and_fields:
             self.assertTrue(aslice.has_lazy_data())
 
+    def test_writable(self):
+        # The slices and field data are copies, which can be modified.
+        original = self.cube.data.copy()
+        for aslice, field in save_pairs_from_cube(self.cube):
+            aslice.data[0, 0] = 1
+            field.data *= 2
+        self.assertArrayEqual(self.cube.data, original)
+
     def test_default_bmdi(self):
         slices_and_fields = save_pairs_from_cube(self.cube)
         _, field = next(slices_and_fields)
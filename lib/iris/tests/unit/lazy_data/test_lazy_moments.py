@@ -0,0 +1,85 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Test function :func:`iris._lazy_data.lazy_moments`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import as_lazy_data, is_lazy_data, lazy_moments
+
+
+class Test_lazy_moments(tests.IrisTest):
+    def setUp(self):
+        self.data_1 = ma.masked_array(np.arange(12.).reshape(3, 4),
+                                      mask=[[0, 1, 0, 0],
+                                            [0, 0, 0, 0],
+                                            [1, 0, 0, 1]])
+        self.data_2 = ma.masked_array([10., 20., 40.], mask=[0, 0, 1])
+        self.array_1 = as_lazy_data(self.data_1, chunks=(1, 2))
+        self.array_2 = as_lazy_data(self.data_2.reshape(3, 1), chunks=(2, 1))
+
+    def test_single_array(self):
+        terms = [((0,), (), False), ((0,), (0,), False),
+                 ((0,), (0, 0), False)]
+        moments, (reference,) = lazy_moments([self.array_1], (0,), terms)
+        self.assertTrue(is_lazy_data(moments))
+        self.assertEqual(moments.shape, (3, 4))
+        # The first point of each column, or zero where that is masked.
+        self.assertArrayEqual(reference.compute(), [0, 0, 2, 3])
+        values = self.data_1 - reference.compute()
+        expected = [values.count(axis=0), values.sum(axis=0),
+                    (values * values).sum(axis=0)]
+        self.assertArrayAlmostEqual(moments.compute(), expected)
+
+    def test_products(self):
+        # Sums over the points unmasked in both arrays, which are broadcast.
+        terms = [((0, 1), (), False), ((0, 1), (0, 1), False)]
+        moments, references = lazy_moments([self.array_1, self.array_2],
+                                           (0, 1), terms)
+        self.assertEqual(moments.shape, (2,))
+        reference_1, reference_2 = [reference.compute()
+                                    for reference in references]
+        self.assertArrayEqual(reference_1, 0)
+        self.assertArrayEqual(reference_2, 10)
+        values = ((self.data_1 - reference_1) *
+                  (self.data_2.reshape(3, 1) - reference_2))
+        self.assertArrayAlmostEqual(moments.compute(),
+                                    [values.count(), values.sum()])
+
+    def test_weights(self):
+        weights = as_lazy_data(np.array([1., 2., 3., 4.]))
+        terms = [((0,), (), False), ((0,), (), True), ((0,), (0,), True)]
+        moments, (reference,) = lazy_moments([self.array_1], (1,), terms,
+                                             weights=weights)
+        self.assertArrayEqual(reference.compute(), [0, 4, 0])
+        values = self.data_1 - reference.compute().reshape(3, 1)
+        valid = ~ma.getmaskarray(values)
+        expected = [valid.sum(axis=1),
+                    (valid * np.array([1., 2., 3., 4.])).sum(axis=1),
+                    (values * np.array([1., 2., 3., 4.])).sum(axis=1)]
+        self.assertArrayAlmostEqual(moments.compute(), expected)
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,63 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Test function :func:`iris._lazy data.map_complete_blocks`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris._lazy_data import as_lazy_data, is_lazy_data, map_complete_blocks
+
+
+class Test_map_complete_blocks(tests.IrisTest):
+    def setUp(self):
+        self.array = np.arange(60.).reshape(3, 4, 5)
+        self.lazy_array = as_lazy_data(self.array, chunks=(1, 2, 2))
+
+    def test_complete_blocks(self):
+        def func(block):
+            self.assertEqual(block.shape[1:], (4, 5))
+            return block.sum(axis=(1, 2), keepdims=True)
+
+        result = map_complete_blocks(self.lazy_array, func, (1, 2), (1, 1),
+                                     self.array.dtype)
+        self.assertTrue(is_lazy_data(result))
+        self.assertEqual(result.shape, (3, 1, 1))
+        self.assertArrayEqual(result.compute(),
+                              self.array.sum(axis=(1, 2), keepdims=True))
+
+    def test_other_chunks_kept(self):
+        result = map_complete_blocks(self.lazy_array, lambda block: block,
+                                     (2,), (5,), self.array.dtype)
+        self.assertEqual(result.chunks, ((1, 1, 1), (2, 2), (5,)))
+        self.assertArrayEqual(result.compute(), self.array)
+
+    def test_dtype(self):
+        result = map_complete_blocks(self.lazy_array,
+                                     lambda block: block.astype(np.float32),
+                                     (0,), (3,), np.float32)
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(result.compute().dtype, np.float32)
+
+
+if __name__ == '__main__':
+    tests.main()
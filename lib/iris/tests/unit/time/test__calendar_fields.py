@@ -0,0 +1,79 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Unit tests for the :func:`iris.time._calendar_fields` function."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import cf_units
+import numpy as np
+
+from iris.time import _calendar_fields
+
+
+FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second',
+          'microsecond', 'dayofyr', 'dayofwk')
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        self.points = np.concatenate([np.linspace(-1e5, 1e6, 997),
+                                      np.arange(-50, 50, 0.25)])
+
+    def _check(self, units, calendar):
+        units = cf_units.Unit(units, calendar=calendar)
+        result = _calendar_fields(self.points, units)
+        dates = units.num2date(self.points)
+        for name in FIELDS:
+            expected = [getattr(date, name) for date in dates]
+            self.assertArrayEqual(result[name], expected)
+
+    def test_gregorian(self):
+        self._check('hours since 1970-01-01 00:00', 'gregorian')
+
+    def test_proleptic_gregorian(self):
+        self._check('days since 1600-02-29 06:00', 'proleptic_gregorian')
+
+    def test_360_day(self):
+        self._check('hours since 1900-02-30 03:00', '360_day')
+
+    def test_365_day(self):
+        self._check('minutes since 2000-03-01 12:30:15', '365_day')
+
+    def test_366_day(self):
+        self._check('seconds since 1850-02-29 00:00', '366_day')
+
+    def test_unsupported_calendar(self):
+        units = cf_units.Unit('days since 1970-01-01', calendar='julian')
+        self.assertIsNone(_calendar_fields(self.points, units))
+
+    def test_before_gregorian_reform(self):
+        units = cf_units.Unit('days since 1500-01-01', calendar='gregorian')
+        self.assertIsNone(_calendar_fields(self.points, units))
+
+    def test_sub_second_units(self):
+        units = cf_units.Unit('milliseconds since 1970-01-01',
+                              calendar='gregorian')
+        self.assertIsNone(_calendar_fields(self.points, units))
+
+
+if __name__ == '__main__':
+    tests.main()
@@ -0,0 +1,100 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Test function :func:`iris.util.approx_equal`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# import iris tests first so that some things can be initialised before
+# importing anything else
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris._lazy_data import as_lazy_data
+from iris.util import approx_equal
+
+
+class Test__numbers(tests.IrisTest):
+    def test_equal(self):
+        self.assertTrue(approx_equal(1, 1.0))
+
+    def test_absolute_error(self):
+        self.assertTrue(approx_equal(0, 1e-11))
+        self.assertFalse(approx_equal(0, 1e-9))
+
+    def test_relative_error(self):
+        self.assertTrue(approx_equal(1e10, 1e10 + 0.1))
+        self.assertFalse(approx_equal(1e10, 1e10 + 10))
+
+
+class Test__arrays(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(24.).reshape(4, 6)
+
+    def test_equal(self):
+        self.assertTrue(approx_equal(self.data, self.data + 1e-11))
+
+    def test_different(self):
+        other = self.data.copy()
+        other[3, 5] += 1e-3
+        self.assertFalse(approx_equal(self.data, other))
+
+    def test_different_shape(self):
+        self.assertFalse(approx_equal(self.data, self.data[:2]))
+
+    def test_tolerance(self):
+        other = self.data + 1e-3
+        self.assertFalse(approx_equal(self.data, other))
+        self.assertTrue(approx_equal(self.data, other,
+                                     max_absolute_error=1e-2))
+        self.assertTrue(approx_equal(self.data[1:], other[1:],
+                                     max_relative_error=1e-3))
+
+    def test_integers_exact(self):
+        # Integers are compared exactly, whatever the tolerances.
+        array_a = np.array([0, 2, 5], dtype=np.uint8)
+        array_b = np.array([2, 2, 5], dtype=np.uint8)
+        self.assertFalse(approx_equal(array_a, array_b, max_absolute_error=3))
+        self.assertTrue(approx_equal(array_a, array_a.copy()))
+        large = np.array([2 ** 62], dtype=np.int64)
+        self.assertFalse(approx_equal(large, large + 1))
+        self.assertFalse(approx_equal(as_lazy_data(large), large + 1))
+
+    def test_masked_elements_ignored(self):
+        array_a = ma.masked_array([1, 2, 3], mask=[0, 1, 0])
+        self.assertTrue(approx_equal(array_a, [1, 7, 3]))
+        self.assertFalse(approx_equal(array_a, [1, 7, 4]))
+
+    def test_lazy(self):
+        array_a = as_lazy_data(self.data, chunks=(1, 6))
+        array_b = as_lazy_data(self.data + 1e-11, chunks=(4, 2))
+        self.assertTrue(approx_equal(array_a, array_b))
+        self.assertTrue(approx_equal(array_a, self.data))
+        self.assertFalse(approx_equal(array_a, self.data + 1))
+
+    def test_lazy_masked(self):
+        data = ma.masked_array(self.data, mask=self.data > 20)
+        other = self.data.copy()
+        other[3, 5] = -1
+        self.assertTrue(approx_equal(as_lazy_data(data, chunks=(2, 3)),
+                                     other))
+
+
+if __name__ == '__main__':
+    tests.main()
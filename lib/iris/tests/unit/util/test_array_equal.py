@@ -1,4 +1,4 @@
-# (C) British Crown Copyright 2014 - 2015, Met Office
+# (C) British Crown Copyright 2014 - 2018, Met Office
 #
 # This file is part of Iris.
 #
@@ -23,9 +23,14 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 # importing anything else
 import iris.tests as tests
 
+import dask
+import dask.array as da
+import dask.array.optimization
 import numpy as np
 import numpy.ma as ma
 
+from iris._lazy_data import as_lazy_data
+from iris.tests import mock
 from iris.util import array_equal
 
 
@@ -116,5 +121,78 @@ class Test(tests.IrisTest):
         self.assertFalse(array_equal(array_a, 'foobar.'))
 
 
+class Test__lazy(tests.IrisTest):
+    def setUp(self):
+        self.data = np.arange(24).reshape(4, 6)
+        self.computed = []
+
+    def _lazy(self, data, chunks):
+        # Return a lazy array which records each of its chunks as computed.
+        def record(block, block_info=None):
+            self.computed.append(block_info[0]['chunk-location'])
+            return block
+
+        return da.map_blocks(record, as_lazy_data(data, chunks=chunks),
+                             dtype=data.dtype)
+
+    def test_equal(self):
+        array_a = self._lazy(self.data, chunks=(2, 3))
+        array_b = as_lazy_data(self.data.copy(), chunks=(4, 2))
+        self.assertTrue(array_equal(array_a, array_b))
+        self.assertTrue(array_equal(array_a, self.data))
+        self.assertTrue(array_equal(self.data, array_a))
+
+    def test_different(self):
+        data = self.data.copy()
+        data[3, 5] = 100
+        array_a = as_lazy_data(self.data, chunks=(2, 3))
+        self.assertFalse(array_equal(array_a, data))
+        self.assertFalse(array_equal(array_a, as_lazy_data(data)))
+
+    def test_different_shape(self):
+        array_a = self._lazy(self.data, chunks=(2, 3))
+        self.assertFalse(array_equal(array_a, self.data[:2]))
+        self.assertEqual(self.computed, [])
+
+    def test_single_pass(self):
+        # Each chunk is computed once, even when all the chunks share some
+        # of the work.
+        array_a = self._lazy(self.data, chunks=(2, 3))
+        anomaly = self.data - self.data.mean(axis=0)
+        self.assertTrue(array_equal(array_a - array_a.mean(axis=0), anomaly))
+        self.assertEqual(sorted(self.computed),
+                         [(0, 0), (0, 1), (1, 0), (1, 1)])
+
+    def test_stops_at_first_difference(self):
+        # The chunks after the first batch which differs are not computed.
+        data = self.data.copy()
+        data[0, 0] = 100
+        array_a = self._lazy(self.data, chunks=(2, 3))
+        with mock.patch('iris.util._ALL_ELEMENTS_BATCH_SIZE', 2):
+            self.assertFalse(array_equal(array_a, data))
+        self.assertEqual(sorted(self.computed), [(0, 0), (0, 1)])
+
+    def test_many_chunks(self):
+        # The graph is optimised once for all the batches of chunks, so the
+        # overhead of each batch does not grow with the number of chunks.
+        data = np.zeros((2000, 10))
+        array_a = as_lazy_data(data, chunks=(1, 10))
+        array_b = as_lazy_data(data.copy(), chunks=(1, 10))
+        optimize = mock.Mock(side_effect=dask.array.optimization.optimize)
+        with dask.config.set(array_optimize=optimize):
+            self.assertTrue(array_equal(array_a, array_b))
+        self.assertEqual(optimize.call_count, 1)
+
+    def test_0d(self):
+        array_a = as_lazy_data(np.array(23))
+        self.assertTrue(array_equal(array_a, 23))
+        self.assertFalse(array_equal(array_a, 7))
+
+    def test_masked_is_ignored(self):
+        array_a = as_lazy_data(ma.masked_array([1, 2, 3], mask=[1, 0, 1]))
+        array_b = ma.masked_array([2, 2, 2], mask=[1, 0, 1])
+        self.assertFalse(array_equal(array_a, array_b))
+
+
 if __name__ == '__main__':
     tests.main()
@@ -0,0 +1,65 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Test function :func:`iris.util.as_compatible_shape`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+import numpy.ma as ma
+
+from iris.coords import DimCoord
+from iris.cube import Cube
+from iris.util import as_compatible_shape
+
+
+class Test(tests.IrisTest):
+    def setUp(self):
+        data = ma.masked_array(np.arange(24.).reshape(2, 3, 4),
+                               mask=np.arange(24).reshape(2, 3, 4) % 5 == 0)
+        self.target = Cube(data)
+        for dim, name in enumerate(['time', 'latitude', 'longitude']):
+            points = np.arange(data.shape[dim], dtype=np.float64)
+            self.target.add_dim_coord(DimCoord(points, name), dim)
+        # Slice out the time dimension, and transpose.
+        self.src = self.target[1]
+        self.src.transpose()
+
+    def test_real(self):
+        result = as_compatible_shape(self.src, self.target)
+        self.assertFalse(result.has_lazy_data())
+        self.assertEqual(result.shape, (1, 3, 4))
+        self.assertMaskedArrayEqual(result.data, self.target.data[1:])
+        # The data is a copy.
+        result.data[0, 0, 0] = -1
+        self.assertEqual(self.src.data[0, 0], 12)
+
+    def test_lazy(self):
+        self.src.data = self.src.lazy_data()
+        result = as_compatible_shape(self.src, self.target)
+        self.assertTrue(self.src.has_lazy_data())
+        self.assertTrue(result.has_lazy_data())
+        self.assertEqual(result.shape, (1, 3, 4))
+        self.assertMaskedArrayEqual(result.data, self.target.data[1:])
+
+
+if __name__ == '__main__':
+    tests.main()
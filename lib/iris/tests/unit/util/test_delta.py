@@ -0,0 +1,72 @@
+# (C) British Crown Copyright 2018, Met Office
+#
+# This file is part of Iris.
+#
+# Iris is free software: you can redistribute it and/or modify it under
+# the terms of the GNU Lesser General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Iris is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Iris.  If not, see <http://www.gnu.org/licenses/>.
+"""Test function :func:`iris.util.delta`."""
+
+from __future__ import (absolute_import, division, print_function)
+from six.moves import (filter, input, map, range, zip)  # noqa
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris._lazy_data import as_lazy_data, is_lazy_data
+from iris.util import delta
+
+
+class Test(tests.IrisTest):
+    def test_non_circular(self):
+        result = delta(np.array([-180, -90, 0, 90]), 0)
+        self.assertArrayEqual(result, [90, 90, 90])
+
+    def test_circular(self):
+        result = delta(np.array([-180, -90, 0, 90]), 0, circular=True)
+        self.assertArrayEqual(result, [90, 90, 90, -270])
+
+    def test_circular_modulus(self):
+        result = delta(np.array([-180, -90, 0, 90]), 0, circular=360)
+        self.assertArrayEqual(result, [90, 90, 90, 90])
+
+
+class Test__lazy(tests.IrisTest):
+    def setUp(self):
+        self.array = np.arange(24).reshape(4, 6) ** 2
+
+    def _check(self, array, dimension, circular=False):
+        expected = delta(array, dimension, circular=circular)
+        chunks = (3, 4)[:array.ndim]
+        result = delta(as_lazy_data(array, chunks=chunks), dimension,
+                       circular=circular)
+        self.assertTrue(is_lazy_data(result))
+        self.assertArrayEqual(result.compute(), expected)
+
+    def test_non_circular(self):
+        self._check(self.array, 0)
+        self._check(self.array, 1)
+
+    def test_circular(self):
+        self._check(self.array, 0, circular=True)
+        self._check(self.array, 1, circular=True)
+
+    def test_circular_modulus(self):
+        self._check(np.array([90, 180, -90, 0]), 0, circular=360)
+        self._check(np.array([-180, -90, 0, 90]), 0, circular=360)
+
+
+if __name__ == '__main__':
+    tests.main()
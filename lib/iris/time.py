@@ -24,6 +24,8 @@ from six.moves import (filter, input, map, range, zip)  # noqa
 
 import functools
 
+import numpy as np
+
 
 @functools.total_ordering
 class PartialDateTime(object):
@@ -172,3 +174,120 @@ class PartialDateTime(object):
         # exception here instead.
         fmt = 'unable to compare PartialDateTime with {}'
         raise TypeError(fmt.format(type(other)))
+
+
+#: The cumulative number of days before each month, for calendars whose
+#: years all have the same length.
+_FIXED_CALENDAR_MONTH_STARTS = {
+    '360_day': np.arange(0, 360, 30),
+    '365_day': np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30]),
+    '366_day': np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30])}
+_FIXED_CALENDAR_MONTH_STARTS['noleap'] = \
+    _FIXED_CALENDAR_MONTH_STARTS['365_day']
+_FIXED_CALENDAR_MONTH_STARTS['all_leap'] = \
+    _FIXED_CALENDAR_MONTH_STARTS['366_day']
+_FIXED_CALENDAR_YEAR_LENGTHS = {'360_day': 360, '365_day': 365,
+                                'noleap': 365, '366_day': 366,
+                                'all_leap': 366}
+
+#: The first day of the Gregorian part of the mixed Julian/Gregorian
+#: calendar, as a number of days since 1970-01-01.
+_GREGORIAN_START_DAY = -141427
+
+_MICROSECONDS_PER_DAY = 86400 * 10 ** 6
+
+
+def _day_number(year, month, day, calendar):
+    # The number of days since 1970-01-01 (for real-world calendars) or
+    # since 0000-01-01 (for fixed length calendars).
+    if calendar in _FIXED_CALENDAR_YEAR_LENGTHS:
+        month_starts = _FIXED_CALENDAR_MONTH_STARTS[calendar]
+        result = (year * _FIXED_CALENDAR_YEAR_LENGTHS[calendar] +
+                  month_starts[month - 1] + day - 1)
+    else:
+        months = np.datetime64((year - 1970) * 12 + month - 1, 'M')
+        result = months.astype('M8[D]').astype(np.int64) + day - 1
+    return result
+
+
+def _calendar_fields(points, units):
+    """
+    Calculate the calendar fields of the date-times represented by an array
+    of time reference values, without creating any date-time objects.
+
+    As with :meth:`cf_units.Unit.num2date`, the date-times are rounded to
+    the nearest second.
+
+    Args:
+
+    * points (array):
+        Time values, relative to the origin of `units`.
+    * units (:class:`cf_units.Unit`):
+        A time reference unit.
+
+    Returns:
+        A dictionary mapping each of 'year', 'month', 'day', 'hour',
+        'minute', 'second', 'microsecond', 'dayofyr' and 'dayofwk' to an
+        integer array of the same shape as `points`, or None if the calendar
+        or the units are not supported, in which case the date-times must be
+        calculated with `units.num2date`.
+
+    """
+    calendar = units.calendar
+    points = np.asarray(points)
+    if (calendar not in _FIXED_CALENDAR_YEAR_LENGTHS and
+            calendar not in ('standard', 'gregorian',
+                             'proleptic_gregorian')):
+        return None
+    if (units.is_long_time_interval() or points.dtype.kind not in 'iuf' or
+            not np.all(np.isfinite(points))):
+        return None
+
+    # Express the points as microseconds since the start of the calendar.
+    # The date-times from `units.num2date` are rounded to the nearest
+    # second, so check that the step is a whole number of seconds.
+    origin = units.num2date(0)
+    step = units.num2date(1) - origin
+    if not step or units.num2date(1000) - origin != 1000 * step:
+        return None
+    step = (step.days * 86400 + step.seconds) * 10 ** 6
+    origin_day = _day_number(origin.year, origin.month, origin.day,
+                             calendar)
+    origin_microseconds = (origin_day * _MICROSECONDS_PER_DAY +
+                           ((origin.hour * 60 + origin.minute) * 60 +
+                            origin.second) * 10 ** 6 + origin.microsecond)
+    microseconds = (np.round(points * float(step)).astype(np.int64) +
+                    origin_microseconds)
+    # Round to the nearest second, as `units.num2date` does.
+    microseconds = (microseconds + 500000) // 10 ** 6 * 10 ** 6
+    days, microseconds = np.divmod(microseconds, _MICROSECONDS_PER_DAY)
+
+    if calendar in _FIXED_CALENDAR_YEAR_LENGTHS:
+        year, day_of_year = np.divmod(days,
+                                      _FIXED_CALENDAR_YEAR_LENGTHS[calendar])
+        month_starts = _FIXED_CALENDAR_MONTH_STARTS[calendar]
+        month = np.searchsorted(month_starts, day_of_year, side='right')
+        day = day_of_year - month_starts[month - 1] + 1
+        day_of_year += 1
+    else:
+        if (calendar != 'proleptic_gregorian' and
+                (origin_day < _GREGORIAN_START_DAY or
+                 days.size and days.min() < _GREGORIAN_START_DAY)):
+            # The mixed calendar differs from numpy's proleptic Gregorian
+            # calendar before the Gregorian reform.
+            return None
+        dates = days.astype('M8[D]')
+        months = dates.astype('M8[M]')
+        year = months.astype('M8[Y]').astype(np.int64) + 1970
+        month = months.astype(np.int64) % 12 + 1
+        day = (dates - months).astype(np.int64) + 1
+        day_of_year = (dates - months.astype('M8[Y]')).astype(np.int64) + 1
+        # 1970-01-01 was a Thursday.
+        days = days + 3
+
+    seconds, microsecond = np.divmod(microseconds, 10 ** 6)
+    minutes, second = np.divmod(seconds, 60)
+    hour, minute = np.divmod(minutes, 60)
+    return {'year': year, 'month': month, 'day': day, 'hour': hour,
+            'minute': minute, 'second': second, 'microsecond': microsecond,
+            'dayofyr': day_of_year, 'dayofwk': days % 7}
@@ -35,10 +35,14 @@ import sys
 import tempfile
 
 import cf_units
+import dask
+import dask.array as da
+from dask.array.core import unify_chunks
 import numpy as np
 import numpy.ma as ma
 
 import iris
+from iris._lazy_data import as_lazy_data, is_lazy_data
 import iris.coords
 import iris.exceptions
 import iris.cube
@@ -122,7 +126,8 @@ def delta(ndarray, dimension, circular=False):
     Args:
 
     * ndarray:
-        The array over which to do the difference.
+        The array over which to do the difference.  If this is a lazy
+        array, the result is also lazy.
 
     * dimension:
         The dimension over which to do the difference on ndarray.
@@ -156,6 +161,9 @@ def delta(ndarray, dimension, circular=False):
             array([90, 90, 90, 90])
 
     """
+    if is_lazy_data(ndarray):
+        return _lazy_delta(ndarray, dimension, circular)
+
     if circular is not False:
         _delta = np.roll(ndarray, -1, axis=dimension)
         last_element = [slice(None, None)] * ndarray.ndim
@@ -173,6 +181,29 @@ def delta(ndarray, dimension, circular=False):
     return _delta
 
 
+def _lazy_delta(lazy_array, dimension, circular=False):
+    # The equivalent of delta for a lazy array.
+    if circular is not False:
+        following = da.roll(lazy_array, -1, axis=dimension)
+        if not isinstance(circular, bool):
+            # Adjust the last element by the modulus, as in delta.
+            last_element = [slice(None)] * lazy_array.ndim
+            last_element[dimension] = slice(-1, None)
+            last_element = tuple(last_element)
+            other_elements = list(last_element)
+            other_elements[dimension] = slice(None, -1)
+            last = following[last_element]
+            last = last + da.where(lazy_array[last_element] >= last,
+                                   circular, -circular)
+            following = da.concatenate(
+                [following[tuple(other_elements)], last], axis=dimension)
+        _delta = following - lazy_array
+    else:
+        _delta = da.diff(lazy_array, axis=dimension)
+
+    return _delta
+
+
 def describe_diff(cube_a, cube_b, output_file=None):
     """
     Prints the differences that prevent compatibility between two cubes, as
@@ -331,29 +362,124 @@ def rolling_window(a, window=1, step=1, axis=-1):
     return rw
 
 
+#: The number of chunks of lazy arrays compared together by
+#: :func:`_all_elements`, before checking whether they all match.
+_ALL_ELEMENTS_BATCH_SIZE = 16
+
+
+def _all_elements(func, array1, array2):
+    """
+    Returns whether `func` is true for all the corresponding elements of two
+    arrays of the same shape, ignoring any elements for which it is masked.
+
+    If either array is lazy, the arrays are compared chunk by chunk, in
+    batches of chunks computed together, so that only a few chunks of each
+    are realised at a time, any work shared between the chunks of a batch
+    is only done once, and the comparison stops at the first batch which
+    differs.
+
+    """
+    def all_true(result):
+        return bool(np.all(ma.filled(result, True)))
+
+    if not (is_lazy_data(array1) or is_lazy_data(array2)):
+        return all_true(func(np.asanyarray(array1), np.asanyarray(array2)))
+
+    if not is_lazy_data(array1):
+        array1 = as_lazy_data(np.asanyarray(array1), chunks=array2.chunks)
+    elif not is_lazy_data(array2):
+        array2 = as_lazy_data(np.asanyarray(array2), chunks=array1.chunks)
+    index = tuple(range(array1.ndim))
+    _, (array1, array2) = unify_chunks(array1, index, array2, index)
+
+    def block_all_true(block1, block2):
+        # Reduce each pair of blocks to a single value.
+        return np.full((1,) * block1.ndim, all_true(func(block1, block2)))
+
+    chunks = tuple((1,) * size for size in array1.numblocks)
+    result = da.map_blocks(block_all_true, array1, array2, chunks=chunks,
+                           dtype=bool)
+    if not result.ndim:
+        # Note that the blocks of a 0-d array cannot be indexed.
+        return bool(result.compute())
+
+    # Optimise the graph once, rather than again for each batch.
+    blocks = result.to_delayed(optimize_graph=True).ravel()
+    for start in range(0, blocks.size, _ALL_ELEMENTS_BATCH_SIZE):
+        batch = blocks[start:start + _ALL_ELEMENTS_BATCH_SIZE]
+        if not all(np.all(block) for block in dask.compute(*batch)):
+            return False
+    return True
+
+
 def array_equal(array1, array2):
     """
     Returns whether two arrays have the same shape and elements.
 
     This provides the same functionality as :func:`numpy.array_equal` but with
-    additional support for arrays of strings.
+    additional support for arrays of strings, and for lazy arrays, which are
+    compared chunk by chunk.
 
     """
-    array1, array2 = np.asarray(array1), np.asarray(array2)
+    def equal(block1, block2):
+        return np.asarray(block1) == np.asarray(block2)
+
+    if not is_lazy_data(array1):
+        array1 = np.asarray(array1)
+    if not is_lazy_data(array2):
+        array2 = np.asarray(array2)
     if array1.shape != array2.shape:
         eq = False
     else:
-        eq = bool(np.asarray(array1 == array2).all())
+        eq = _all_elements(equal, array1, array2)
 
     return eq
 
 
+def _approx_equal_elements(a, b, max_absolute_error, max_relative_error):
+    # Returns whether the elements of two arrays are almost equal.
+    if a.dtype.kind not in 'biufc' or b.dtype.kind not in 'biufc':
+        return a == b
+    if a.dtype.kind in 'biu' and b.dtype.kind in 'biu':
+        # Integers are compared exactly, as they may not all be exactly
+        # representable as floats.
+        return a == b
+    if a.dtype.kind in 'biu':
+        a = a.astype(np.float64)
+    if b.dtype.kind in 'biu':
+        b = b.astype(np.float64)
+    diff = np.abs(a - b)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_error = diff / np.maximum(np.abs(a), np.abs(b))
+    return np.logical_or(diff < max_absolute_error,
+                         relative_error < max_relative_error)
+
+
 def approx_equal(a, b, max_absolute_error=1e-10, max_relative_error=1e-10):
     """
     Returns whether two numbers are almost equal, allowing for the
     finite precision of floating point numbers.
 
+    The numbers may also be arrays, which are almost equal if they have the
+    same shape and all their elements are almost equal, ignoring any masked
+    elements.  Arrays of integers are compared exactly.  Lazy arrays are
+    compared chunk by chunk.
+
     """
+    if not (np.isscalar(a) and np.isscalar(b)):
+        if not is_lazy_data(a):
+            a = np.asanyarray(a)
+        if not is_lazy_data(b):
+            b = np.asanyarray(b)
+        if a.shape != b.shape:
+            return False
+
+        def approx_equal_elements(block1, block2):
+            return _approx_equal_elements(block1, block2, max_absolute_error,
+                                          max_relative_error)
+
+        return _all_elements(approx_equal_elements, a, b)
+
     # Deal with numbers close to zero
     if abs(a - b) < max_absolute_error:
         return True
@@ -397,14 +523,35 @@ def between(lh, rh, lh_inclusive=True, rh_inclusive=True):
            print(i, between_3_and_6(i))
 
     """
-    if lh_inclusive and rh_inclusive:
-        return lambda c: lh <= c <= rh
-    elif lh_inclusive and not rh_inclusive:
-        return lambda c: lh <= c < rh
-    elif not lh_inclusive and rh_inclusive:
-        return lambda c: lh < c <= rh
-    else:
-        return lambda c: lh < c < rh
+    return _Between(lh, rh, lh_inclusive, rh_inclusive)
+
+
+class _Between(object):
+    """
+    The callable returned by :func:`between`, which records its limits so
+    that constraints can recognise and vectorise it.
+
+    """
+    def __init__(self, lh, rh, lh_inclusive=True, rh_inclusive=True):
+        self.lh = lh
+        self.rh = rh
+        self.lh_inclusive = lh_inclusive
+        self.rh_inclusive = rh_inclusive
+
+    def __repr__(self):
+        return 'between({!r}, {!r}, lh_inclusive={}, rh_inclusive={})'.format(
+            self.lh, self.rh, self.lh_inclusive, self.rh_inclusive)
+
+    def __call__(self, c):
+        lh, rh = self.lh, self.rh
+        if self.lh_inclusive and self.rh_inclusive:
+            return lh <= c <= rh
+        elif self.lh_inclusive and not self.rh_inclusive:
+            return lh <= c < rh
+        elif not self.lh_inclusive and self.rh_inclusive:
+            return lh < c <= rh
+        else:
+            return lh < c < rh
 
 
 def reverse(cube_or_array, coords_or_dims):
@@ -768,6 +915,46 @@ def _wrap_function_for_method(function, docstring=None):
     return wrapper
 
 
+class _LRUCache(object):
+    """
+    A cache of the most recently used items, holding at most `maxsize`
+    items, which discards the least recently used item when it is full.
+
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._items = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def get(self, key, default=None):
+        """
+        Return the cached item for a key, marking it as the most recently
+        used, or `default` if there is no such item.
+
+        """
+        try:
+            value = self._items.pop(key)
+        except KeyError:
+            value = default
+        else:
+            self._items[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self._items.pop(key, None)
+        self._items[key] = value
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
 class _MetaOrderedHashable(abc.ABCMeta):
     """
     A metaclass that ensures that non-abstract subclasses of _OrderedHashable
@@ -1079,7 +1266,8 @@ def as_compatible_shape(src_cube, target_cube):
     cubes must have coordinates with the same metadata
     (see :class:`iris.coords.CoordDefn`).
 
-    .. note:: This function will load and copy the data payload of `src_cube`.
+    .. note:: This function will copy the data payload of `src_cube`, unless
+        it is lazy, in which case the result also has lazy data.
 
     Args:
 
@@ -1120,14 +1308,18 @@ def as_compatible_shape(src_cube, target_cube):
         if dim_to is not None:
             new_shape[dim_from] = src_cube.shape[dim_to]
 
-    new_data = src_cube.data.copy()
+    new_data = src_cube.core_data()
+    if not is_lazy_data(new_data):
+        new_data = new_data.copy()
 
     # Transpose the data (if necessary) to prevent assignment of
     # new_shape doing anything except adding length one dims.
     order = [v for k, v in sorted(dim_mapping.items()) if v is not None]
     if order != sorted(order):
         new_order = [order.index(i) for i in range(len(order))]
-        new_data = np.transpose(new_data, new_order).copy()
+        new_data = new_data.transpose(new_order)
+        if not is_lazy_data(new_data):
+            new_data = new_data.copy()
 
     new_cube = iris.cube.Cube(new_data.reshape(new_shape))
     new_cube.metadata = copy.deepcopy(src_cube.metadata)